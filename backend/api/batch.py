@@ -0,0 +1,41 @@
+import asyncio
+from fastapi import APIRouter, HTTPException
+from models import BatchQuery, BatchRequest
+from api import events, facts, jokes, quiz, quotes
+from api.about import ABOUT_INFO
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+REPOSITORIES = {
+    "events": events.repository,
+    "facts": facts.repository,
+    "jokes": jokes.repository,
+    "quiz": quiz.repository,
+    "quotes": quotes.repository
+}
+
+async def run_query(name: str, query: BatchQuery):
+    if name == "about":
+        return ABOUT_INFO
+    filters = None
+    if name == "events" and (query.upcoming or query.days):
+        filters = events.upcoming_query(query.days)
+    if query.sample:
+        return await REPOSITORIES[name].sample(query.sample, filters, fields=query.fields)
+    return await REPOSITORIES[name].list(filters, fields=query.fields, skip=query.skip, limit=query.limit)
+
+@router.post("/", response_model=dict)
+async def batch(request: BatchRequest):
+    """
+    Run several read queries concurrently and return all results in one response,
+    e.g. {"resources": {"facts": {}, "events": {"upcoming": true, "limit": 10}, "about": {}}}.
+    {"sample": n} returns n random documents instead of a page, {"days": n} limits events
+    to those starting within the next n days.
+    """
+    unknown = set(request.resources) - set(REPOSITORIES) - {"about"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown resources: {', '.join(sorted(unknown))}")
+
+    names = list(request.resources)
+    results = await asyncio.gather(*(run_query(name, request.resources[name]) for name in names))
+    return dict(zip(names, results))
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+from database.journal import journal
+from api.crud import parse_fields
+from typing import Optional
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+@router.get("/", response_model=dict)
+async def list_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    collections: Optional[str] = None
+):
+    """
+    Journaled writes after sequence number `since`, oldest first. Resume from the returned
+    `last_seq`; keep polling while it is below `head`. `collections` ("events,quizzes")
+    filters by collection. `reset: true` means the requested range already expired and the
+    consumer should reload everything before following the feed again.
+    """
+    return await journal.feed(since, limit, parse_fields(collections))
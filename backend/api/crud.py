@@ -0,0 +1,82 @@
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from typing import List, Optional, Type
+from database.repository import Repository
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Turn "a,b" into a projection field list."""
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(",") if f.strip()]
+
+def add_crud_routes(
+    router: APIRouter,
+    repository: Repository,
+    model: Type[BaseModel],
+    update_model: Type[BaseModel],
+    item_name: str,
+    key_field: str = "_id",
+    include_list: bool = True
+):
+    """
+    Register the standard list/get/create/bulk/update/delete routes for `repository`.
+    PUT and DELETE accept an id, or the value of `key_field` when it isn't "_id" (e.g. "title").
+    """
+
+    if include_list:
+        @router.get("/", response_model=List[dict])
+        async def list_items(
+            skip: int = Query(0, ge=0),
+            limit: int = Query(0, ge=0, le=500),
+            fields: Optional[str] = None
+        ):
+            return await repository.list(fields=parse_fields(fields), skip=skip, limit=limit)
+
+    @router.get("/{item_id}", response_model=dict)
+    async def get_item(item_id: str, fields: Optional[str] = None):
+        doc = await repository.get(item_id, fields=parse_fields(fields))
+        if not doc:
+            raise HTTPException(status_code=404, detail=f"{item_name} not found")
+        return doc
+
+    @router.post("/", response_model=dict)
+    async def create_item(item: model):
+        return await repository.create(item.dict())
+
+    @router.post("/bulk", response_model=dict)
+    async def create_items(items: List[model]):
+        ids = await repository.create_many([item.dict() for item in items])
+        return {"inserted": len(ids), "ids": ids}
+
+    @router.put("/{item_key}", response_model=dict)
+    async def update_item(item_key: str, update_data: update_model):
+        changes = update_data.dict(exclude_unset=True)
+        if not changes:
+            raise HTTPException(status_code=400, detail="No fields provided to update")
+        query = repository.key_query(item_key, key_field)
+        doc = await repository.update(query, changes) if query else None
+        if not doc:
+            raise HTTPException(status_code=404, detail=f"{item_name} not found")
+        return doc
+
+    @router.delete("/{item_key}", response_model=dict)
+    async def delete_item(item_key: str):
+        query = repository.key_query(item_key, key_field)
+        doc = await repository.delete(query) if query else None
+        if not doc:
+            raise HTTPException(status_code=404, detail=f"{item_name} not found")
+        return {"detail": f"{item_name} deleted", "id": doc["id"]}
+
+    return router
+
+def build_crud_router(
+    repository: Repository,
+    model: Type[BaseModel],
+    update_model: Type[BaseModel],
+    item_name: str,
+    prefix: str,
+    tags: List[str]
+) -> APIRouter:
+    """Create a router exposing the standard CRUD routes for one content type."""
+    router = APIRouter(prefix=prefix, tags=tags)
+    return add_crud_routes(router, repository, model, update_model, item_name)
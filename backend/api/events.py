@@ -1,48 +1,46 @@
-from fastapi import APIRouter, HTTPException
-from models import Event
-from database.mongo_config import events_collection
-from typing import List
-from bson import ObjectId
+from fastapi import APIRouter, Query
+from models import DATE_FORMAT, Event, EventUpdate
+from database.mongo_config import EVENTS
+from database.repository import Repository
+from database.cache import cache
+from database.journal import journal
+from database.outbox import outbox
+from api.crud import add_crud_routes, parse_fields
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone
 
+repository = Repository(EVENTS, default_sort="date", cache=cache)
+# Journal entries and announcements are written in the same transaction as the event change
+repository.add_write_hook(journal.hook(EVENTS))
+repository.add_write_hook(outbox.hook(EVENTS))
 router = APIRouter(prefix="/events", tags=["events"])
 
-def serialize_event(event: dict) -> dict:
-    """Convert MongoDB document to JSON-friendly dict."""
-    event["id"] = str(event["_id"])
-    del event["_id"]
-    return event
+def upcoming_query(days: Optional[int] = None) -> dict:
+    """
+    Filter for events that haven't started yet, optionally only those within the next `days`
+    (dates are stored in one UTC format, see models.normalize_date, so they compare lexically).
+    """
+    # Whole minutes, so the query (and its cache key) stays the same for a minute
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    date_range = {"$gte": now.strftime(DATE_FORMAT)}
+    if days:
+        date_range["$lt"] = (now + timedelta(days=days)).strftime(DATE_FORMAT)
+    return {"date": date_range}
 
 @router.get("/", response_model=List[dict])
-async def list_events():
-    cursor = events_collection.find({})
-    return [serialize_event(doc) async for doc in cursor]
+async def list_events(
+    upcoming: bool = False,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(0, ge=0, le=100),
+    fields: Optional[str] = None
+):
+    """
+    List events sorted by date. `upcoming` drops events whose date is already past,
+    `skip`/`limit` page through the result (limit=0 returns everything).
+    Dates are stored as ISO strings, so lexical order is chronological order.
+    """
+    query = upcoming_query() if upcoming else {}
+    return await repository.list(query, fields=parse_fields(fields), skip=skip, limit=limit)
 
-@router.get("/{event_id}", response_model=dict)
-async def get_event(event_id: str):
-    doc = await events_collection.find_one({"_id": ObjectId(event_id)})
-    if not doc:
-        raise HTTPException(status_code=404, detail="Event not found")
-    return serialize_event(doc)
-
-@router.post("/", response_model=dict)
-async def create_event(event: Event):
-    result = await events_collection.insert_one(event.dict())
-    return {**event.dict(), "id": str(result.inserted_id)}
-
-@router.put("/{event_title}", response_model=dict)
-async def update_event(event_title: str, update_data: dict):
-    result = await events_collection.update_one(
-        {"title": event_title}, {"$set": update_data}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-    
-    updated_doc = await events_collection.find_one({"title": event_title})
-    return serialize_event(updated_doc)
-
-@router.delete("/{event_title}", response_model=dict)
-async def delete_event(event_title: str):
-    result = await events_collection.delete_one({"title": event_title})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Event not found")
-    return {"detail": "Event deleted"}
+# Events are updated and deleted by id or by title
+add_crud_routes(router, repository, Event, EventUpdate, "Event", key_field="title", include_list=False)
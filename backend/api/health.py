@@ -0,0 +1,31 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from database.mongo_config import MongoDB
+from database.pool_metrics import pool_metrics
+from database.cache import cache
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+@router.get("/live", response_model=dict)
+async def liveness():
+    """The process is up and serving requests."""
+    return {"status": "ok"}
+
+@router.get("/ready", response_model=dict)
+async def readiness():
+    """Ready only when MongoDB answers a ping."""
+    try:
+        await MongoDB.ping()
+    except Exception as exc:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "detail": str(exc)})
+    return {"status": "ready"}
+
+@router.get("/pool", response_model=dict)
+async def pool_stats():
+    """Connection pool counters for this worker (checkouts, wait times, failures)."""
+    return pool_metrics.snapshot()
+
+@router.get("/cache", response_model=dict)
+async def cache_stats():
+    """Read cache counters for this worker (backend, hits, misses, errors)."""
+    return cache.stats()
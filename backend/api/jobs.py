@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+from models import JobRun
+from database.mongo_config import JOB_RUNS
+from database.repository import Repository
+from typing import List, Optional
+
+repository = Repository(JOB_RUNS, default_sort="-started_at")
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.post("/runs", response_model=dict)
+async def record_job_run(run: JobRun):
+    """Append one scheduled-job execution to the run history."""
+    doc = await repository.create(run.dict())
+    return {"id": doc["id"]}
+
+@router.get("/runs", response_model=List[dict])
+async def list_job_runs(job_id: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
+    """Most recent job runs first, optionally for a single job."""
+    query = {"job_id": job_id} if job_id else {}
+    return await repository.list(query, limit=limit)
@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from models import LockRequest
+from database import leases
+
+router = APIRouter(prefix="/locks", tags=["locks"])
+
+@router.post("/{lock_name}/acquire", response_model=dict)
+async def acquire_lock(lock_name: str, request: LockRequest):
+    """
+    Acquire or renew a lease-based lock. The lock is granted when it is free,
+    expired, or already held by the same owner; otherwise the current owner is returned.
+    """
+    return await leases.acquire(lock_name, request.owner, request.ttl_seconds)
+
+@router.post("/{lock_name}/release", response_model=dict)
+async def release_lock(lock_name: str, request: LockRequest):
+    return {"released": await leases.release(lock_name, request.owner)}
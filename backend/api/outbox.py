@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException
+from models import OutboxClaim, OutboxAck, OutboxNack
+from database.outbox import outbox
+from typing import List
+
+router = APIRouter(prefix="/outbox", tags=["outbox"])
+
+@router.post("/claim", response_model=List[dict])
+async def claim_messages(request: OutboxClaim):
+    """
+    Lease up to `limit` due messages to `consumer` for `lease_seconds`. Messages that
+    aren't acked before the lease ends are handed out again.
+    """
+    return await outbox.claim(request.consumer, request.limit, request.lease_seconds, request.topics)
+
+@router.post("/ack", response_model=dict)
+async def ack_messages(request: OutboxAck):
+    """Mark messages delivered; they are never handed out again."""
+    return {"acked": await outbox.ack(request.results)}
+
+@router.post("/{message_id}/nack", response_model=dict)
+async def nack_message(message_id: str, request: OutboxNack):
+    """Report a failed delivery: the message is retried after a backoff."""
+    result = await outbox.nack(message_id, request.error)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Message not found or already delivered")
+    return result
+
+@router.get("/stats", response_model=dict)
+async def outbox_stats():
+    """Messages waiting, leased to a consumer, and given up on."""
+    return await outbox.stats()
@@ -1,48 +1,39 @@
-from fastapi import APIRouter, HTTPException
-from bson import ObjectId
-from typing import List
-from models import Quiz
-from database.mongo_config import quiz_collection
+from fastapi import APIRouter, HTTPException, Query
+from models import Quiz, QuizUpdate, QuizAnswer
+from database.mongo_config import QUIZZES
+from database.repository import Repository
+from database.cache import cache
+from database.journal import journal
+from database.quiz_selector import QuizSelector
+from api.crud import add_crud_routes
+from typing import List, Literal, Optional
 
+repository = Repository(QUIZZES, cache=cache)
+repository.add_write_hook(journal.hook(QUIZZES))
+selector = QuizSelector(repository)
 router = APIRouter(prefix="/quiz", tags=["CyberQuiz"])
 
-def serialize_quiz(quiz: dict) -> dict:
-    quiz["id"] = str(quiz["_id"])
-    del quiz["_id"]
-    return quiz
+# Registered before the CRUD routes so "/select" and "/stats" aren't taken for an {item_id}
+@router.get("/select", response_model=List[dict])
+async def select_quizzes(
+    category: Optional[str] = None,
+    difficulty: Optional[Literal["easy", "medium", "hard"]] = None,
+    count: int = Query(1, ge=1, le=10)
+):
+    """Weighted random quizzes: questions players miss more often are picked more often."""
+    return await selector.select(category, difficulty, count)
 
-@router.get("/", response_model=List[dict])
-async def list_quizzes():
-    cursor = quiz_collection.find({})
-    return [serialize_quiz(doc) async for doc in cursor]
+@router.get("/stats", response_model=List[dict])
+async def quiz_stats():
+    """Quiz count and answer rate per category and difficulty."""
+    return await selector.stats()
 
-@router.get("/{quiz_id}", response_model=dict)
-async def get_quiz(quiz_id: str):
-    doc = await quiz_collection.find_one({"_id": ObjectId(quiz_id)})
-    if not doc:
+@router.post("/{quiz_id}/answer", response_model=dict)
+async def record_answer(quiz_id: str, answer: QuizAnswer):
+    """Count one answer to a quiz and return its updated statistics."""
+    stats = await selector.record_answer(quiz_id, answer.correct)
+    if stats is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
-    return serialize_quiz(doc)
+    return stats
 
-@router.post("/", response_model=dict)
-async def create_quiz(quiz: Quiz):
-    result = await quiz_collection.insert_one(quiz.dict())
-    if not result.inserted_id:
-        raise HTTPException(status_code=500, detail="Failed to create quiz")
-    return {"id": str(result.inserted_id), "message": "Quiz added successfully!"}
-
-@router.put("/{quiz_id}", response_model=dict)
-async def update_quiz(quiz_id: str, update_data: dict):
-    result = await quiz_collection.update_one(
-        {"_id": ObjectId(quiz_id)}, {"$set": update_data}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-    updated_doc = await quiz_collection.find_one({"_id": ObjectId(quiz_id)})
-    return serialize_quiz(updated_doc)
-
-@router.delete("/{quiz_id}", response_model=dict)
-async def delete_quiz(quiz_id: str):
-    result = await quiz_collection.delete_one({"_id": ObjectId(quiz_id)})
-    if result.deleted_count == 0:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-    return {"detail": "Quiz deleted successfully"}
+add_crud_routes(router, repository, Quiz, QuizUpdate, "Quiz")
@@ -0,0 +1,39 @@
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter
+from pymongo import ReturnDocument
+from models import RateLimitHit, RateLimitRequest
+from database.mongo_config import get_collection, RATE_LIMITS
+
+router = APIRouter(prefix="/ratelimit", tags=["ratelimit"])
+
+async def hit(limit: RateLimitHit) -> float:
+    """Count one hit in the current fixed window; returns the seconds to wait if over the limit."""
+    now = time.time()
+    window_start = math.floor(now / limit.window) * limit.window
+    window_end = window_start + limit.window
+    doc = await get_collection(RATE_LIMITS).find_one_and_update(
+        {"_id": f"{limit.key}:{window_start:.0f}"},
+        {
+            "$inc": {"count": 1},
+            # The TTL index removes each window shortly after it closes
+            "$setOnInsert": {"expires_at": datetime.fromtimestamp(window_end, timezone.utc) + timedelta(seconds=60)}
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return window_end - now if doc["count"] > limit.limit else 0.0
+
+@router.post("/consume", response_model=dict)
+async def consume(request: RateLimitRequest):
+    """
+    Shared limits for every bot shard/process: one fixed-window counter per key in MongoDB.
+    The call is allowed only if none of the limits is exceeded; `exceeded` lists the keys
+    over their limit with the seconds until their window ends.
+    """
+    waits = await asyncio.gather(*(hit(limit) for limit in request.limits))
+    retry_after = max(waits, default=0.0)
+    exceeded = {limit.key: round(wait, 3) for limit, wait in zip(request.limits, waits) if wait}
+    return {"allowed": retry_after == 0, "retry_after": round(retry_after, 3), "exceeded": exceeded}
@@ -0,0 +1,99 @@
+import asyncio
+from fastapi import APIRouter, HTTPException, Query
+from database import snapshots
+from database.leases import Lease
+from database.snapshots import SnapshotError
+from api.crud import parse_fields
+from typing import List, Optional, Set
+
+router = APIRouter(prefix="/snapshots", tags=["snapshots"])
+
+# Snapshots and restores running in this worker; the request returns as soon as one starts
+_running: Set[asyncio.Task] = set()
+
+def _done(task: asyncio.Task):
+    _running.discard(task)
+    # Failures are recorded in the snapshot's status.json; don't warn about unretrieved exceptions
+    task.cancelled() or task.exception()
+
+async def _start(coro) -> None:
+    """Run `coro` in the background under the snapshots lease, shared by every worker and the CLI."""
+    lease = Lease(snapshots.LOCK_NAME, snapshots.LOCK_TTL_SECONDS)
+    holder = await lease.acquire()
+    if holder is not None:
+        coro.close()
+        raise HTTPException(status_code=409, detail=f"A snapshot or restore is already running ({holder})")
+    task = asyncio.create_task(lease.hold(coro))
+    _running.add(task)
+    task.add_done_callback(_done)
+
+def _check_id(snapshot_id: str):
+    try:
+        snapshots.snapshot_path(snapshot_id)
+    except SnapshotError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.post("/", response_model=dict, status_code=202)
+async def create_snapshot(collections: Optional[str] = None):
+    """
+    Start dumping the content collections (or `collections`, e.g. "events,quizzes") in the
+    background. Poll GET /snapshots/{id} until its status is "complete".
+    """
+    names = parse_fields(collections) or list(snapshots.COLLECTIONS)
+    unknown = set(names) - set(snapshots.COLLECTIONS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown collections: {', '.join(sorted(unknown))}")
+    snapshot_id = snapshots.new_snapshot_id()
+    if snapshots.snapshot_path(snapshot_id).exists():
+        raise HTTPException(status_code=409, detail=f"Snapshot {snapshot_id} already exists")
+    await _start(snapshots.create_snapshot(snapshot_id, tuple(names)))
+    return {"id": snapshot_id, "status": "running"}
+
+@router.get("/", response_model=List[dict])
+async def list_snapshots():
+    """Every snapshot with its status, newest first."""
+    return await asyncio.to_thread(snapshots.list_snapshots)
+
+@router.get("/{snapshot_id}", response_model=dict)
+async def get_snapshot(snapshot_id: str):
+    """Status of a snapshot (and of its last restore), with its manifest once complete."""
+    _check_id(snapshot_id)
+    status = await asyncio.to_thread(snapshots.read_status, snapshot_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    manifest = await asyncio.to_thread(snapshots.read_manifest, snapshot_id)
+    return {**status, "manifest": manifest}
+
+@router.post("/{snapshot_id}/restore", response_model=dict, status_code=202)
+async def restore_snapshot(
+    snapshot_id: str,
+    collections: Optional[str] = None,
+    drop: bool = False,
+    confirm: Optional[str] = None,
+    until_seq: Optional[int] = Query(None, ge=0)
+):
+    """
+    Start restoring a snapshot in the background. Existing documents are kept unless
+    `drop=true`, which empties the collections first and must be confirmed with
+    `confirm=<snapshot id>`. `until_seq` then replays the change journal up to that sequence number.
+    """
+    _check_id(snapshot_id)
+    if drop and confirm != snapshot_id:
+        raise HTTPException(status_code=400, detail="drop=true empties the collections: pass confirm=<snapshot id>")
+    manifest = await asyncio.to_thread(snapshots.read_manifest, snapshot_id)
+    if manifest is None:
+        raise HTTPException(status_code=404, detail="Snapshot not found or incomplete")
+    names = parse_fields(collections)
+    unknown = set(names or ()) - set(manifest["collections"])
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Not in this snapshot: {', '.join(sorted(unknown))}")
+    await _start(snapshots.restore_snapshot(snapshot_id, names, drop, until_seq))
+    return {"id": snapshot_id, "restore": "running"}
+
+@router.delete("/{snapshot_id}", response_model=dict)
+async def delete_snapshot(snapshot_id: str):
+    _check_id(snapshot_id)
+    if not snapshots.snapshot_path(snapshot_id).exists():
+        raise HTTPException(status_code=404, detail="Snapshot not found")
+    await asyncio.to_thread(snapshots.delete_snapshot, snapshot_id)
+    return {"detail": "Snapshot deleted", "id": snapshot_id}
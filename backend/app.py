@@ -1,12 +1,37 @@
-from fastapi import FastAPI
+import os
+import time
+import uuid
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from api import events, facts, jokes, quiz, about, quotes # routers for events, facts, jokes, quiz, about and quotes
+from database.mongo_config import MongoDB
+from database.settings import get_settings
+from database.cache import cache
+from logging_setup import setup_logging, bind, unbind
+from middleware import RateLimitMiddleware, parse_limit, parse_trusted_proxies
+from api import events, facts, jokes, quiz, about, quotes, locks, jobs, health, batch, ratelimit, changes, snapshots, outbox # routers for events, facts, jokes, quiz, about, quotes, locks, job runs, health probes, batch reads, shared rate limits, the change feed, backups and the outbox
+
+# === Lifespan === #
+# Runs once per worker process: each worker owns its Motor client and event loop.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The queue listener thread must be started after gunicorn forks the worker
+    setup_logging("backend")
+    # Parsed here rather than at import: a bad value fails the worker's startup with its name
+    get_settings()
+    MongoDB.connect()
+    await MongoDB.warm_up()
+    yield
+    await cache.close()
+    MongoDB.close()
 
 # === FastAPI app instance === #
 app = FastAPI(
     title="CyberBot Backend API",
     description="API for managing club events and cybersecurity facts",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # === Middleware === #
@@ -24,6 +49,40 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Per-client request budget for each worker, e.g. "100/1" = bursts of 100, refilled at 100 requests/second.
+# The bot usually talks from a single address, so keep this well above its normal rate.
+API_RATE_LIMIT = os.getenv("API_RATE_LIMIT", "100/1")
+# Peers whose X-Forwarded-For is believed (the same variable and default as uvicorn and gunicorn)
+FORWARDED_ALLOW_IPS = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+if API_RATE_LIMIT:
+    limit, per = parse_limit(API_RATE_LIMIT)
+    app.add_middleware(
+        RateLimitMiddleware, limit=limit, per=per, trusted_proxies=parse_trusted_proxies(FORWARDED_ALLOW_IPS)
+    )
+
+logger = logging.getLogger("access")
+
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """
+    Tag logs with a request id (reusing the bot's X-Request-ID) and record request duration.
+    X-Actor (who triggered the call, e.g. "discord:<user id>") is recorded in the change journal.
+    """
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    token = bind(request_id=request_id, actor=request.headers.get("X-Actor"))
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        unbind(token)
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    response.headers["X-Request-ID"] = request_id
+    logger.info(
+        "%s %s -> %d", request.method, request.url.path, response.status_code,
+        extra={"request_id": request_id, "duration_ms": duration_ms}
+    )
+    return response
+
 # === Include Routers === #
 app.include_router(events.router, prefix="/events", tags=["Events"])
 app.include_router(facts.router, prefix="/facts", tags=["CyberFacts"])
@@ -31,3 +90,11 @@ app.include_router(jokes.router, prefix="/jokes", tags=["CyberJokes"])
 app.include_router(quiz.router, prefix="/quiz", tags=["CyberQuiz"])
 app.include_router(about.router, prefix="/about", tags=["About-us"])
 app.include_router(quotes.router, prefix="/quotes", tags=["CyberQuotes"])
+app.include_router(locks.router, tags=["Locks"])
+app.include_router(jobs.router, tags=["Jobs"])
+app.include_router(health.router, tags=["Health"])
+app.include_router(batch.router, tags=["Batch"])
+app.include_router(ratelimit.router, tags=["RateLimit"])
+app.include_router(changes.router, tags=["Changes"])
+app.include_router(snapshots.router, tags=["Snapshots"])
+app.include_router(outbox.router, tags=["Outbox"])
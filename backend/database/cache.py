@@ -0,0 +1,247 @@
+"""
+Shared read-through cache for repository reads.
+
+With REDIS_URL set, all workers share one server speaking the Redis protocol (Redis, Valkey,
+KeyDB, Dragonfly...). Without it each process keeps a small in-memory cache, which is
+enough for local runs with a single worker.
+
+Cached keys embed a per-collection version number. A write bumps the version (INCR), which
+invalidates every cached read of that collection for all workers at once without scanning
+keys; the old entries simply expire.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # optional: only needed with REDIS_URL
+    aioredis = None
+
+from database.settings import get_settings
+
+logger = logging.getLogger("cache")
+
+# Stampede protection across workers: one loader per key, the others poll for its result
+LOCK_TTL_MS = 5000
+LOCK_POLL_SECONDS = 0.05
+
+
+class LocalBackend:
+    """In-process LRU with per-entry expiry; the same interface as RedisBackend."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        if key in self._counters:
+            return str(self._counters[key])
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int):
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def acquire(self, key: str, ttl_ms: int) -> bool:
+        # One process: the in-process single flight already serializes loaders
+        return True
+
+    async def release(self, key: str):
+        pass
+
+    async def close(self):
+        self._items.clear()
+
+
+class RedisBackend:
+    def __init__(self, url: str):
+        # Connections are opened on the first command, inside the worker's event loop
+        self.client = aioredis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ttl: int):
+        await self.client.set(key, value, ex=ttl)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(key)
+
+    async def acquire(self, key: str, ttl_ms: int) -> bool:
+        return bool(await self.client.set(key, "1", nx=True, px=ttl_ms))
+
+    async def release(self, key: str):
+        await self.client.delete(key)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class SharedCache:
+    """
+    Read-through cache keyed by (namespace, query). Concurrent misses for the same key
+    are collapsed into one load per worker, and with Redis into one load per deployment.
+    Cache errors never fail a request: the read falls back to MongoDB.
+    Options left unset come from REDIS_URL, CACHE_TTL and CACHE_MAX_ITEMS on first use.
+    """
+
+    def __init__(self, url: Optional[str] = None, ttl: Optional[int] = None, max_items: Optional[int] = None):
+        self.url = url
+        self._ttl = ttl
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._backend = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is None:
+            self._ttl = get_settings().cache_ttl
+        return self._ttl
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            settings = get_settings()
+            self.url = self.url if self.url is not None else settings.redis_url
+            self.max_items = self.max_items or settings.cache_max_items
+            if self.url and aioredis is None:
+                logger.warning("REDIS_URL is set but the redis package is missing; using a per-process cache.")
+            if self.url and aioredis is not None:
+                self._backend = RedisBackend(self.url)
+            else:
+                self._backend = LocalBackend(self.max_items)
+        return self._backend
+
+    @staticmethod
+    def _version_key(namespace: str) -> str:
+        return f"cache:{namespace}:version"
+
+    async def _key(self, namespace: str, parts: Any) -> str:
+        version = await self.backend.get(self._version_key(namespace)) or "0"
+        digest = hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+        return f"cache:{namespace}:{version}:{digest}"
+
+    async def get_or_load(self, namespace: str, parts: Any, loader: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            key = await self._key(namespace, parts)
+            cached = await self.backend.get(key)
+        except Exception as exc:
+            self.errors += 1
+            logger.warning("Cache unavailable, reading from MongoDB: %s", exc)
+            return await loader()
+
+        if cached is not None:
+            self.hits += 1
+            return json.loads(cached)
+        self.misses += 1
+
+        # Single flight within this worker: later callers wait for the first one's result
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        # Nobody may be waiting on it: don't warn about an exception that was never retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await self._load(key, loader)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Only the lock holder queries MongoDB; other workers wait for the value it stores."""
+        lock = f"{key}:lock"
+        try:
+            owner = await self.backend.acquire(lock, LOCK_TTL_MS)
+        except Exception:
+            owner = None
+
+        if owner is False:
+            deadline = time.monotonic() + LOCK_TTL_MS / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+                cached = await self.backend.get(key)
+                if cached is not None:
+                    return json.loads(cached)
+            # The holder is gone or too slow: load it ourselves
+
+        try:
+            value = await loader()
+            try:
+                await self.backend.set(key, json.dumps(value, default=str), self.ttl)
+            except Exception as exc:
+                self.errors += 1
+                logger.warning("Couldn't store %s in the cache: %s", key, exc)
+            return value
+        finally:
+            if owner:
+                try:
+                    await self.backend.release(lock)
+                except Exception:
+                    pass
+
+    async def invalidate(self, namespace: str):
+        """Drop every cached read of `namespace` (for all workers when shared)."""
+        try:
+            await self.backend.incr(self._version_key(namespace))
+        except Exception as exc:
+            self.errors += 1
+            logger.error("Couldn't invalidate cache namespace %s (stale for up to %ds): %s", namespace, self.ttl, exc)
+
+    def listener(self, namespace: str) -> Callable[[str, List[str]], Awaitable[None]]:
+        """A repository change listener invalidating `namespace` on every write."""
+        async def on_change(operation: str, docs: List[dict]):
+            await self.invalidate(namespace)
+        return on_change
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis" if isinstance(self._backend, RedisBackend) else "local",
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None
+        }
+
+    async def close(self):
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
+
+
+# One cache per worker process, shared by every repository
+cache = SharedCache()
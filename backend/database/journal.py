@@ -0,0 +1,134 @@
+"""
+Append-only change journal.
+
+Every write made through a journaled repository is recorded in the `changes` collection by
+a repository write hook, under a global sequence number taken from the `counters`
+collection. On a replica set the entry (and its sequence number) is written in the same
+transaction as the change, so a committed change always has its entry. Without transactions
+the entry is written right after the change, and a failure fails the request instead of
+being swallowed. Consumers (bot caches, exports, backups) sync incrementally with
+GET /changes?since=<last seq applied> instead of re-reading whole collections.
+Entries expire after CHANGES_RETENTION_DAYS (TTL index, see mongo_config.warm_up).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import ReturnDocument
+from database.mongo_config import CHANGES, COUNTERS, get_collection
+from database.repository import WriteHook
+from logging_setup import log_context
+
+logger = logging.getLogger("journal")
+
+# Without transactions, sequence numbers are reserved before the entries are inserted, so a
+# concurrent request can make seq 11 visible before seq 10. The feed waits this long for a
+# missing number before treating it as lost (its insert failed) and moving on.
+GAP_GRACE_SECONDS = 5
+
+
+def _aware(value: datetime) -> datetime:
+    # PyMongo returns naive UTC datetimes unless the client is tz_aware
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class ChangeJournal:
+
+    async def _reserve(self, count: int, session: Optional[AsyncIOMotorClientSession] = None) -> int:
+        """Reserve `count` consecutive sequence numbers in one round trip; returns the last one."""
+        counter = await get_collection(COUNTERS).find_one_and_update(
+            {"_id": CHANGES}, {"$inc": {"seq": count}},
+            upsert=True, return_document=ReturnDocument.AFTER, session=session
+        )
+        return counter["seq"]
+
+    async def head(self) -> int:
+        """The latest sequence number handed out (0 before the first change)."""
+        counter = await get_collection(COUNTERS).find_one({"_id": CHANGES})
+        return counter["seq"] if counter else 0
+
+    async def record(
+        self,
+        collection_name: str,
+        operation: str,
+        docs: List[dict],
+        session: Optional[AsyncIOMotorClientSession] = None
+    ):
+        """
+        Journal a write: one counter update and one batched insert, whatever the number of
+        documents. Pass the write's session so both commit (or abort) with it. Errors are
+        raised: a change the feed never reports would leave its consumers silently stale.
+        """
+        if not docs:
+            return
+        context = log_context.get()
+        try:
+            last = await self._reserve(len(docs), session)
+            first = last - len(docs) + 1
+            now = datetime.now(timezone.utc)
+            entries = [
+                {
+                    "seq": first + i,
+                    "collection": collection_name,
+                    "op": operation,
+                    "doc_id": doc["id"],
+                    "doc": doc,
+                    "actor": context.get("actor"),
+                    "request_id": context.get("request_id"),
+                    "at": now
+                }
+                for i, doc in enumerate(docs)
+            ]
+            await get_collection(CHANGES).insert_many(entries, session=session)
+        except Exception:
+            logger.exception("Couldn't journal %s of %d %s document(s)", operation, len(docs), collection_name)
+            raise
+
+    async def reset(self) -> int:
+        """
+        Make every consumer reload: feed requests from before this point report `reset`.
+        For writes that bypass the journal, e.g. a snapshot restore. Returns the reset position.
+        """
+        seq = await self._reserve(1)
+        await get_collection(COUNTERS).update_one({"_id": CHANGES}, {"$max": {"reset_seq": seq}})
+        logger.warning("Change journal reset at #%d: feed consumers will reload everything", seq)
+        return seq
+
+    def hook(self, collection_name: str) -> WriteHook:
+        """A repository write hook journaling every write to `collection_name` in its transaction."""
+        async def on_write(operation: str, docs: List[dict], session):
+            await self.record(collection_name, operation, docs, session)
+        return on_write
+
+    async def feed(self, since: int, limit: int, collections: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Changes after `since`, in sequence order. `last_seq` is the position to resume from,
+        which may be past the last returned change when a collection filter is applied.
+        `reset` means changes after `since` already expired, or the content was replaced
+        wholesale since then (see `reset`): the consumer must reload everything.
+        """
+        changes_collection = get_collection(CHANGES)
+        counter = await get_collection(COUNTERS).find_one({"_id": CHANGES}) or {}
+        oldest = await changes_collection.find_one({}, {"seq": 1}, sort=[("seq", 1)])
+        reset = bool(since and (
+            (oldest and oldest["seq"] > since + 1) or since < counter.get("reset_seq", 0)
+        ))
+
+        cursor = changes_collection.find({"seq": {"$gt": since}}, {"_id": 0}).sort("seq", 1).limit(limit)
+        now = datetime.now(timezone.utc)
+        changes = []
+        last_seq = since
+        async for entry in cursor:
+            if entry["seq"] != last_seq + 1 and not reset and (now - _aware(entry["at"])).total_seconds() < GAP_GRACE_SECONDS:
+                # An earlier number may still be in flight: stop here and let the consumer retry
+                break
+            last_seq = entry["seq"]
+            if not collections or entry["collection"] in collections:
+                changes.append(entry)
+        return {"changes": changes, "last_seq": last_seq, "head": await self.head(), "reset": reset}
+
+
+# Shared by every journaled repository
+journal = ChangeJournal()
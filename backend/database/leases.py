@@ -0,0 +1,81 @@
+"""
+Lease-based locks in the `locks` collection, shared by every worker and process: the bot's
+scheduler leader election goes through /locks, snapshots and restores through `Lease`.
+A lease expires unless its owner renews it, so a crashed holder never blocks the others.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from pymongo.errors import DuplicateKeyError
+from database.mongo_config import LOCKS, get_collection
+
+logger = logging.getLogger("leases")
+
+T = TypeVar("T")
+
+
+async def acquire(name: str, owner: str, ttl_seconds: int) -> Dict[str, Any]:
+    """
+    Acquire or renew a lease. It is granted when it is free, expired, or already held by
+    the same owner; otherwise the current owner is returned.
+    """
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    try:
+        await get_collection(LOCKS).find_one_and_update(
+            {"_id": name, "$or": [{"owner": owner}, {"expires_at": {"$lte": now}}]},
+            {"$set": {"owner": owner, "expires_at": expires_at}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # The filter missed an existing document: someone else holds a live lease
+        holder = await get_collection(LOCKS).find_one({"_id": name})
+        return {"acquired": False, "owner": holder["owner"] if holder else None}
+    return {"acquired": True, "owner": owner, "expires_at": expires_at.isoformat()}
+
+
+async def release(name: str, owner: str) -> bool:
+    result = await get_collection(LOCKS).delete_one({"_id": name, "owner": owner})
+    return result.deleted_count == 1
+
+
+class Lease:
+    """A lease held by this process while a task runs, renewed in the background until it ends."""
+
+    def __init__(self, name: str, ttl_seconds: int = 60):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        # Unique per holder, so two tasks of the same worker don't share a lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    async def acquire(self) -> Optional[str]:
+        """None once acquired, else the owner currently holding it."""
+        result = await acquire(self.name, self.owner, self.ttl_seconds)
+        return None if result["acquired"] else result["owner"] or "unknown"
+
+    async def _renew(self):
+        while True:
+            await asyncio.sleep(self.ttl_seconds / 3)
+            try:
+                if not (await acquire(self.name, self.owner, self.ttl_seconds))["acquired"]:
+                    logger.error("Lease '%s' was taken over while %s still held it", self.name, self.owner)
+            except Exception:
+                logger.exception("Couldn't renew lease '%s'", self.name)
+
+    async def hold(self, work: Awaitable[T]) -> T:
+        """Run `work` under the (already acquired) lease, then release it."""
+        renewal = asyncio.create_task(self._renew())
+        try:
+            return await work
+        finally:
+            renewal.cancel()
+            try:
+                await release(self.name, self.owner)
+            except Exception:
+                logger.exception("Couldn't release lease '%s'; it expires in %ds", self.name, self.ttl_seconds)
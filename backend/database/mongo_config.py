@@ -1,45 +1,117 @@
 import os
 import logging
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+from database.pool_metrics import pool_metrics
+from database.settings import get_settings
 
-# === Load Environment Variables === #
-load_dotenv()
-MONGO_URI: str = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-DB_NAME: str = os.getenv("DB_NAME", "cyberbot_db")
+# === Settings === #
+# URI, pool options and retention periods are read on first use (database/settings.py),
+# so importing the app never parses the environment.
 
-# === Logging Configuration === #
+# === Logging === #
+# Handlers are configured once per worker by logging_setup (see app.py)
 logger = logging.getLogger("mongo_config")
-logger.setLevel(logging.INFO)
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
 
 # === MongoDB Client Singleton === #
+# The client is created by the FastAPI lifespan hook (see app.py), i.e. once per worker
+# process and inside its event loop, never at import time.
 class MongoDB:
     _client: AsyncIOMotorClient = None
     _db: AsyncIOMotorDatabase = None
+    _transactions: bool = None
 
     @classmethod
-    def get_client(cls) -> AsyncIOMotorClient:
+    def connect(cls) -> AsyncIOMotorClient:
         if cls._client is None:
-            cls._client = AsyncIOMotorClient(MONGO_URI)
-            logger.info(f"Connection to MongoDB Established")
+            settings = get_settings()
+            cls._client = AsyncIOMotorClient(settings.mongo_uri, event_listeners=[pool_metrics], **settings.pool_options)
+            logger.info("Connection to MongoDB Established (pid %d)", os.getpid())
         return cls._client
 
+    @classmethod
+    def use_client(cls, client):
+        """Install an already built client (e.g. the in-memory stand-in used by the harness)."""
+        cls._client = client
+        cls._db = None
+        cls._transactions = None
+
+    @classmethod
+    async def warm_up(cls):
+        """
+        Open the first connections and build indexes before traffic arrives, so the first
+        requests don't pay for server selection, handshakes or collection scans.
+        The pool then fills up to minPoolSize in the background.
+        """
+        settings = get_settings()
+        await cls.ping()
+        await get_collection(EVENTS).create_index("date")
+        await get_collection(RATE_LIMITS).create_index("expires_at", expireAfterSeconds=0)
+        # Quiz selection filters on these (see database/quiz_selector.py)
+        await get_collection(QUIZZES).create_index([("category", 1), ("difficulty", 1)])
+        # The change feed reads by sequence number; old entries expire on their own
+        await get_collection(CHANGES).create_index("seq", unique=True)
+        await get_collection(CHANGES).create_index("at", expireAfterSeconds=settings.changes_retention_days * 86400)
+        # Outbox claims look for undelivered messages that are due; delivered ones expire
+        await get_collection(OUTBOX).create_index([("delivered_at", 1), ("available_at", 1)])
+        await get_collection(OUTBOX).create_index("delivered_at", expireAfterSeconds=settings.outbox_retention_days * 86400)
+        logger.info("MongoDB warm-up complete")
+
+    @classmethod
+    async def ping(cls) -> bool:
+        await cls.get_client().admin.command("ping")
+        return True
+
+    @classmethod
+    async def supports_transactions(cls) -> bool:
+        """Multi-document transactions need a replica set or a sharded cluster."""
+        if cls._transactions is None:
+            try:
+                hello = await cls.get_client().admin.command("hello")
+                cls._transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+            except Exception:
+                cls._transactions = False
+            if not cls._transactions:
+                logger.warning(
+                    "MongoDB doesn't support transactions here: journal entries and outbox messages "
+                    "are written right after each change"
+                )
+        return cls._transactions
+
+    @classmethod
+    def close(cls):
+        if cls._client is not None:
+            cls._client.close()
+            logger.info("Connection to MongoDB Closed")
+        cls._client = None
+        cls._db = None
+        cls._transactions = None
+
+    @classmethod
+    def get_client(cls) -> AsyncIOMotorClient:
+        # Scripts that run outside the FastAPI app connect on first use
+        return cls.connect()
+
     @classmethod
     def get_db(cls) -> AsyncIOMotorDatabase:
         if cls._db is None:
-            cls._db = cls.get_client()[DB_NAME]
-            logger.info(f"Using database: {DB_NAME}")
+            db_name = get_settings().db_name
+            cls._db = cls.get_client()[db_name]
+            logger.info("Using database: %s", db_name)
         return cls._db
 
 # === Collections === #
-db = MongoDB.get_db()
-events_collection = db["events"]
-facts_collection = db["facts"]
-quotes_collection = db["quotes"]
-jokes_collection = db["jokes"]
-quiz_collection = db["quizzes"]
+EVENTS = "events"
+FACTS = "facts"
+QUOTES = "quotes"
+JOKES = "jokes"
+QUIZZES = "quizzes"
+LOCKS = "locks"
+JOB_RUNS = "job_runs"
+RATE_LIMITS = "rate_limits"
+CHANGES = "changes"
+COUNTERS = "counters"
+OUTBOX = "outbox"
+
+def get_collection(name: str) -> AsyncIOMotorCollection:
+    """Resolve a collection on the current worker's client."""
+    return MongoDB.get_db()[name]
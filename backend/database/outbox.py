@@ -0,0 +1,146 @@
+"""
+Transactional outbox for notifications about content changes (e.g. event announcements).
+
+A message is inserted by a repository write hook, inside the same transaction as the change
+it describes (on a replica set), so a change is never committed without its message. Consumers
+drain the outbox in batches:
+
+    claim  -> messages are leased to one consumer for `lease_seconds`, `attempts` is counted
+    ack    -> delivered: never handed out again (removed after OUTBOX_RETENTION_DAYS)
+    nack   -> failed: available again after an exponential backoff, dropped after MAX_ATTEMPTS
+
+A consumer that dies mid-batch simply lets its lease expire. Delivery is therefore
+at-least-once: the message id is the idempotency key consumers use to detect a redelivery.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from pymongo import UpdateOne
+from database.mongo_config import OUTBOX, get_collection
+from database.repository import WriteHook, serialize, to_object_id
+from logging_setup import log_context
+
+logger = logging.getLogger("outbox")
+
+MAX_ATTEMPTS = 10
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 600
+
+
+def _due(now: datetime) -> Dict[str, Any]:
+    """Undelivered, due, and not leased to a live consumer."""
+    return {
+        "delivered_at": None,
+        "available_at": {"$lte": now},
+        "$or": [{"claimed_until": None}, {"claimed_until": {"$lte": now}}]
+    }
+
+
+class Outbox:
+
+    def hook(self, topic: str) -> WriteHook:
+        """A repository write hook queuing one message per changed document."""
+        async def on_write(operation: str, docs: List[dict], session):
+            now = datetime.now(timezone.utc)
+            actor = log_context.get().get("actor")
+            messages = [
+                {
+                    "topic": topic,
+                    "op": operation,
+                    "doc": doc,
+                    "actor": actor,
+                    "created_at": now,
+                    "available_at": now,
+                    "attempts": 0,
+                    "claimed_by": None,
+                    "claimed_until": None,
+                    "delivered_at": None
+                }
+                for doc in docs
+            ]
+            await get_collection(OUTBOX).insert_many(messages, session=session)
+        return on_write
+
+    async def claim(
+        self,
+        consumer: str,
+        limit: int,
+        lease_seconds: int,
+        topics: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Lease up to `limit` due messages, oldest first, in three round trips whatever the batch size."""
+        collection = get_collection(OUTBOX)
+        now = datetime.now(timezone.utc)
+        query = _due(now)
+        if topics:
+            query["topic"] = {"$in": topics}
+        ids = [doc["_id"] async for doc in collection.find(query, {"_id": 1}).sort("_id", 1).limit(limit)]
+        if not ids:
+            return []
+
+        # The claim only sticks to messages nobody leased in between; the token finds ours
+        token = uuid.uuid4().hex
+        await collection.update_many(
+            {**query, "_id": {"$in": ids}},
+            {
+                "$set": {"claimed_by": consumer, "claim": token, "claimed_until": now + timedelta(seconds=lease_seconds)},
+                "$inc": {"attempts": 1}
+            }
+        )
+        cursor = collection.find({"_id": {"$in": ids}, "claim": token}).sort("_id", 1)
+        return [serialize(doc) async for doc in cursor]
+
+    async def ack(self, results: Dict[str, Any]) -> int:
+        """
+        Mark messages delivered, with what the consumer reports for each one (e.g. the id of
+        the posted Discord message), in one bulk write. Acking twice is harmless.
+        """
+        now = datetime.now(timezone.utc)
+        operations = [
+            UpdateOne(
+                {"_id": oid, "delivered_at": None},
+                {"$set": {"delivered_at": now, "claimed_until": None, "result": value}}
+            )
+            for oid, value in ((to_object_id(key), value) for key, value in results.items())
+            if oid is not None
+        ]
+        if not operations:
+            return 0
+        result = await get_collection(OUTBOX).bulk_write(operations, ordered=False)
+        return result.modified_count
+
+    async def nack(self, message_id: str, error: str) -> Optional[dict]:
+        """Make a failed message available again after a backoff, or give up on it."""
+        oid = to_object_id(message_id)
+        collection = get_collection(OUTBOX)
+        doc = await collection.find_one({"_id": oid, "delivered_at": None}, {"attempts": 1}) if oid else None
+        if doc is None:
+            return None
+        attempts = doc.get("attempts", 0)
+        if attempts >= MAX_ATTEMPTS:
+            # available_at=None: never claimed again, kept for inspection
+            changes = {"available_at": None, "failed_at": datetime.now(timezone.utc)}
+            logger.error("Outbox message %s dropped after %d attempts: %s", message_id, attempts, error)
+        else:
+            delay = min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+            changes = {"available_at": datetime.now(timezone.utc) + timedelta(seconds=delay)}
+        await collection.update_one(
+            {"_id": oid}, {"$set": {**changes, "claimed_until": None, "last_error": error[:500]}}
+        )
+        return {"id": message_id, "attempts": attempts, "retry": changes.get("available_at")}
+
+    async def stats(self) -> Dict[str, int]:
+        collection = get_collection(OUTBOX)
+        now = datetime.now(timezone.utc)
+        return {
+            "due": await collection.count_documents(_due(now)),
+            "leased": await collection.count_documents({"delivered_at": None, "claimed_until": {"$gt": now}}),
+            "failed": await collection.count_documents({"delivered_at": None, "available_at": None})
+        }
+
+
+# Shared by every repository with outbox messages
+outbox = Outbox()
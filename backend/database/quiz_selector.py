@@ -0,0 +1,176 @@
+import asyncio
+import bisect
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from database.repository import Repository, serialize, to_object_id
+
+# Quizzes created before categories and difficulties existed count as these
+DEFAULTS = {"category": "general", "difficulty": "medium"}
+
+TableKey = Tuple[Optional[str], Optional[str]]
+
+
+def quiz_weight(doc: Dict[str, Any]) -> float:
+    """
+    Laplace-smoothed miss rate: questions players often get wrong come up more often,
+    and a question nobody has answered yet starts at 0.5.
+    """
+    attempts = doc.get("attempts", 0)
+    correct = doc.get("correct", 0)
+    return (attempts - correct + 1) / (attempts + 2)
+
+
+class CumulativeTable:
+    """Quiz ids with the running sum of their weights: one weighted pick is a bisect, O(log n)."""
+
+    __slots__ = ("ids", "cumulative", "built_at")
+
+    def __init__(self, docs: List[Dict[str, Any]]):
+        self.ids: List[ObjectId] = []
+        self.cumulative: List[float] = []
+        total = 0.0
+        for doc in docs:
+            total += quiz_weight(doc)
+            self.ids.append(doc["_id"])
+            self.cumulative.append(total)
+        self.built_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def pick(self) -> ObjectId:
+        point = random.random() * self.cumulative[-1]
+        return self.ids[min(bisect.bisect_right(self.cumulative, point), len(self.ids) - 1)]
+
+    def sample(self, count: int) -> List[ObjectId]:
+        """`count` distinct weighted picks (all ids, shuffled, if there aren't more)."""
+        if count >= len(self.ids):
+            return random.sample(self.ids, len(self.ids))
+        picked: Dict[ObjectId, None] = {}
+        while len(picked) < count:
+            picked[self.pick()] = None
+        return list(picked)
+
+
+class QuizSelector:
+    """
+    Adaptive quiz selection by category and difficulty.
+
+    Each (category, difficulty) filter gets a cumulative weight table built from one indexed
+    query that only reads the answer counters. Tables are dropped whenever a quiz is created,
+    updated or deleted, and rebuilt at most every `max_age` seconds to pick up new answers.
+    Categories are free text, so only the `max_tables` most recently used tables are kept.
+    """
+
+    def __init__(self, repository: Repository, max_age: float = 60, max_tables: int = 256):
+        self.repository = repository
+        self.max_age = max_age
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[TableKey, CumulativeTable]" = OrderedDict()
+        # Builds in progress, so concurrent requests for one filter share a single query
+        self._building: Dict[TableKey, asyncio.Future] = {}
+        repository.add_listener(self._on_change)
+
+    async def _on_change(self, operation: str, docs: List[dict]):
+        self._tables.clear()
+
+    @staticmethod
+    def query(category: Optional[str], difficulty: Optional[str]) -> Dict[str, Any]:
+        query = {}
+        for field, value in (("category", category), ("difficulty", difficulty)):
+            if value:
+                # {"$in": [..., None]} also matches documents without the field
+                query[field] = {"$in": [value, None]} if value == DEFAULTS[field] else value
+        return query
+
+    @staticmethod
+    def key(category: Optional[str], difficulty: Optional[str]) -> TableKey:
+        return ((category.strip() or None) if category else None, difficulty or None)
+
+    def _is_fresh(self, table: Optional[CumulativeTable]) -> bool:
+        return table is not None and time.monotonic() - table.built_at < self.max_age
+
+    async def _build(self, key: TableKey) -> CumulativeTable:
+        cursor = self.repository.collection.find(self.query(*key), {"attempts": 1, "correct": 1})
+        table = CumulativeTable([doc async for doc in cursor])
+        self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.max_tables:
+            self._tables.popitem(last=False)
+        return table
+
+    async def table(self, category: Optional[str] = None, difficulty: Optional[str] = None) -> CumulativeTable:
+        key = self.key(category, difficulty)
+        table = self._tables.get(key)
+        if self._is_fresh(table):
+            self._tables.move_to_end(key)
+            return table
+        build = self._building.get(key)
+        if build is None:
+            build = self._building[key] = asyncio.ensure_future(self._build(key))
+            build.add_done_callback(lambda _: self._building.pop(key, None))
+        # A cancelled request doesn't cancel the build the others are waiting for
+        return await asyncio.shield(build)
+
+    async def select(self, category: Optional[str] = None, difficulty: Optional[str] = None, count: int = 1) -> List[dict]:
+        table = await self.table(category, difficulty)
+        if not len(table):
+            return []
+        ids = table.sample(count)
+        # Straight from the collection: random id sets aren't worth a cache entry
+        cursor = self.repository.collection.find({"_id": {"$in": ids}})
+        docs = {str(doc["_id"]): serialize(doc) async for doc in cursor}
+        # Keep the draw order; a quiz deleted since the table was built is simply skipped
+        return [docs[str(oid)] for oid in ids if str(oid) in docs]
+
+    async def record_answer(self, quiz_id: str, correct: bool) -> Optional[dict]:
+        """Count one answer; the counters are updated atomically in the quiz document."""
+        oid = to_object_id(quiz_id)
+        if oid is None:
+            return None
+        doc = await self.repository.collection.find_one_and_update(
+            {"_id": oid},
+            {"$inc": {"attempts": 1, "correct": int(correct)}},
+            projection={"attempts": 1, "correct": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if doc is None:
+            return None
+        return {
+            "id": quiz_id,
+            "attempts": doc["attempts"],
+            "correct": doc["correct"],
+            "answer_rate": round(doc["correct"] / doc["attempts"], 4)
+        }
+
+    async def stats(self) -> List[dict]:
+        """Quiz count and answer totals per category and difficulty."""
+        pipeline = [
+            {"$group": {
+                "_id": {
+                    "category": {"$ifNull": ["$category", DEFAULTS["category"]]},
+                    "difficulty": {"$ifNull": ["$difficulty", DEFAULTS["difficulty"]]}
+                },
+                "quizzes": {"$sum": 1},
+                "attempts": {"$sum": "$attempts"},
+                "correct": {"$sum": "$correct"}
+            }},
+            {"$sort": {"_id.category": 1, "_id.difficulty": 1}}
+        ]
+        results = []
+        async for group in self.repository.collection.aggregate(pipeline):
+            attempts = group["attempts"]
+            results.append({
+                "category": group["_id"]["category"],
+                "difficulty": group["_id"]["difficulty"],
+                "quizzes": group["quizzes"],
+                "attempts": attempts,
+                "correct": group["correct"],
+                "answer_rate": round(group["correct"] / attempts, 4) if attempts else None
+            })
+        return results
@@ -0,0 +1,210 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorCollection
+from database.mongo_config import MongoDB, get_collection
+from database.cache import SharedCache
+
+# A change listener receives the operation ("create", "update", "delete") and the affected
+# documents, serialized (the new version, or the removed one for "delete")
+ChangeListener = Callable[[str, List[dict]], Awaitable[None]]
+# A write hook gets the same arguments plus the session of the write's transaction
+# (None when the server has no transactions), so its own writes commit or abort with it
+WriteHook = Callable[[str, List[dict], Optional[AsyncIOMotorClientSession]], Awaitable[None]]
+
+T = TypeVar("T")
+
+
+def to_object_id(value: str) -> Optional[ObjectId]:
+    """Parse a hex id, returning None for anything that isn't a valid ObjectId."""
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        return None
+
+
+async def atomic(write: Callable[[Optional[AsyncIOMotorClientSession]], Awaitable[T]]) -> T:
+    """
+    Run `write(session)` in a transaction when the server supports it, else with no session;
+    transient conflicts are retried by the driver.
+    """
+    if not await MongoDB.supports_transactions():
+        return await write(None)
+    async with await MongoDB.get_client().start_session() as session:
+        return await session.with_transaction(write)
+
+
+def serialize(doc: dict) -> dict:
+    """Convert a MongoDB document to a JSON-friendly dict without mutating it."""
+    out = {"id": str(doc["_id"])}
+    out.update((k, v) for k, v in doc.items() if k != "_id")
+    return out
+
+
+class Repository:
+    """
+    Data access for one collection. Every router goes through a repository, so query
+    optimizations (projection, paging, single round-trip writes, bulk inserts), write hooks
+    (e.g. the outbox) and change listeners (e.g. cache invalidation) are implemented once
+    for all content types.
+    """
+
+    def __init__(self, collection_name: str, default_sort: Optional[str] = None, cache: Optional[SharedCache] = None):
+        self.collection_name = collection_name
+        self.default_sort = default_sort
+        self.listeners: List[ChangeListener] = []
+        self.write_hooks: List[WriteHook] = []
+        # Optional read-through cache for list/get/count, invalidated by every write
+        self.cache = cache
+        if cache is not None:
+            self.add_listener(cache.listener(collection_name))
+
+    async def _cached(self, parts: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self.cache is None:
+            return await loader()
+        return await self.cache.get_or_load(self.collection_name, parts, loader)
+
+    @property
+    def collection(self) -> AsyncIOMotorCollection:
+        return get_collection(self.collection_name)
+
+    def add_listener(self, listener: ChangeListener):
+        self.listeners.append(listener)
+
+    def add_write_hook(self, hook: WriteHook):
+        self.write_hooks.append(hook)
+
+    async def _notify(self, operation: str, docs: List[dict]):
+        for listener in self.listeners:
+            await listener(operation, docs)
+
+    async def _run_hooks(self, operation: str, docs: List[dict], session: Optional[AsyncIOMotorClientSession]):
+        for hook in self.write_hooks:
+            await hook(operation, docs, session)
+
+    async def _atomic(self, write: Callable[[Optional[AsyncIOMotorClientSession]], Awaitable[T]]) -> T:
+        """Run `write` (which runs the write hooks) atomically with them; see `atomic`."""
+        if not self.write_hooks:
+            return await write(None)
+        return await atomic(write)
+
+    # === Reads === #
+    async def list(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 0
+    ) -> List[dict]:
+        return await self._cached(
+            ("list", query, fields, sort, skip, limit),
+            lambda: self._list(query, fields, sort, skip, limit)
+        )
+
+    async def _list(self, query, fields, sort, skip, limit) -> List[dict]:
+        projection = {field: 1 for field in fields} if fields else None
+        cursor = self.collection.find(query or {}, projection)
+        sort = sort or self.default_sort
+        if sort:
+            # "-field" sorts descending
+            cursor = cursor.sort(sort.lstrip("-"), -1 if sort.startswith("-") else 1)
+        cursor = cursor.skip(skip).limit(limit)
+        return [serialize(doc) async for doc in cursor]
+
+    async def get(self, item_id: str, fields: Optional[List[str]] = None) -> Optional[dict]:
+        oid = to_object_id(item_id)
+        if oid is None:
+            return None
+
+        async def load():
+            projection = {field: 1 for field in fields} if fields else None
+            doc = await self.collection.find_one({"_id": oid}, projection)
+            return serialize(doc) if doc else None
+        return await self._cached(("get", item_id, fields), load)
+
+    async def sample(
+        self,
+        size: int,
+        query: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Up to `size` random documents, picked by the server with $sample."""
+        pipeline: List[Dict[str, Any]] = [{"$match": query}] if query else []
+        pipeline.append({"$sample": {"size": size}})
+        if fields:
+            pipeline.append({"$project": {field: 1 for field in fields}})
+        return [serialize(doc) async for doc in self.collection.aggregate(pipeline)]
+
+    async def count(self, query: Optional[Dict[str, Any]] = None) -> int:
+        return await self._cached(("count", query), lambda: self.collection.count_documents(query or {}))
+
+    # === Writes === #
+    async def create(self, data: Dict[str, Any]) -> dict:
+        async def write(session):
+            doc = dict(data)
+            await self.collection.insert_one(doc, session=session)
+            created = serialize(doc)
+            await self._run_hooks("create", [created], session)
+            return created
+        created = await self._atomic(write)
+        await self._notify("create", [created])
+        return created
+
+    async def create_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Insert many documents in a single unordered bulk write."""
+        if not items:
+            return []
+        async def write(session):
+            docs = [dict(item) for item in items]
+            # insert_many sets each document's _id in place
+            await self.collection.insert_many(docs, ordered=False, session=session)
+            created = [serialize(doc) for doc in docs]
+            await self._run_hooks("create", created, session)
+            return created
+        created = await self._atomic(write)
+        await self._notify("create", created)
+        return [doc["id"] for doc in created]
+
+    async def update(self, query: Dict[str, Any], changes: Dict[str, Any]) -> Optional[dict]:
+        """Apply `changes` and return the updated document in one round trip."""
+        async def write(session):
+            doc = await self.collection.find_one_and_update(
+                query, {"$set": changes}, return_document=ReturnDocument.AFTER, session=session
+            )
+            if doc is None:
+                return None
+            updated = serialize(doc)
+            await self._run_hooks("update", [updated], session)
+            return updated
+        updated = await self._atomic(write)
+        if updated is not None:
+            await self._notify("update", [updated])
+        return updated
+
+    async def delete(self, query: Dict[str, Any]) -> Optional[dict]:
+        """Delete one document and return it, in one round trip."""
+        async def write(session):
+            doc = await self.collection.find_one_and_delete(query, session=session)
+            if doc is None:
+                return None
+            deleted = serialize(doc)
+            await self._run_hooks("delete", [deleted], session)
+            return deleted
+        deleted = await self._atomic(write)
+        if deleted is not None:
+            await self._notify("delete", [deleted])
+        return deleted
+
+    def key_query(self, key: str, key_field: str = "_id") -> Optional[Dict[str, Any]]:
+        """
+        Build the filter matching `key` either as an ObjectId or as the value of `key_field`,
+        so callers holding either identifier resolve the document with a single query.
+        """
+        oid = to_object_id(key)
+        if key_field == "_id":
+            return {"_id": oid} if oid else None
+        if oid is None:
+            return {key_field: key}
+        return {"$or": [{"_id": oid}, {key_field: key}]}
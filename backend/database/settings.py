@@ -0,0 +1,76 @@
+import functools
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from env import env_int, env_str
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """Storage configuration (MongoDB, cache, snapshots), read from the environment (and .env) on first use."""
+
+    mongo_uri: str
+    db_name: str
+
+    # Connection pool (see mongo_config.MongoDB.connect)
+    max_pool_size: int
+    min_pool_size: int
+    max_idle_time_ms: int
+    wait_queue_timeout_ms: int
+    server_selection_timeout_ms: int
+    # Comma-separated, in order of preference (zstd needs the `zstandard` package, snappy `python-snappy`);
+    # "none" disables compression
+    compressors: Optional[str]
+
+    # How long change journal entries and delivered outbox messages are kept
+    changes_retention_days: int
+    outbox_retention_days: int
+
+    # Shared read cache (see database/cache.py); per process when redis_url is empty
+    redis_url: Optional[str]
+    cache_ttl: int
+    cache_max_items: int
+
+    snapshot_dir: Path
+    snapshot_chunk_docs: int
+
+    @property
+    def pool_options(self) -> Dict[str, Any]:
+        options = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "maxIdleTimeMS": self.max_idle_time_ms,
+            "waitQueueTimeoutMS": self.wait_queue_timeout_ms,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+        }
+        if self.compressors and self.compressors.lower() != "none":
+            options["compressors"] = self.compressors
+        return options
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        return cls(
+            mongo_uri=env_str("MONGO_URI", "mongodb://localhost:27017"),
+            db_name=env_str("DB_NAME", "cyberbot_db"),
+            max_pool_size=env_int("MONGO_MAX_POOL_SIZE", 100, minimum=1),
+            min_pool_size=env_int("MONGO_MIN_POOL_SIZE", 10, minimum=0),
+            max_idle_time_ms=env_int("MONGO_MAX_IDLE_TIME_MS", 300000, minimum=0),
+            wait_queue_timeout_ms=env_int("MONGO_WAIT_QUEUE_TIMEOUT_MS", 2000, minimum=0),
+            server_selection_timeout_ms=env_int("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000, minimum=0),
+            compressors=env_str("MONGO_COMPRESSORS", "zstd,zlib"),
+            changes_retention_days=env_int("CHANGES_RETENTION_DAYS", 30, minimum=1),
+            outbox_retention_days=env_int("OUTBOX_RETENTION_DAYS", 7, minimum=1),
+            redis_url=env_str("REDIS_URL"),
+            cache_ttl=env_int("CACHE_TTL", 30, minimum=1),
+            cache_max_items=env_int("CACHE_MAX_ITEMS", 10000, minimum=1),
+            snapshot_dir=Path(env_str("SNAPSHOT_DIR", "snapshots")),
+            snapshot_chunk_docs=env_int("SNAPSHOT_CHUNK_DOCS", 10000, minimum=1)
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings() -> DatabaseSettings:
+    load_dotenv()
+    return DatabaseSettings.from_env()
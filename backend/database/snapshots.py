@@ -0,0 +1,293 @@
+"""
+Snapshots of the content collections as compressed, chunked NDJSON files.
+
+    snapshots/<id>/
+        events-0001.ndjson.gz ...   documents in MongoDB Extended JSON, SNAPSHOT_CHUNK_DOCS per file
+        manifest.json               written last: files, document counts and sha256 checksums
+        status.json                 progress of the snapshot (and of the last restore)
+
+Collections are dumped concurrently and each one is read while its previous chunk is being
+compressed. Compression, checksums and file IO run in threads, so the event loop keeps
+serving requests. The manifest records the change journal position taken when the snapshot
+started. Replaying the journal from there (see `replay`) rolls a restored snapshot forward
+to a later point in time.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import re
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from bson import json_util
+from pymongo.errors import BulkWriteError
+from database.mongo_config import EVENTS, FACTS, QUOTES, JOKES, QUIZZES, CHANGES, get_collection
+from database.repository import to_object_id
+from database.cache import cache
+from database.settings import get_settings
+from database.journal import journal
+
+logger = logging.getLogger("snapshots")
+
+COLLECTIONS = (EVENTS, FACTS, QUOTES, JOKES, QUIZZES)
+
+# Chunk files inserted at the same time during a restore
+RESTORE_CONCURRENCY = 4
+DUPLICATE_KEY = 11000
+
+# One snapshot or restore at a time across every worker and the CLI (see database/leases.py)
+LOCK_NAME = "snapshots"
+LOCK_TTL_SECONDS = 60
+
+SNAPSHOT_ID = re.compile(r"^\d{8}T\d{6}Z$")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+# === Files (run in threads) === #
+def _write_chunk(path: Path, docs: List[dict]) -> Dict[str, Any]:
+    raw = "".join(json_util.dumps(doc, json_options=json_util.RELAXED_JSON_OPTIONS) + "\n" for doc in docs)
+    data = gzip.compress(raw.encode("utf-8"), compresslevel=6)
+    path.write_bytes(data)
+    return {"file": path.name, "documents": len(docs), "bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def _read_chunk(path: Path) -> List[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json_util.loads(line) for line in f if line.strip()]
+
+
+def _checksum(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_json(path: Path, data: dict):
+    # Written aside and renamed, so readers never see a partial file
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2, default=str))
+    tmp.replace(path)
+
+
+# === Snapshots === #
+def snapshot_path(snapshot_id: str) -> Path:
+    if not SNAPSHOT_ID.match(snapshot_id):
+        raise SnapshotError(f"Invalid snapshot id '{snapshot_id}'")
+    return get_settings().snapshot_dir / snapshot_id
+
+
+def new_snapshot_id() -> str:
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def read_manifest(snapshot_id: str) -> Optional[dict]:
+    path = snapshot_path(snapshot_id) / "manifest.json"
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def read_status(snapshot_id: str) -> Optional[dict]:
+    path = snapshot_path(snapshot_id) / "status.json"
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def list_snapshots() -> List[dict]:
+    """Every snapshot with its status, newest first."""
+    snapshot_dir = get_settings().snapshot_dir
+    if not snapshot_dir.exists():
+        return []
+    ids = sorted((p.name for p in snapshot_dir.iterdir() if SNAPSHOT_ID.match(p.name)), reverse=True)
+    return [read_status(snapshot_id) or {"id": snapshot_id, "status": "unknown"} for snapshot_id in ids]
+
+
+def _update_status(snapshot_id: str, **fields):
+    path = snapshot_path(snapshot_id) / "status.json"
+    status = json.loads(path.read_text()) if path.exists() else {"id": snapshot_id}
+    status.update(fields)
+    _write_json(path, status)
+
+
+async def dump_collection(name: str, directory: Path, chunk_docs: int) -> Dict[str, Any]:
+    """Read one collection in _id order, writing each chunk while the next one is read."""
+    files: List[Dict[str, Any]] = []
+    writing: Optional[asyncio.Task] = None
+    docs: List[dict] = []
+    index = 0
+
+    async def flush(batch: List[dict]):
+        nonlocal writing, index
+        index += 1
+        path = directory / f"{name}-{index:04d}.ndjson.gz"
+        if writing is not None:
+            files.append(await writing)
+        writing = asyncio.create_task(asyncio.to_thread(_write_chunk, path, batch))
+
+    async for doc in get_collection(name).find({}, batch_size=min(chunk_docs, 5000)).sort("_id", 1):
+        docs.append(doc)
+        if len(docs) >= chunk_docs:
+            await flush(docs)
+            docs = []
+    if docs:
+        await flush(docs)
+    if writing is not None:
+        files.append(await writing)
+    return {"documents": sum(f["documents"] for f in files), "files": files}
+
+
+async def create_snapshot(
+    snapshot_id: Optional[str] = None,
+    collections=COLLECTIONS,
+    chunk_docs: Optional[int] = None
+) -> dict:
+    """Dump `collections` concurrently, `chunk_docs` (default SNAPSHOT_CHUNK_DOCS) per file; returns the manifest."""
+    chunk_docs = chunk_docs or get_settings().snapshot_chunk_docs
+    snapshot_id = snapshot_id or new_snapshot_id()
+    directory = snapshot_path(snapshot_id)
+    await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=False)
+    started = datetime.now(timezone.utc)
+    await asyncio.to_thread(_update_status, snapshot_id, status="running", started_at=started.isoformat())
+    try:
+        # Changes journaled after this position may or may not be in the snapshot; replaying
+        # from here is safe because journal entries carry whole documents
+        journal_seq = await journal.head()
+        dumps = await asyncio.gather(*(dump_collection(name, directory, chunk_docs) for name in collections))
+        manifest = {
+            "id": snapshot_id,
+            "created_at": started.isoformat(),
+            "journal_seq": journal_seq,
+            "collections": dict(zip(collections, dumps))
+        }
+        await asyncio.to_thread(_write_json, directory / "manifest.json", manifest)
+    except Exception as exc:
+        logger.exception("Snapshot %s failed", snapshot_id)
+        await asyncio.to_thread(_update_status, snapshot_id, status="failed", error=repr(exc))
+        raise
+
+    duration = (datetime.now(timezone.utc) - started).total_seconds()
+    documents = sum(dump["documents"] for dump in dumps)
+    await asyncio.to_thread(
+        _update_status, snapshot_id, status="complete", documents=documents, duration_seconds=round(duration, 3)
+    )
+    logger.info("Snapshot %s: %d documents in %.2fs", snapshot_id, documents, duration)
+    return manifest
+
+
+def delete_snapshot(snapshot_id: str):
+    shutil.rmtree(snapshot_path(snapshot_id))
+
+
+# === Restore === #
+async def verify(snapshot_id: str, manifest: dict):
+    """Check every chunk against its manifest checksum before anything is overwritten."""
+    directory = snapshot_path(snapshot_id)
+    entries = [entry for dump in manifest["collections"].values() for entry in dump["files"]]
+    checksums = await asyncio.gather(*(asyncio.to_thread(_checksum, directory / e["file"]) for e in entries))
+    corrupt = [entry["file"] for entry, checksum in zip(entries, checksums) if checksum != entry["sha256"]]
+    if corrupt:
+        raise SnapshotError(f"Checksum mismatch in snapshot {snapshot_id}: {', '.join(corrupt)}")
+
+
+async def _insert_chunk(name: str, path: Path, limit: asyncio.Semaphore) -> int:
+    async with limit:
+        docs = await asyncio.to_thread(_read_chunk, path)
+        if not docs:
+            return 0
+        try:
+            await get_collection(name).insert_many(docs, ordered=False)
+            return len(docs)
+        except BulkWriteError as exc:
+            # Without drop, documents that are already there are kept as they are
+            if any(error["code"] != DUPLICATE_KEY for error in exc.details["writeErrors"]):
+                raise
+            return exc.details["nInserted"]
+
+
+async def replay(since: int, until: Optional[int] = None) -> int:
+    """
+    Apply journaled changes after `since` (up to `until`) straight to the collections,
+    rolling a restored snapshot forward. Returns the number of changes applied.
+    """
+    query: Dict[str, Any] = {"seq": {"$gt": since}, "collection": {"$in": list(COLLECTIONS)}}
+    if until is not None:
+        query["seq"]["$lte"] = until
+    applied = 0
+    async for change in get_collection(CHANGES).find(query).sort("seq", 1):
+        collection = get_collection(change["collection"])
+        oid = to_object_id(change["doc_id"])
+        if change["op"] == "delete":
+            await collection.delete_one({"_id": oid})
+        else:
+            doc = {k: v for k, v in change["doc"].items() if k != "id"}
+            await collection.replace_one({"_id": oid}, doc, upsert=True)
+        applied += 1
+    return applied
+
+
+async def restore_snapshot(
+    snapshot_id: str,
+    collections: Optional[List[str]] = None,
+    drop: bool = True,
+    until_seq: Optional[int] = None
+) -> dict:
+    """
+    Restore collections from a snapshot with parallel unordered bulk inserts. `drop` empties
+    each collection first; otherwise documents already present are left untouched.
+    With `until_seq`, journaled changes up to that position are replayed afterwards.
+
+    The restored documents bypass the repositories, so once anything was written (even by a
+    restore that failed halfway) the collections' cached reads are dropped and the change
+    journal is reset, making feed consumers such as the bot reload everything.
+    """
+    manifest = await asyncio.to_thread(read_manifest, snapshot_id)
+    if manifest is None:
+        raise SnapshotError(f"Snapshot {snapshot_id} is missing or incomplete")
+    names = collections or list(manifest["collections"])
+    unknown = set(names) - set(manifest["collections"])
+    if unknown:
+        raise SnapshotError(f"Not in snapshot {snapshot_id}: {', '.join(sorted(unknown))}")
+
+    started = datetime.now(timezone.utc)
+    await asyncio.to_thread(_update_status, snapshot_id, restore={"status": "running", "started_at": started.isoformat()})
+    touched = False
+    try:
+        await verify(snapshot_id, manifest)
+        touched = True
+        if drop:
+            await asyncio.gather(*(get_collection(name).delete_many({}) for name in names))
+
+        directory = snapshot_path(snapshot_id)
+        limit = asyncio.Semaphore(RESTORE_CONCURRENCY)
+        inserted = await asyncio.gather(*(
+            _insert_chunk(name, directory / entry["file"], limit)
+            for name in names for entry in manifest["collections"][name]["files"]
+        ))
+        replayed = await replay(manifest["journal_seq"], until_seq) if until_seq is not None else 0
+    except Exception as exc:
+        logger.exception("Restore of snapshot %s failed", snapshot_id)
+        await asyncio.to_thread(_update_status, snapshot_id, restore={"status": "failed", "error": repr(exc)})
+        raise
+    finally:
+        if touched:
+            for name in names:
+                await cache.invalidate(name)
+            await journal.reset()
+
+    result = {
+        "status": "complete",
+        "collections": names,
+        "documents": sum(inserted),
+        "replayed_changes": replayed,
+        "duration_seconds": round((datetime.now(timezone.utc) - started).total_seconds(), 3)
+    }
+    await asyncio.to_thread(_update_status, snapshot_id, restore=result)
+    logger.info("Restored snapshot %s: %d documents, %d changes replayed", snapshot_id, result["documents"], replayed)
+    return result
@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for running the backend in production:
+
+    gunicorn -c gunicorn_conf.py app:app
+
+Every worker imports the app separately (no preload), so each one creates its own
+Motor client in the FastAPI lifespan hook.
+"""
+
+from server_settings import ServerSettings
+
+# Read and validated once; empty values in .env fall back to the defaults
+server = ServerSettings.from_env()
+
+# === Server socket === #
+bind = server.bind
+backlog = server.backlog
+
+# === Workers === #
+# UvicornWorker picks uvloop and httptools automatically (installed by uvicorn[standard]).
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = server.workers
+keepalive = server.keep_alive
+timeout = server.worker_timeout
+preload_app = False
+
+# === Graceful shutdown === #
+# On SIGTERM workers stop accepting connections and get this long to finish in-flight requests.
+graceful_timeout = server.graceful_timeout
+
+# === Logging === #
+loglevel = server.log_level
+accesslog = None  # the app logs one structured line per request (see app.py)
+errorlog = "-"
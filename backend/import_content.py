@@ -0,0 +1,284 @@
+"""
+Import content libraries (events, facts, jokes, quotes, quizzes) from JSON, NDJSON or CSV files.
+Run from the backend/ folder, e.g.:
+
+    python import_content.py ../docs/data/*.json
+    python import_content.py library.ndjson --collection facts --dry-run
+
+The target collection is taken from the file name (events.json -> events) unless --collection
+is given. Records are validated and normalized against the models in models.py by a pool of
+worker processes, then written with unordered bulk upserts keyed on a natural key (an event's
+title, a quiz's question, the text of a fact, joke or quote), so running an import twice
+doesn't duplicate anything. Facts, jokes and quotes may be given as bare strings.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from models import Event, Fact, Joke, Quote, Quiz
+from database.mongo_config import MongoDB, EVENTS, FACTS, JOKES, QUOTES, QUIZZES, get_collection
+from database.repository import atomic, serialize
+from database.cache import cache
+from database.journal import journal
+from logging_setup import bind
+
+# Collection -> (model, natural key used to upsert)
+TARGETS: Dict[str, Tuple[type, str]] = {
+    EVENTS: (Event, "title"),
+    FACTS: (Fact, "content"),
+    JOKES: (Joke, "content"),
+    QUOTES: (Quote, "content"),
+    QUIZZES: (Quiz, "question")
+}
+# Libraries of plain text: their records may be bare strings
+TEXT_COLLECTIONS = {FACTS, JOKES, QUOTES}
+ALIASES = {"quiz": QUIZZES, "event": EVENTS, "fact": FACTS, "joke": JOKES, "quote": QUOTES}
+
+# Quiz options in a CSV cell are separated by this
+CSV_LIST_SEPARATOR = "|"
+MAX_REPORTED_ERRORS = 20
+
+Record = Tuple[int, Any]  # (line or item number, raw record)
+
+
+# === Reading === #
+def detect_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    if suffix in (".json", ".csv"):
+        return suffix[1:]
+    raise ValueError(f"Unsupported file type '{suffix}' (expected .json, .ndjson, .jsonl or .csv)")
+
+
+def read_records(path: Path, fmt: str) -> Iterator[Record]:
+    """
+    Yield raw records without holding the whole file in memory (except for plain JSON arrays).
+    NDJSON lines are yielded undecoded: parsing them is left to the worker processes.
+    """
+    if fmt == "json":
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a JSON array")
+        yield from enumerate(data, start=1)
+    elif fmt == "ndjson":
+        with path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    yield number, line
+    else:
+        with path.open(encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def chunked(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# === Validation (runs in the worker processes) === #
+def normalize(collection: str, fmt: str, raw: Any) -> Dict[str, Any]:
+    model, key = TARGETS[collection]
+    if fmt == "ndjson":
+        raw = json.loads(raw)
+    if isinstance(raw, str) and collection in TEXT_COLLECTIONS:
+        raw = {"content": raw}
+    if not isinstance(raw, dict):
+        raise ValueError(f"expected an object, got {type(raw).__name__}")
+
+    record = {}
+    for field, value in raw.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if fmt == "csv":
+                if not value:
+                    continue  # empty cell: let the model default apply
+                if field == "options":
+                    value = [option.strip() for option in value.split(CSV_LIST_SEPARATOR)]
+        record[field] = value
+
+    doc = model(**record).dict()
+    if not doc[key]:
+        raise ValueError(f"'{key}' is empty")
+    if collection == QUIZZES:
+        if len(doc["options"]) < 2:
+            raise ValueError("a quiz needs at least two options")
+        if not 0 <= doc["correct_option"] < len(doc["options"]):
+            raise ValueError(f"correct_option {doc['correct_option']} is out of range")
+    return doc
+
+
+def validate_chunk(collection: str, fmt: str, records: List[Record]) -> Tuple[List[dict], List[str]]:
+    """Returns the valid documents and one message per rejected record."""
+    docs, errors = [], []
+    for position, raw in records:
+        try:
+            docs.append(normalize(collection, fmt, raw))
+        except (ValueError, TypeError) as exc:  # pydantic's ValidationError is a ValueError
+            errors.append(f"#{position}: {' '.join(str(exc).split())}")
+    return docs, errors
+
+
+# === Writing === #
+async def write_chunk(collection: str, docs: List[dict]) -> Tuple[int, int]:
+    """
+    Upsert a chunk with one unordered bulk write; returns (created, updated).
+    Documents identical to the stored copy are skipped, so re-importing an unchanged file
+    writes and journals nothing.
+    """
+    key = TARGETS[collection][1]
+    # The last occurrence of a key within the chunk wins
+    docs = list({doc[key]: doc for doc in docs}.values())
+
+    async def write(session):
+        cursor = get_collection(collection).find({key: {"$in": [doc[key] for doc in docs]}}, session=session)
+        stored = {doc[key]: doc async for doc in cursor}
+        changed = [
+            doc for doc in docs
+            if doc[key] not in stored or any(stored[doc[key]].get(field) != value for field, value in doc.items())
+        ]
+        if not changed:
+            return 0, 0
+        result = await get_collection(collection).bulk_write(
+            [UpdateOne({key: doc[key]}, {"$set": doc}, upsert=True) for doc in changed],
+            ordered=False,
+            session=session
+        )
+        # Journaled in the same transaction, so caches following GET /changes pick the writes up
+        created = [serialize({"_id": oid, **changed[index]}) for index, oid in result.upserted_ids.items()]
+        await journal.record(collection, "create", created, session)
+        updated = [
+            serialize({**stored[doc[key]], **doc})
+            for index, doc in enumerate(changed) if index not in result.upserted_ids and doc[key] in stored
+        ]
+        await journal.record(collection, "update", updated, session)
+        return len(created), result.modified_count
+    return await atomic(write)
+
+
+class Progress:
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.read = self.valid = self.created = self.updated = 0
+        self.errors: List[str] = []
+
+    def report(self, final: bool = False):
+        elapsed = time.perf_counter() - self.started
+        rate = self.read / elapsed if elapsed else 0
+        print(
+            f"{'✅' if final else '…'} {self.name}: {self.read} read, {self.valid} valid, "
+            f"{len(self.errors)} invalid, {self.created} created, {self.updated} updated "
+            f"({rate:,.0f} records/s)",
+            file=sys.stderr
+        )
+
+
+async def import_file(
+    path: Path,
+    collection: str,
+    pool: Optional[ProcessPoolExecutor],
+    read_ahead: int,
+    chunk_size: int,
+    dry_run: bool
+) -> Progress:
+    fmt = detect_format(path)
+    progress = Progress(f"{path.name} -> {collection}")
+    loop = asyncio.get_running_loop()
+    pending: deque = deque()
+
+    async def drain():
+        docs, errors = await pending.popleft()
+        progress.valid += len(docs)
+        progress.errors.extend(f"{path.name} {error}" for error in errors)
+        if docs and not dry_run:
+            created, updated = await write_chunk(collection, docs)
+            progress.created += created
+            progress.updated += updated
+        progress.report()
+
+    for chunk in chunked(read_records(path, fmt), chunk_size):
+        progress.read += len(chunk)
+        if pool:
+            pending.append(loop.run_in_executor(pool, validate_chunk, collection, fmt, chunk))
+        else:
+            future = loop.create_future()
+            future.set_result(validate_chunk(collection, fmt, chunk))
+            pending.append(future)
+        if len(pending) >= read_ahead:
+            await drain()
+    while pending:
+        await drain()
+    progress.report(final=True)
+    return progress
+
+
+def target_collection(path: Path, override: Optional[str]) -> str:
+    name = override or path.stem.lower()
+    name = ALIASES.get(name, name)
+    if name not in TARGETS:
+        raise ValueError(f"Can't tell which collection {path.name} belongs to; use --collection ({', '.join(TARGETS)})")
+    return name
+
+
+async def main(args: argparse.Namespace) -> int:
+    jobs = [(Path(file), target_collection(Path(file), args.collection)) for file in args.files]
+    workers = args.workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    results = []
+    try:
+        for path, collection in jobs:
+            bind(actor=f"import:{path.name}")
+            # Bounded read-ahead: workers stay busy while only a few chunks are held in memory
+            results.append(await import_file(path, collection, pool, workers * 2, args.chunk_size, args.dry_run))
+        if not args.dry_run:
+            # Only collections the import actually changed
+            for collection in {collection for (_, collection), progress in zip(jobs, results) if progress.created or progress.updated}:
+                await cache.invalidate(collection)
+    finally:
+        if pool:
+            pool.shutdown()
+        await cache.close()
+        MongoDB.close()
+
+    errors = [error for progress in results for error in progress.errors]
+    for error in errors[:MAX_REPORTED_ERRORS]:
+        print(f"⚠️  {error}", file=sys.stderr)
+    if len(errors) > MAX_REPORTED_ERRORS:
+        print(f"⚠️  ... and {len(errors) - MAX_REPORTED_ERRORS} more invalid records", file=sys.stderr)
+    if args.dry_run:
+        print("Dry run: nothing was written.", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import content libraries into MongoDB.")
+    parser.add_argument("files", nargs="+", help="JSON, NDJSON (.ndjson/.jsonl) or CSV files")
+    parser.add_argument("--collection", choices=sorted(TARGETS), help="target collection (default: from the file name)")
+    parser.add_argument("--dry-run", action="store_true", help="validate and report without writing")
+    parser.add_argument("--workers", type=int, default=0, help="validation processes (default: CPU count, 1 = inline)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per validation chunk and bulk write")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
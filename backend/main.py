@@ -1,19 +1,30 @@
 import uvicorn
-from app import app
 from pathlib import Path
 
-import os
 from dotenv import load_dotenv
+from server_settings import ServerSettings
 
 env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 if __name__ == "__main__":
-    port = int(os.getenv("PORT", 8000))
-    uvicorn.run(
-        "backend.app:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True,  # enables auto-reload during development
-        log_level="info"
-    )
+    server = ServerSettings.from_env()
+
+    if server.reload:
+        # Development: single process watching files for changes
+        uvicorn.run("app:app", host=server.host, port=server.port, reload=True, log_level="info")
+    else:
+        # Production: one worker per core, uvloop + httptools, no file watching.
+        # For process supervision prefer gunicorn (see gunicorn_conf.py).
+        uvicorn.run(
+            "app:app",
+            host=server.host,
+            port=server.port,
+            workers=server.workers,
+            loop="uvloop",
+            http="httptools",
+            timeout_keep_alive=server.keep_alive,
+            backlog=server.backlog,
+            timeout_graceful_shutdown=server.graceful_timeout,
+            log_level="info"
+        )
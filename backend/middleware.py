@@ -0,0 +1,94 @@
+import ipaddress
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from token_bucket import TokenBucket
+
+
+def parse_limit(raw: str) -> Tuple[int, float]:
+    """"100/1" -> (100 requests, per 1 second)."""
+    count, _, per = raw.partition("/")
+    return int(count), float(per or 1)
+
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(raw: str) -> Optional[List[Network]]:
+    """"127.0.0.1,10.0.0.0/8" -> networks of trusted proxies; "*" trusts every peer (None)."""
+    entries = [entry.strip() for entry in raw.split(",") if entry.strip()]
+    if "*" in entries:
+        return None
+    return [ipaddress.ip_network(entry, strict=False) for entry in entries]
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+    Per-client token bucket for the whole API, kept in this worker's memory; health probes are exempt.
+
+    Clients are identified by their peer address. X-Forwarded-For is only honoured when the
+    peer is a trusted proxy (`trusted_proxies`, None = any), and then the right-most hop that
+    isn't a trusted proxy is the client: the hops left of it are whatever the caller sent.
+    """
+
+    def __init__(
+        self,
+        app,
+        limit: int,
+        per: float,
+        max_clients: int = 10000,
+        trusted_proxies: Optional[List[Network]] = ()
+    ):
+        super().__init__(app)
+        self.limit = limit
+        self.rate = limit / per
+        self.max_clients = max_clients
+        self.trusted_proxies = trusted_proxies
+        self.buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def is_trusted(self, host: str) -> bool:
+        if self.trusted_proxies is None:
+            return True
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_proxies)
+
+    def client_key(self, request: Request) -> str:
+        peer = request.client.host if request.client else "unknown"
+        forwarded = request.headers.get("X-Forwarded-For")
+        if not forwarded or not self.is_trusted(peer):
+            return peer
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        for hop in reversed(hops):
+            if not self.is_trusted(hop):
+                return hop
+        # Every hop is a proxy we trust: the left-most one is the closest thing to a client
+        return hops[0] if hops else peer
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path.startswith("/health"):
+            return await call_next(request)
+
+        key = self.client_key(request)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(self.limit, self.rate)
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+
+        retry_after = bucket.consume(time.monotonic())
+        if retry_after:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(max(1, round(retry_after)))}
+            )
+        return await call_next(request)
@@ -1,6 +1,22 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
-from typing import List
+from typing import List, Dict, Literal
+from datetime import datetime, timezone
+
+# Canonical event date: UTC, so string order is chronological order
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+def normalize_date(value: str) -> str:
+    """
+    Event dates are stored as UTC "YYYY-MM-DDTHH:MM:SS": the API filters and sorts them as
+    strings. Accepts ISO forms with a space or "T", a date alone (midnight), a trailing "Z"
+    or a UTC offset; naive values are taken as UTC.
+    """
+    value = value.strip()
+    parsed = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime(DATE_FORMAT)
 
 class Event(BaseModel):
     title: str
@@ -8,6 +24,11 @@ class Event(BaseModel):
     description: str
     location: str
 
+    @field_validator("date")
+    @classmethod
+    def canonical_date(cls, value: str) -> str:
+        return normalize_date(value)
+
 class Fact(BaseModel):
     content: str
 
@@ -20,4 +41,88 @@ class Joke(BaseModel):
 class Quiz(BaseModel):
     question: str
     options: List[str]
-    correct_option: int    
+    correct_option: int
+    category: str = "general"
+    difficulty: Literal["easy", "medium", "hard"] = "medium"
+
+# === Partial updates === #
+# Every field is optional; only the fields actually sent are written.
+class EventUpdate(BaseModel):
+    title: Optional[str] = None
+    date: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+
+    @field_validator("date")
+    @classmethod
+    def canonical_date(cls, value: Optional[str]) -> Optional[str]:
+        return normalize_date(value) if value is not None else None
+
+class FactUpdate(BaseModel):
+    content: Optional[str] = None
+
+class QuoteUpdate(BaseModel):
+    content: Optional[str] = None
+    author: Optional[str] = None
+
+class JokeUpdate(BaseModel):
+    content: Optional[str] = None
+
+class QuizUpdate(BaseModel):
+    question: Optional[str] = None
+    options: Optional[List[str]] = None
+    correct_option: Optional[int] = None
+    category: Optional[str] = None
+    difficulty: Optional[Literal["easy", "medium", "hard"]] = None
+
+class QuizAnswer(BaseModel):
+    correct: bool
+
+# === Batch reads === #
+class BatchQuery(BaseModel):
+    skip: int = Field(0, ge=0)
+    limit: int = Field(0, ge=0, le=500)
+    fields: Optional[List[str]] = None
+    upcoming: bool = False  # events only
+    days: Optional[int] = Field(None, ge=1, le=366)  # events only: upcoming within this many days
+    sample: int = Field(0, ge=0, le=100)  # random documents instead of a page ($sample)
+
+class BatchRequest(BaseModel):
+    # Resource name ("facts", "jokes", "quotes", "quiz", "events", "about") -> query
+    resources: Dict[str, BatchQuery]
+
+# === Shared rate limits === #
+class RateLimitHit(BaseModel):
+    key: str
+    limit: int = Field(..., ge=1)
+    window: float = Field(..., gt=0)  # seconds
+
+class RateLimitRequest(BaseModel):
+    limits: List[RateLimitHit]
+
+class LockRequest(BaseModel):
+    owner: str
+    ttl_seconds: int = Field(30, ge=1, le=3600)
+
+class JobRun(BaseModel):
+    job_id: str
+    owner: str
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: float
+    outcome: str  # "success", "error" or "skipped"
+    error: Optional[str] = None
+
+# === Outbox === #
+class OutboxClaim(BaseModel):
+    consumer: str
+    limit: int = Field(20, ge=1, le=100)
+    lease_seconds: int = Field(60, ge=5, le=3600)
+    topics: Optional[List[str]] = None
+
+class OutboxAck(BaseModel):
+    # Message id -> what the consumer did with it (e.g. the Discord message id, or None if skipped)
+    results: Dict[str, Optional[str]]
+
+class OutboxNack(BaseModel):
+    error: str
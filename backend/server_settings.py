@@ -0,0 +1,40 @@
+import multiprocessing
+from dataclasses import dataclass
+
+from env import env_bool, env_int, env_str
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """Settings shared by the production servers (gunicorn_conf.py and main.py)."""
+
+    host: str
+    port: int
+    workers: int
+    keep_alive: int
+    backlog: int
+    worker_timeout: int
+    graceful_timeout: int
+    reload: bool
+    log_level: str
+
+    @property
+    def bind(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @classmethod
+    def from_env(cls) -> "ServerSettings":
+        port = env_int("PORT", 8000, minimum=1)
+        if port > 65535:
+            raise ValueError(f"PORT must be at most 65535, got {port}")
+        return cls(
+            host=env_str("HOST", "0.0.0.0"),
+            port=port,
+            workers=env_int("WEB_CONCURRENCY", multiprocessing.cpu_count(), minimum=1),
+            keep_alive=env_int("KEEP_ALIVE", 5, minimum=0),
+            backlog=env_int("BACKLOG", 2048, minimum=1),
+            worker_timeout=env_int("WORKER_TIMEOUT", 60, minimum=0),
+            graceful_timeout=env_int("GRACEFUL_TIMEOUT", 30, minimum=0),
+            reload=env_bool("RELOAD"),
+            log_level=env_str("LOG_LEVEL", "info").lower()
+        )
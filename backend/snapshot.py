@@ -0,0 +1,74 @@
+"""
+Create, list and restore snapshots of the content collections (see database/snapshots.py).
+Run from the backend/ folder:
+
+    python snapshot.py create
+    python snapshot.py list
+    python snapshot.py restore 20250101T120000Z [--keep] [--until-seq 1234] [--collections events,quizzes]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from database.mongo_config import MongoDB
+from database.cache import cache
+from database import snapshots
+from database.leases import Lease
+from database.snapshots import SnapshotError
+
+
+async def exclusive(work):
+    """Run `work` under the lease the API uses, so the CLI never overlaps a running snapshot or restore."""
+    lease = Lease(snapshots.LOCK_NAME, snapshots.LOCK_TTL_SECONDS)
+    holder = await lease.acquire()
+    if holder is not None:
+        work.close()
+        raise SnapshotError(f"A snapshot or restore is already running ({holder})")
+    return await lease.hold(work)
+
+
+async def main(args: argparse.Namespace) -> int:
+    try:
+        if args.command == "list":
+            for status in snapshots.list_snapshots():
+                print(json.dumps(status, default=str))
+        elif args.command == "create":
+            collections = tuple(args.collections.split(",")) if args.collections else snapshots.COLLECTIONS
+            manifest = await exclusive(snapshots.create_snapshot(collections=collections))
+            for name, dump in manifest["collections"].items():
+                print(f"✅ {name}: {dump['documents']} documents in {len(dump['files'])} file(s)")
+            print(f"Snapshot {manifest['id']} written to {snapshots.snapshot_path(manifest['id'])}")
+        else:
+            collections = args.collections.split(",") if args.collections else None
+            result = await exclusive(
+                snapshots.restore_snapshot(args.snapshot_id, collections, not args.keep, args.until_seq)
+            )
+            print(f"✅ Restored {result['documents']} documents ({result['replayed_changes']} changes replayed) "
+                  f"in {result['duration_seconds']}s")
+    except SnapshotError as exc:
+        print(f"⚠️  {exc}", file=sys.stderr)
+        return 1
+    finally:
+        await cache.close()
+        MongoDB.close()
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Snapshot and restore the content collections.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list snapshots and their status")
+    create = commands.add_parser("create", help="dump the content collections")
+    create.add_argument("--collections", help="comma-separated subset (default: all content)")
+    restore = commands.add_parser("restore", help="restore a snapshot")
+    restore.add_argument("snapshot_id")
+    restore.add_argument("--collections", help="comma-separated subset (default: everything in the snapshot)")
+    restore.add_argument("--keep", action="store_true", help="keep existing documents instead of emptying the collections")
+    restore.add_argument("--until-seq", type=int, help="then replay the change journal up to this sequence number")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
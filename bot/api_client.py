@@ -1,30 +1,32 @@
 import aiohttp
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
 
-# For debugging and observability
-logger = logging.getLogger("api_client")
-logger.setLevel(logging.INFO)
+from logging_setup import log_context
 
-# For local debugging
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] %(message)s", "%Y-%m-%d %H:%M:%S"
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+# For debugging and observability (handlers are configured once by logging_setup)
+logger = logging.getLogger("api_client")
 
 
 class APIClient:
 
+    # Builds the HTTP session; the offline harness swaps it for one routed to the ASGI app
+    session_factory: Callable[[], aiohttp.ClientSession] = aiohttp.ClientSession
+
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        return self.open()
+
+    def open(self) -> "APIClient":
+        """Start the session; long-lived clients call this and close() instead of using `async with`."""
+        if self.session is None or self.session.closed:
+            self.session = type(self).session_factory()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -44,26 +46,41 @@ class APIClient:
         if not self.session:
             raise RuntimeError("Session not initialized. Use 'async with APIClient(...)'.")
 
+        # Propagate the interaction id so backend logs can be correlated with the bot's,
+        # and who triggered the call so the backend change journal can record it
+        context = log_context.get()
+        request_id = context.get("interaction_id") or uuid.uuid4().hex
+        headers = {"X-Request-ID": str(request_id), **kwargs.pop("headers", {})}
+        if context.get("user_id"):
+            headers.setdefault("X-Actor", f"discord:{context['user_id']}")
+        elif context.get("job"):
+            headers.setdefault("X-Actor", f"job:{context['job']}")
+
+        started = time.perf_counter()
         try:
-            async with self.session.request(method, url, **kwargs) as response:
+            async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                logger.debug(
+                    "%s %s -> %s", method, url, response.status,
+                    extra={"request_id": request_id, "duration_ms": round((time.perf_counter() - started) * 1000, 2)}
+                )
                 # Log and handle non-2xx status codes
                 if response.status >= 400:
                     text = await response.text()
-                    logger.error(f"HTTP {response.status} on {url}: {text}")
+                    logger.error("HTTP %s on %s: %s", response.status, url, text)
                     return None
 
                 # Return parsed JSON
                 try:
                     return await response.json()
                 except aiohttp.ContentTypeError:
-                    logger.warning(f"Non-JSON response from {url}")
+                    logger.warning("Non-JSON response from %s", url)
                     return None
 
         except aiohttp.ClientError as e:
-            logger.error(f"Network error while calling {url}: {e}")
+            logger.error("Network error while calling %s: %s", url, e)
             return None
         except asyncio.TimeoutError:
-            logger.error(f"Request to {url} timed out.")
+            logger.error("Request to %s timed out.", url)
             return None
 
     # Event CRUD
@@ -71,6 +88,11 @@ class APIClient:
         """Fetch all events."""
         return await self._request("GET", "/events") or []
 
+    async def get_events_page(self, skip: int, limit: int, upcoming: bool = True) -> List[Dict[str, Any]]:
+        """Fetch one page of events sorted by date."""
+        params = {"skip": skip, "limit": limit, "upcoming": str(upcoming).lower()}
+        return await self._request("GET", "/events", params=params) or []
+
     async def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific event by ID."""
         return await self._request("GET", f"/events/{event_id}")
@@ -79,13 +101,13 @@ class APIClient:
         """Create a new event."""
         return await self._request("POST", "/events", json=event_data)
 
-    async def update_event(self, event_title: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Update an existing event."""
-        return await self._request("PUT", f"/events/{event_title}", json=update_data)
+    async def update_event(self, event_key: str, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update an existing event by ID or Title."""
+        return await self._request("PUT", f"/events/{event_key}", json=update_data)
 
-    async def delete_event(self, event_title: str) -> bool:
-        """Delete an event by Title."""
-        resp = await self._request("DELETE", f"/events/{event_title}")
+    async def delete_event(self, event_key: str) -> bool:
+        """Delete an event by ID or Title."""
+        resp = await self._request("DELETE", f"/events/{event_key}")
         return bool(resp)
 
     # Cyber Fact CRUD
@@ -149,6 +171,19 @@ class APIClient:
         """Delete a quiz."""
         return await self._request("DELETE", f"/quiz/{quiz_id}")
 
+    async def select_quizzes(self, category: Optional[str] = None, difficulty: Optional[str] = None, count: int = 1) -> List[Dict[str, Any]]:
+        """Weighted random quizzes, optionally of one category and/or difficulty."""
+        params = {"count": count}
+        if category:
+            params["category"] = category
+        if difficulty:
+            params["difficulty"] = difficulty
+        return await self._request("GET", "/quiz/select", params=params) or []
+
+    async def record_quiz_answer(self, quiz_id: str, correct: bool) -> Optional[Dict[str, Any]]:
+        """Count one answer in the quiz's statistics."""
+        return await self._request("POST", f"/quiz/{quiz_id}/answer", json={"correct": correct})
+
     # About CRUD
     async def get_about(self) -> Optional[Dict[str, Any]]:
         """Fetch about-us information."""
@@ -175,3 +210,53 @@ class APIClient:
         """Delete a cybersecurity quote."""
         resp = await self._request("DELETE", f"/quotes/{quote_id}")
         return bool(resp)
+
+    # Batched reads
+    async def batch(self, resources: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fetch several resources in one request, e.g.
+        {"facts": {}, "events": {"upcoming": True, "limit": 10}, "about": {}}.
+        """
+        return await self._request("POST", "/batch/", json={"resources": resources}) or {}
+
+    # Shared rate limits
+    async def consume_rate_limit(self, limits: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Count one hit against several fixed-window limits shared by every bot process."""
+        return await self._request("POST", "/ratelimit/consume", json={"limits": limits})
+
+    # Distributed locks
+    async def acquire_lock(self, name: str, owner: str, ttl_seconds: int) -> Optional[bool]:
+        """Acquire or renew a lease on a named lock (None if the backend could not answer)."""
+        resp = await self._request("POST", f"/locks/{name}/acquire", json={"owner": owner, "ttl_seconds": ttl_seconds})
+        if resp is None:
+            return None
+        return bool(resp.get("acquired"))
+
+    async def release_lock(self, name: str, owner: str) -> bool:
+        """Release a lock held by `owner`."""
+        resp = await self._request("POST", f"/locks/{name}/release", json={"owner": owner})
+        return bool(resp and resp.get("released"))
+
+    # Change journal
+    async def get_changes(self, since: int, limit: int = 100) -> Optional[Dict[str, Any]]:
+        """Journaled writes after sequence number `since` (None if the backend could not answer)."""
+        return await self._request("GET", "/changes/", params={"since": since, "limit": limit})
+
+    # Outbox delivery
+    async def claim_outbox(self, consumer: str, limit: int, lease_seconds: int, topics: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Lease up to `limit` pending outbox messages to `consumer`."""
+        payload = {"consumer": consumer, "limit": limit, "lease_seconds": lease_seconds, "topics": topics}
+        return await self._request("POST", "/outbox/claim", json=payload) or []
+
+    async def ack_outbox(self, results: Dict[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+        """Mark outbox messages delivered (message id -> delivery result)."""
+        return await self._request("POST", "/outbox/ack", json={"results": results})
+
+    async def nack_outbox(self, message_id: str, error: str) -> Optional[Dict[str, Any]]:
+        """Report a failed delivery so the message is retried later."""
+        return await self._request("POST", f"/outbox/{message_id}/nack", json={"error": error})
+
+    # Scheduled job history
+    async def record_job_run(self, run_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Store the outcome of one scheduled job execution."""
+        return await self._request("POST", "/jobs/runs", json=run_data)
@@ -1,80 +1,343 @@
-import os
-import random
+import json
+import time
+import asyncio
+import hashlib
+import functools
 import discord
 import logging
 from discord import app_commands
 from discord.ext import commands
-from dotenv import load_dotenv
-from pathlib import Path
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime, timedelta , timezone
+from typing import Optional
 
 
 from api_client import APIClient
+from settings import get_settings
+from views import EventsView
+from leader import LeaderLease, process_id
+from jobs import PersistentJobs, tracked_job
+from cache import ContentCache
+from content_store import build_store, expand_id
+from dates import parse_event_date
+from logging_setup import setup_logging, bind
+from ratelimit import RateLimiter, parse_rules
+from watchdog import LoopWatchdog
+from reminders import ReminderEngine, format_offset
+from digest import DigestPublisher, parse_digests
+from changefeed import ChangeFeed
+from outbox import OutboxWorker
+from quiz_bank import QuizBank
+
+# === Configuration === #
+# Parsed once from the environment and bot/.env; missing values only fail where they're needed
+settings = get_settings()
+EVENTS_ENDPOINT = settings.endpoint("events")
+FACTS_ENDPOINT = settings.endpoint("facts")
+JOKES_ENDPOINT = settings.endpoint("jokes")
+QUIZ_ENDPOINT = settings.endpoint("quiz")
+QUOTES_ENDPOINT = settings.endpoint("quotes")
+EVENTS_PAGE_SIZE = 5
 
-# === Load environment variables === #
-env_path = Path(__file__).parent / ".env"
-load_dotenv(dotenv_path=env_path)
-TOKEN = os.getenv("DISCORD_TOKEN")
-CHANNEL_ID = int(os.getenv("DAILY_FACT_CHANNEL_ID"))
-EVENTS_CHANNEL_ID = int(os.getenv("EVENTS_CHANNEL_ID"))  
-API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
-FACTS_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/facts"
-EVENTS_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/events"
-JOKES_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/jokes"
-QUIZ_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/quiz"
-QUOTES_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/quotes"
-ABOUT_ENDPOINT = f"{API_BASE_URL.rstrip('/')}/about"
-
-# === Logging configuration === #
-scheduler = AsyncIOScheduler()
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("CyberBot")
 
+# === Scheduler === #
+# The job store is attached when the scheduler first starts (see start_scheduler), so importing
+# this module doesn't open a MongoDB connection. Jobs are declared in `jobs` until then.
+scheduler = AsyncIOScheduler(
+    job_defaults={
+        "coalesce": True,  # several missed runs collapse into a single one
+        "misfire_grace_time": settings.misfire_grace_seconds,
+        "max_instances": 1
+    },
+    timezone="Africa/Algiers"
+)
+jobs = PersistentJobs()
+
+def build_jobstore():
+    """
+    With MONGO_URI set, jobs (and their next run times) survive restarts, so a daily post
+    that was due while the bot was down still fires within the misfire grace period.
+    """
+    if not settings.mongo_uri:
+        logger.warning("MONGO_URI not set: scheduled jobs are kept in memory and missed runs are lost on restart.")
+        return MemoryJobStore()
+    from apscheduler.jobstores.mongodb import MongoDBJobStore
+    return MongoDBJobStore(database=settings.db_name, collection="scheduler_jobs", host=settings.mongo_uri)
+
+# === Content cache === #
+# Preloaded in one batched request at startup, then served from memory by the commands.
+content = ContentCache(
+    settings.api_base_url,
+    {
+        "facts": {},
+        "jokes": {},
+        "quotes": {},
+        "quiz": {},
+        "about": {},
+        # First page of /events, with the lookahead item EventsView expects
+        "events": {"upcoming": True, "limit": EVENTS_PAGE_SIZE + 1}
+    },
+    ttl=settings.content_cache_ttl,
+    # Content libraries are kept as compact slotted records with O(1) random sampling
+    builders={name: functools.partial(build_store, name) for name in ("facts", "jokes", "quotes", "quiz")},
+    # The change feed patches those in place: no periodic full reload while it keeps up
+    live=lambda: feed.healthy
+)
+
+# Quizzes are rendered from the local store; the backend's weighted picks are prefetched in batches
+quiz_bank = QuizBank(QUIZ_ENDPOINT, content)
+
+# === Event reminders === #
+async def send_event_reminder(event: dict, offset: timedelta):
+    channel = bot.get_channel(settings.events_channel_id)
+    if channel is None:
+        logger.warning("Events channel not found, reminder dropped.")
+        return
+    await channel.send(
+        f"⏰ **Reminder:** **{event.get('title', 'Untitled')}** starts in {format_offset(offset)}!\n"
+        f"📅 **Date:** {event.get('date', 'TBD')}\n"
+        f"📍 **Location:** {event.get('location', 'Not specified')}"
+    )
+
+reminders = ReminderEngine(settings.reminder_offsets, send_event_reminder)
+
+async def sync_reminders():
+    """Reload upcoming events so changes made outside the bot are picked up."""
+    async with APIClient(EVENTS_ENDPOINT) as api:
+        upcoming = await api.get_events_page(skip=0, limit=0)
+    reminders.sync(upcoming)
+    logger.debug("Reminder engine tracking %d events.", len(reminders))
+
+# === Event announcements === #
+# The backend queues a message in its outbox with every event change (in the same transaction);
+# the leader delivers them in the background, so commands and the pruner never post inline.
+PRUNE_JOB_ID = "prune_finished_events"
+
+def build_announcement(message: dict) -> Optional[discord.Embed]:
+    event = message["doc"]
+    if message["op"] == "create":
+        embed = discord.Embed(title="📢 New Event Added!", description=f"**{event.get('title', 'Untitled')}**", color=discord.Color.green())
+        embed.add_field(name="📅 Date", value=event.get("date") or "TBD")
+        embed.add_field(name="📍 Location", value=event.get("location") or "Not specified")
+        embed.add_field(name="📝 Description", value=(event.get("description") or "No description")[:1024], inline=False)
+    elif message["op"] == "delete" and message.get("actor") == f"job:{PRUNE_JOB_ID}":
+        embed = discord.Embed(description=f"🗑️ Event **{event.get('title', 'Untitled')}** has ended and was removed.")
+    else:
+        return None
+    # The message id doubles as the idempotency key, see deliver_announcement
+    embed.set_footer(text=f"ref {message['id']}")
+    return embed
+
+async def deliver_announcement(message: dict) -> Optional[str]:
+    embed = build_announcement(message)
+    if embed is None:
+        return None
+    channel = bot.get_channel(settings.events_channel_id)
+    if channel is None:
+        raise RuntimeError(f"Events channel {settings.events_channel_id} not found")
+    if message.get("attempts", 1) > 1:
+        # An earlier attempt may have posted it before its ack was lost
+        async for previous in channel.history(limit=50):
+            if previous.author == bot.user and any(e.footer.text == embed.footer.text for e in previous.embeds):
+                return str(previous.id)
+    sent = await channel.send(embed=embed)
+    return str(sent.id)
+
+# Each process claims under its own id, so `claimed_by` tells which one holds a leased message
+announcements = OutboxWorker(settings.api_base_url, process_id(), deliver_announcement, topics=["events"], interval=settings.outbox_interval)
+
+# === Change feed === #
+# Backend writes (from any bot process, the API or scripts) are applied to the content cache
+# and the reminder engine as they are journaled, instead of waiting for the cache TTL.
+FEED_RESOURCES = {"events": "events", "facts": "facts", "jokes": "jokes", "quotes": "quotes", "quizzes": "quiz"}
+
+def apply_change(change: dict):
+    name = FEED_RESOURCES.get(change["collection"])
+    if name is None:
+        return
+    doc = change["doc"]
+    if name == "events":
+        # The cached first page depends on dates and ordering: refetch it
+        content.invalidate("events")
+        if change["op"] == "delete":
+            reminders.remove(doc["id"])
+        else:
+            reminders.upsert(doc)
+        return
+    content.apply(name, change["op"], doc)
+
+async def resync_content():
+    content.invalidate_all()
+    await content.preload()
+    if leader.is_leader:
+        await sync_reminders()
+
+feed = ChangeFeed(settings.api_base_url, apply_change, resync_content, interval=settings.change_feed_interval)
+
+# === Rate limiting === #
+limiter = RateLimiter(parse_rules(settings.rate_limits), shared_base_url=settings.api_base_url if settings.rate_limit_shared else None)
+
+# === Loop watchdog === #
+watchdog = LoopWatchdog(threshold=settings.loop_lag_threshold_ms / 1000) if settings.loop_watchdog else None
+
+# === Scheduler leadership === #
+# Every process runs the same jobs, so only the holder of the "scheduler" lease starts them.
+async def start_scheduler():
+    if not scheduler.running:
+        scheduler.add_jobstore(build_jobstore(), "default")
+        # Paused until the declared jobs are reconciled with the stored ones
+        scheduler.start(paused=True)
+        jobs.sync(scheduler)
+        scheduler.resume()
+    else:
+        scheduler.resume()
+    await sync_reminders()
+    reminders.start()
+    announcements.start()
+
+async def pause_scheduler():
+    if scheduler.running:
+        scheduler.pause()
+    reminders.stop()
+    announcements.stop()
+
+leader = LeaderLease(settings.api_base_url, "scheduler", settings.scheduler_lock_ttl, on_elected=start_scheduler, on_demoted=pause_scheduler)
+
 # === Discord bot setup === #
+class CyberTree(app_commands.CommandTree):
+    """
+    Command tree that tags every log record of an interaction with its ids
+    and applies per-user/channel/guild cooldowns before any command runs.
+    """
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        command = interaction.command.qualified_name if interaction.command else None
+        # Each interaction is dispatched in its own task, so the binding stays local to it
+        bind(
+            interaction_id=interaction.id,
+            command=command,
+            user_id=interaction.user.id if interaction.user else None,
+            guild_id=interaction.guild_id
+        )
+        if watchdog and command:
+            watchdog.track_interaction(interaction, command)
+
+        permissions = getattr(interaction.user, "guild_permissions", None)
+        if command is None or (permissions and permissions.administrator):
+            return True
+
+        retry_after = await limiter.check(command, {
+            "user": interaction.user.id,
+            "channel": interaction.channel_id,
+            "guild": interaction.guild_id
+        })
+        if retry_after:
+            logger.info("Rate limited /%s for %.1fs", command, retry_after)
+            await interaction.response.send_message(
+                f"⏳ Slow down! You can use `/{command}` again in {retry_after:.1f}s.", ephemeral=True
+            )
+            return False
+        return True
+
+class CyberBot(commands.AutoShardedBot):
+    """Bot with a one-time startup phase (runs before connecting, unlike on_ready)."""
+
+    leader_task = None
+    eviction_task = None
+    watchdog_task = None
+    feed_task = None
+
+    async def setup_hook(self):
+        started = time.perf_counter()
+        if settings.change_feed_interval:
+            # Before the preload, so writes made while it runs are replayed afterwards
+            await feed.prime()
+        synced, _ = await asyncio.gather(self.sync_commands(), content.preload())
+        if settings.change_feed_interval:
+            self.feed_task = asyncio.create_task(feed.run())
+        self.leader_task = asyncio.create_task(leader.run())
+        self.eviction_task = asyncio.create_task(limiter.run_eviction())
+        if watchdog:
+            self.watchdog_task = asyncio.create_task(watchdog.run(debug_slow_callbacks=settings.loop_debug))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            "Startup finished in %.1f ms (commands %s).", elapsed_ms, "synced" if synced else "unchanged",
+            extra={"duration_ms": round(elapsed_ms, 2)}
+        )
+
+    async def close(self):
+        await limiter.close()
+        await super().close()
+
+    def command_tree_hash(self) -> str:
+        """Stable hash of the slash command definitions sent to Discord."""
+        payload = []
+        for command in self.tree.get_commands():
+            try:
+                payload.append(command.to_dict(self.tree))
+            except TypeError:  # discord.py < 2.4
+                payload.append(command.to_dict())
+        raw = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    async def sync_commands(self) -> bool:
+        """Sync the command tree only when its definition changed since the last sync."""
+        current = self.command_tree_hash()
+        try:
+            previous = settings.command_hash_file.read_text().strip()
+        except OSError:
+            previous = None
+        if current == previous:
+            return False
+
+        await self.tree.sync()
+        try:
+            settings.command_hash_file.write_text(current)
+        except OSError as exc:
+            logger.warning("Couldn't store command tree hash: %s", exc)
+        return True
+
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix="/", intents=intents)
+bot = CyberBot(command_prefix="/", intents=intents, shard_count=settings.shard_count, shard_ids=settings.shard_ids, tree_cls=CyberTree)
 
 # === Event hook === #
 @bot.event
 async def on_ready():
-    await bot.tree.sync()
-    logger.info(f"✅ CyberBot connected as {bot.user} and ready.")
-    if not scheduler.running:
-        scheduler.start()
+    # Fires again after every reconnect: keep it free of one-time startup work
+    logger.info("✅ CyberBot connected as %s and ready (shards %s of %s).", bot.user, sorted(bot.shards), bot.shard_count)
+
+@bot.event
+async def on_shard_ready(shard_id: int):
+    logger.info("Shard %d ready.", shard_id)
 
 
 # === Slash Commands === #
 
-# /events — list all events
+# /events — list upcoming events, one page at a time
 @bot.tree.command(name="events", description="List upcoming club events.")
 async def events(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    async with APIClient(EVENTS_ENDPOINT) as api:
-        events = await api.get_events()
+    view = EventsView(EVENTS_ENDPOINT, page_size=EVENTS_PAGE_SIZE)
+    first_page = view.store_page(0, await content.get("events") or [])
 
-    if not events:
+    if not first_page:
         await interaction.followup.send("📭 No upcoming events found.")
         return
 
-    embed = discord.Embed(title="Upcoming Club Events", color=discord.Color.blue())
-    for e in events:
-        embed.add_field(
-            name=f"{e.get('title', 'Untitled')} — {e.get('date', 'TBD')}",
-            value=f"{e.get('description', '')}\n📍 {e.get('location', '')}",
-            inline=False
-        )
-    await interaction.followup.send(embed=embed)
+    view.update_buttons()
+    view.message = await interaction.followup.send(embed=view.build_embed(first_page), view=view, wait=True)
 
 
 # /add_event — add a new event
 @bot.tree.command(name="add_event", description="Add a new club event (Admin only).")
 @app_commands.describe(
     title="Title of the event",
-    date="Please use this format: YYYY-MM-DDTHH:MM:SS",
+    date="UTC, e.g. 2026-10-19 18:00 or YYYY-MM-DDTHH:MM:SS",
     description="Brief event description",
     location="Event location or link"
 )
@@ -83,23 +346,22 @@ async def add_event(interaction: discord.Interaction, title: str, date: str, des
         await interaction.response.send_message("❌ You lack permission to add events.", ephemeral=True)
         return
 
+    if parse_event_date(date.strip()) is None:
+        await interaction.response.send_message("⚠️ Unrecognized date, use YYYY-MM-DD HH:MM (UTC) or an ISO date.", ephemeral=True)
+        return
+
     event_data = {"title": title, "date": date, "description": description, "location": location}
     async with APIClient(EVENTS_ENDPOINT) as api:
         result = await api.create_event(event_data)
+    content.invalidate("events")
+    if result:
+        reminders.upsert(result)
 
+    # The announcement is posted by the outbox worker once the backend has committed the event
     if result:
         await interaction.response.send_message(f"✅ Event **'{title}'** added successfully!")
     else:
         await interaction.response.send_message("⚠️ Failed to add event.", ephemeral=True)
-    channel = bot.get_channel(EVENTS_CHANNEL_ID)
-    if channel:
-        await channel.send(
-            f"📢 **New Event Added!**\n"
-            f"**Title:** {event_data['title']}\n"
-            f"📅 **Date:** {event_data['date']}\n"
-            f"📍 **Location:** {event_data.get('location', 'Not specified')}\n"
-            f"📝 **Description:** {event_data.get('description', 'No description')}"
-        )
 
 
 
@@ -132,9 +394,15 @@ async def update_event(interaction: discord.Interaction, current_title: str, new
     if not update_data:
         await interaction.response.send_message("⚠️ No fields provided to update.", ephemeral=True)
         return
+    if date and parse_event_date(date.strip()) is None:
+        await interaction.response.send_message("⚠️ Unrecognized date, use YYYY-MM-DD HH:MM (UTC) or an ISO date.", ephemeral=True)
+        return
 
     async with APIClient(EVENTS_ENDPOINT) as api:
         updated = await api.update_event(current_title, update_data)
+    content.invalidate("events")
+    if updated:
+        reminders.upsert(updated)
 
     if updated:
         await interaction.response.send_message(f"✅ Event **'{current_title}'** updated successfully!")
@@ -152,24 +420,28 @@ async def remove_event(interaction: discord.Interaction, event_title: str):
 
     async with APIClient(EVENTS_ENDPOINT) as api:
         success = await api.delete_event(event_title)
+    content.invalidate("events")
+    if success:
+        reminders.remove(event_title)
 
     if success:
         await interaction.response.send_message(f"🗑️ Event deleted successfully.")
     else:
         await interaction.response.send_message("⚠️ Event not found or could not be removed.", ephemeral=True)
 
+@tracked_job(PRUNE_JOB_ID, settings.api_base_url, leader)
 async def prune_finished_events():
     """
     Fetch events from the API and delete any whose 'date' is more than 10 minutes in the past.
-    Tries to parse a few common date formats (handles trailing 'Z'), and will attempt deletion
-    by title first, then by id/_id as a fallback.
+    Tries to parse a few common date formats (handles trailing 'Z') and deletes each expired
+    event by id (or title when no id is present) with a single API call.
     """
     logger.debug("Running prune_finished_events job...")
     async with APIClient(EVENTS_ENDPOINT) as api:
         try:
             events = await api.get_events()
         except Exception as exc:
-            logger.error(f"Failed to fetch events for pruning: {exc}")
+            logger.error("Failed to fetch events for pruning: %s", exc)
             return
 
         if not events:
@@ -181,96 +453,59 @@ async def prune_finished_events():
             if not date_str:
                 continue
 
-            ev_dt = None
-
-            # Try fromisoformat directly and with 'Z' -> +00:00 replacement
-            try_strings = [date_str]
-            if date_str.endswith("Z"):
-                try_strings.append(date_str.replace("Z", "+00:00"))
-
-            for ds in try_strings:
-                try:
-                    ev_dt = datetime.fromisoformat(ds)
-                    break
-                except Exception:
-                    continue
-
-            # Fallback to common strptime formats
+            ev_dt = parse_event_date(date_str)
             if ev_dt is None:
-                fmts = [
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S.%f",
-                    "%Y-%m-%d %H:%M:%S",
-                    "%Y-%m-%d"
-                ]
-                for fmt in fmts:
-                    try:
-                        ev_dt = datetime.strptime(date_str, fmt)
-                        break
-                    except Exception:
-                        continue
-
-            if ev_dt is None:
-                logger.warning(f"Unable to parse event date '{date_str}' for event {ev.get('title') or ev.get('id') or ev.get('_id')}")
+                logger.warning("Unable to parse event date '%s' for event %s", date_str, ev.get("title") or ev.get("id") or ev.get("_id"))
                 continue
 
-            if ev_dt.tzinfo is None:
-                ev_dt = ev_dt.replace(tzinfo=timezone.utc)
-
             if now - ev_dt > timedelta(minutes=10):
-                # Try deleting by title first, then id/_id as fallback
-                title = ev.get("title")
-                id_ = ev.get("id") or ev.get("_id")
-                candidates = []
-                if title:
-                    candidates.append(title)
-                if id_:
-                    candidates.append(id_)
-
-                if not candidates:
-                    logger.warning(f"No identifier found for expired event (date={date_str}).")
+                # The backend resolves either an id or a title in a single query
+                ident = ev.get("id") or ev.get("_id") or ev.get("title")
+                if not ident:
+                    logger.warning("No identifier found for expired event (date=%s).", date_str)
                     continue
 
-                deleted = False
-                for ident in candidates:
-                    try:
-                        deleted = await api.delete_event(ident)
-                    except Exception as exc:
-                        logger.error(f"Error deleting event {ident}: {exc}")
-                        deleted = False
-
-                    if deleted:
-                        event_title = title or str(ident)
-                        logger.info(f"Pruned event ({event_title}) — ended >10 minutes ago.")
-                        channel = bot.get_channel(EVENTS_CHANNEL_ID)
-                        if channel:
-                            try:
-                                await channel.send(f"🗑️ Event **{event_title}** has been removed (ended >1 hour ago).")
-                            except Exception as send_exc:
-                                logger.debug(f"Couldn't notify channel about pruned event: {send_exc}")
-                        break
-                    else:
-                        logger.debug(f"API refused to delete event using identifier: {ident}")
+                try:
+                    deleted = await api.delete_event(ident)
+                except Exception as exc:
+                    logger.error("Error deleting event %s: %s", ident, exc)
+                    deleted = False
 
                 if not deleted:
-                    logger.warning(f"Failed to delete expired event (tried identifiers: {candidates})")
+                    logger.warning("Failed to delete expired event %s", ident)
+                    continue
+
+                # The removal notice is queued by the backend and posted by the outbox worker
+                logger.info("Pruned event (%s) — ended >10 minutes ago.", ev.get("title") or ident)
+                content.invalidate("events")
+
+
+jobs.add(
+    prune_finished_events, IntervalTrigger(seconds=60),
+    id=PRUNE_JOB_ID, misfire_grace_time=30
+)
 
+@tracked_job("sync_event_reminders", settings.api_base_url, leader)
+async def sync_event_reminders():
+    await sync_reminders()
 
-scheduler.add_job(prune_finished_events, IntervalTrigger(seconds=60))
+jobs.add(
+    sync_event_reminders, IntervalTrigger(minutes=settings.reminder_resync_minutes),
+    id="sync_event_reminders", misfire_grace_time=60
+)
 
 # /cyberfact — random fact
 @bot.tree.command(name="cyberfact", description="Get a random cybersecurity fact.")
 async def cyberfact(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    async with APIClient(FACTS_ENDPOINT) as api:
-        facts = await api.get_facts()
+    facts = await content.get("facts")
 
     if not facts:
         await interaction.followup.send("📭 No cybersecurity facts available.")
         return
 
-    fact = random.choice(facts)
-    await interaction.followup.send(f"💡 **Cyber Fact:** {fact.get('content', str(fact))}")
+    fact = facts.sample()
+    await interaction.followup.send(f"💡 **Cyber Fact:** {fact.content}")
 
 
 # /add_fact — add a fact (admin-only)
@@ -283,6 +518,7 @@ async def add_fact(interaction: discord.Interaction, fact: str):
         result = await api.create_fact(payload)
 
     if result:
+        content.apply("facts", "create", result)
         await interaction.response.send_message("✅ Cybersecurity fact added successfully!", ephemeral=True)
     else:
         await interaction.response.send_message("⚠️ Failed to add fact.", ephemeral=True)
@@ -290,52 +526,80 @@ async def add_fact(interaction: discord.Interaction, fact: str):
 # === DAILY FACT SCHEDULER === #
 
 
+@tracked_job("send_daily_fact", settings.api_base_url, leader)
 async def send_daily_fact():
     #Send a random cybersecurity fact once per day.#
-    channel = bot.get_channel(CHANNEL_ID)
+    channel = bot.get_channel(settings.daily_fact_channel_id)
     if channel is None:
-        print("Channel not found. Check the channel ID in .env.")
+        logger.warning("Daily fact channel not found. Check the channel ID in .env.")
         return
 
-    async with APIClient(FACTS_ENDPOINT) as api:
-        facts = await api.get_facts()
-        fact = random.choice(facts)
+    # One random fact picked by the backend, rather than reloading the whole collection
+    async with APIClient(settings.api_base_url) as api:
+        result = await api.batch({"facts": {"sample": 1, "fields": ["content"]}})
+    facts = result.get("facts")
 
-    if fact:
-        await channel.send(f"**Cybersecurity Fact of the Day**\n> {fact['content']}")
-    else:
-        await channel.send("Couldn't fetch a fact today — please check the API.")
+    if not facts:
+        logger.warning("No fact available for the daily post, skipped.")
+        return
+    await channel.send(f"**Cybersecurity Fact of the Day**\n> {facts[0].get('content', '')}")
 
-scheduler.add_job(send_daily_fact, CronTrigger(hour=18, minute=30, timezone="Africa/Algiers"))
+jobs.add(
+    send_daily_fact, CronTrigger(hour=18, minute=30, timezone="Africa/Algiers"),
+    id="send_daily_fact"
+)
+
+# === Content digests === #
+# A fact, a quote, a joke and the week's events in one embed, per configured channel.
+# Each digest is composed DIGEST_PREPARE_MINUTES ahead so the post itself goes out on time.
+digests = DigestPublisher(settings.api_base_url, parse_digests(settings.digests))
+
+@tracked_job("prepare_digest", settings.api_base_url, leader)
+async def prepare_digest(key: str):
+    await digests.prepare(key)
+
+@tracked_job("publish_digest", settings.api_base_url, leader)
+async def publish_digest(key: str):
+    digest = digests.digests.get(key)
+    await digests.publish(key, bot.get_channel(digest.channel_id) if digest else None)
+
+prepare_lead = timedelta(minutes=settings.digest_prepare_minutes)
+for digest in digests.digests.values():
+    jobs.add(
+        prepare_digest, digest.trigger("Africa/Algiers", prepare_lead), args=[digest.key],
+        id=f"prepare_digest:{digest.key}"
+    )
+    jobs.add(
+        publish_digest, digest.trigger("Africa/Algiers"), args=[digest.key],
+        id=f"publish_digest:{digest.key}"
+    )
 
 
 # /cyberjoke — random joke
 @bot.tree.command(name="cyberjoke", description="Get a random cybersecurity joke.")
 async def cyberjoke(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    async with APIClient(JOKES_ENDPOINT) as api:
-        jokes = await api.get_jokes()
+    jokes = await content.get("jokes")
 
     if not jokes:
         await interaction.followup.send("📭 No cybersecurity jokes available.")
         return
 
-    joke = random.choice(jokes)
-    await interaction.followup.send(f"💡 **Cyber joke:** {joke.get('content', str(joke))}")
+    joke = jokes.sample()
+    await interaction.followup.send(f"💡 **Cyber joke:** {joke.content}")
 
 # /cyberquote — random quote
 @bot.tree.command(name="cyberquote", description="Get a random cybersecurity quote.")
 async def cyberquote(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    async with APIClient(QUOTES_ENDPOINT) as api:
-        quotes = await api.get_quotes()
+    quotes = await content.get("quotes")
 
     if not quotes:
         await interaction.followup.send("📭 No cybersecurity quotes available.")
         return
 
-    quote = random.choice(quotes)
-    await interaction.followup.send(f"💡 **Cyber quote:** {quote.get('content', str(quote))}")
+    quote = quotes.sample()
+    await interaction.followup.send(f"💡 **Cyber quote:** {quote.content}")
 
 # /add_quote — add a quote (admin-only)
 @bot.tree.command(name="add_quote", description="Add a new cybersecurity quote (Admin only).")
@@ -347,6 +611,7 @@ async def add_quote(interaction: discord.Interaction, quote: str):
         result = await api.create_quote(payload)
 
     if result:
+        content.apply("quotes", "create", result)
         await interaction.response.send_message("✅ Cybersecurity quote added successfully!", ephemeral=True)
     else:
         await interaction.response.send_message("⚠️ Failed to add quote.", ephemeral=True)
@@ -362,25 +627,31 @@ async def add_joke(interaction: discord.Interaction, joke: str):
         result = await api.create_joke(payload)
 
     if result:
+        content.apply("jokes", "create", result)
         await interaction.response.send_message("✅ Cybersecurity joke added successfully!", ephemeral=True)
     else:
         await interaction.response.send_message("⚠️ Failed to add joke.", ephemeral=True)
 
 # /cyberquiz — Play a random quiz
 @bot.tree.command(name="cyberquiz", description="Test your cybersecurity knowledge with a random quiz!")
-async def cyberquiz(interaction: discord.Interaction):
+@app_commands.describe(category="Only questions of this category", difficulty="Only questions of this difficulty")
+@app_commands.choices(difficulty=[app_commands.Choice(name=level.title(), value=level) for level in ("easy", "medium", "hard")])
+async def cyberquiz(interaction: discord.Interaction, category: str = None, difficulty: app_commands.Choice[str] = None):
     await interaction.response.defer(thinking=True)
-    async with APIClient(QUIZ_ENDPOINT) as api:
-        quizzes = await api.get_quizzes()
+    category = category.strip().lower() if category else None
+    level = difficulty.value if difficulty else None
+
+    # Picked by the backend (favouring questions players tend to miss), prefetched in batches
+    quiz = await quiz_bank.next(category, level)
 
-    if not quizzes:
+    if quiz is None:
         await interaction.followup.send("📭 No quizzes available right now.")
         return
 
-    quiz = random.choice(quizzes)
-    question = quiz.get("question", "Unknown question")
-    options = quiz.get("options", [])
-    correct_option = quiz.get("correct_option", 0)
+    quiz_id = expand_id(quiz.id)
+    question = quiz.question
+    # One of the option orders prepared when the quiz was loaded, so the answer isn't always in the same place
+    options, correct_option = quiz.shuffled()
 
     if not options:
         await interaction.followup.send("⚠️ This quiz has no options defined.")
@@ -390,7 +661,8 @@ async def cyberquiz(interaction: discord.Interaction):
 
     async def make_callback(choice_index: int):
         async def callback(inter_btn: discord.Interaction):
-            if choice_index == correct_option:
+            correct = choice_index == correct_option
+            if correct:
                 await inter_btn.response.send_message("✅ Correct!", ephemeral=True)
             else:
                 await inter_btn.response.send_message(
@@ -400,6 +672,8 @@ async def cyberquiz(interaction: discord.Interaction):
             for child in view.children:
                 child.disabled = True
             await inter_btn.message.edit(view=view)
+            async with APIClient(QUIZ_ENDPOINT) as api:
+                await api.record_quiz_answer(quiz_id, correct)
         return callback
 
     for i, option in enumerate(options):
@@ -408,6 +682,7 @@ async def cyberquiz(interaction: discord.Interaction):
         view.add_item(button)
 
     embed = discord.Embed(title="🧠 Cybersecurity Quiz", description=question, color=discord.Color.orange())
+    embed.set_footer(text=f"{quiz.category} · {quiz.difficulty}")
     await interaction.followup.send(embed=embed, view=view)
 
 # /add_quiz — Add a new quiz (Admin only)
@@ -415,9 +690,12 @@ async def cyberquiz(interaction: discord.Interaction):
 @app_commands.describe(
     question="Quiz question text",
     options="Comma-separated list of options (e.g. A,B,C,D)",
-    correct_index="The number (starting from 1) of the correct answer"
+    correct_index="The number (starting from 1) of the correct answer",
+    category="Category of the question (default: general)",
+    difficulty="Difficulty of the question (default: medium)"
 )
-async def add_quiz(interaction: discord.Interaction, question: str, options: str, correct_index: int):
+@app_commands.choices(difficulty=[app_commands.Choice(name=level.title(), value=level) for level in ("easy", "medium", "hard")])
+async def add_quiz(interaction: discord.Interaction, question: str, options: str, correct_index: int, category: str = "general", difficulty: app_commands.Choice[str] = None):
     if not interaction.user.guild_permissions.administrator:
         await interaction.response.send_message("❌ You lack permission to add quizzes.", ephemeral=True)
         return
@@ -437,13 +715,16 @@ async def add_quiz(interaction: discord.Interaction, question: str, options: str
     quiz_data = {
         "question": question,
         "options": options_list,
-        "correct_option": correct_zero_based
+        "correct_option": correct_zero_based,
+        "category": category.strip().lower() or "general",
+        "difficulty": difficulty.value if difficulty else "medium"
     }
 
     async with APIClient(QUIZ_ENDPOINT) as api:
         result = await api.create_quiz(quiz_data)
 
     if result:
+        content.apply("quiz", "create", result)
         await interaction.response.send_message("✅ Quiz added successfully!", ephemeral=True)
     else:
         await interaction.response.send_message("⚠️ Failed to add quiz.", ephemeral=True)
@@ -453,8 +734,7 @@ async def add_quiz(interaction: discord.Interaction, question: str, options: str
 @bot.tree.command(name="about-shellmates", description="Learn about Shellmates club and its departments.")
 async def about_shellmates(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    async with APIClient(ABOUT_ENDPOINT) as api:
-        about_info = await api.get_about()
+    about_info = await content.get("about")
 
     if not about_info:
         await interaction.followup.send("📭 Could not retrieve club information.")
@@ -537,7 +817,7 @@ async def help_command(interaction: discord.Interaction):
     embed.add_field(name="/add_fact", value="Add a new fact (Admin only).", inline=False)
     embed.add_field(name="/cyberjoke", value="Get a random cybersecurity joke.", inline=False)
     embed.add_field(name="/add_joke", value="Add a new joke (Admin only).", inline=False)
-    embed.add_field(name="/cyberquiz", value="Play a random cybersecurity quiz.", inline=False)
+    embed.add_field(name="/cyberquiz", value="Play a cybersecurity quiz (optionally by category and difficulty).", inline=False)
     embed.add_field(name="/cyberquote", value="Get a random cybersecurity quote.", inline=False)
     embed.add_field(name="/add_quote", value="Add a new quote (Admin only).", inline=False)
     embed.add_field(name="/add_quiz", value="Add a new quiz (Admin only).", inline=False)
@@ -558,14 +838,14 @@ async def permission_error(interaction: discord.Interaction, error: Exception):
     if isinstance(error, app_commands.errors.MissingPermissions):
         await interaction.response.send_message("❌ You lack administrator permissions.", ephemeral=True)
     else:
-        logger.error(f"Unhandled error in command: {error}")
+        logger.error("Unhandled error in command: %s", error)
         await interaction.response.send_message("⚠️ An unexpected error occurred.", ephemeral=True)
 
 
 # === Run the Bot === #
 if __name__ == "__main__":
-    if not TOKEN:
-        raise ValueError("❌ DISCORD_TOKEN not found in environment.")
-    bot.run(TOKEN)
+    settings.require("token")
+    setup_logging("bot")
+    bot.run(settings.token)
 
 
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from api_client import APIClient
+
+logger = logging.getLogger("CyberBot.cache")
+
+
+class ContentCache:
+    """
+    In-memory copy of the backend content the commands read.
+    Everything is loaded with one batched request at startup; afterwards each resource
+    is refreshed on its own once it is older than `ttl` seconds or has been invalidated.
+    `builders` optionally turn a raw API result into another structure before caching it.
+
+    Resources patched in place by `apply` don't expire while `live()` is true (e.g. while the
+    change feed delivering the patches is healthy): reloading them would only rebuild the
+    same data. They fall back to the TTL as soon as it turns false.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        queries: Dict[str, Dict[str, Any]],
+        ttl: float = 300,
+        builders: Optional[Dict[str, Callable[[Any], Any]]] = None,
+        live: Optional[Callable[[], bool]] = None
+    ):
+        self.base_url = base_url
+        self.queries = queries
+        self.ttl = ttl
+        self.builders = builders or {}
+        self.live = live
+        self._data: Dict[str, Any] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {name: asyncio.Lock() for name in queries}
+
+    async def _fetch(self, names) -> Dict[str, Any]:
+        async with APIClient(self.base_url) as api:
+            result = await api.batch({name: self.queries[name] for name in names})
+        now = time.monotonic()
+        for name in names:
+            if name in result:
+                builder = self.builders.get(name)
+                self._data[name] = builder(result[name]) if builder else result[name]
+                self._loaded_at[name] = now
+        return result
+
+    async def preload(self) -> float:
+        """Load every resource in a single round trip; returns the elapsed seconds."""
+        started = time.perf_counter()
+        result = await self._fetch(list(self.queries))
+        elapsed = time.perf_counter() - started
+        missing = set(self.queries) - set(result)
+        if missing:
+            logger.warning("Preload could not fetch: %s", ", ".join(sorted(missing)))
+        logger.info(
+            "Preloaded %d/%d resources in %.1f ms.", len(result), len(self.queries), elapsed * 1000,
+            extra={"duration_ms": round(elapsed * 1000, 2)}
+        )
+        for name, value in self._data.items():
+            if hasattr(value, "memory_usage") and logger.isEnabledFor(logging.INFO):
+                logger.info("  %s: %d items, %.1f KiB", name, len(value), value.memory_usage() / 1024)
+        return elapsed
+
+    def peek(self, name: str) -> Optional[Any]:
+        """The cached value, fresh or not, without triggering a fetch."""
+        return self._data.get(name)
+
+    def is_fresh(self, name: str) -> bool:
+        loaded_at = self._loaded_at.get(name)
+        if loaded_at is None:
+            return False
+        if time.monotonic() - loaded_at < self.ttl:
+            return True
+        return self.live is not None and hasattr(self._data.get(name), "upsert") and self.live()
+
+    async def get(self, name: str) -> Optional[Any]:
+        """Return the cached resource, refetching it first if it is stale."""
+        if self.is_fresh(name):
+            return self._data[name]
+        async with self._locks[name]:
+            # Another command may have refreshed it while we waited
+            if not self.is_fresh(name):
+                await self._fetch([name])
+        return self._data.get(name)
+
+    def invalidate(self, name: str):
+        """Force the next read of `name` to hit the backend (e.g. after a write)."""
+        self._loaded_at.pop(name, None)
+
+    def invalidate_all(self):
+        self._loaded_at.clear()
+
+    def apply(self, name: str, operation: str, doc: Dict[str, Any]):
+        """
+        Apply one created, updated or deleted document in place. Resources kept in a
+        content store are patched without refetching; anything else is invalidated.
+        """
+        value = self._data.get(name)
+        if not hasattr(value, "upsert"):
+            self.invalidate(name)
+        elif operation == "delete":
+            value.remove(doc["id"])
+        else:
+            value.upsert(doc)
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from api_client import APIClient
+
+logger = logging.getLogger("CyberBot.changefeed")
+
+ApplyChange = Callable[[Dict[str, Any]], None]
+
+# Missed polls after which the feed stops counting as healthy
+HEALTHY_POLLS = 3
+
+
+class ChangeFeed:
+    """
+    Follows the backend change journal (GET /changes) and applies every journaled write
+    to the bot's in-memory state, so caches stay current without re-reading collections.
+
+    `prime` must run before the first full load: changes made while loading are then
+    replayed on top of it rather than missed. When the backend reports that the feed
+    position expired, `on_reset` reloads everything.
+
+    The feed is `healthy` while its polls keep succeeding: the state it maintains is then
+    current, and the periodic full reloads it replaces can be skipped.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        apply: ApplyChange,
+        on_reset: Callable[[], Awaitable[None]],
+        interval: float = 5,
+        batch: int = 500
+    ):
+        self.base_url = base_url
+        self.apply = apply
+        self.on_reset = on_reset
+        self.interval = interval
+        self.batch = batch
+        self.last_seq = None
+        self._polled_at: Optional[float] = None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the last successful poll is recent (within a few intervals)."""
+        return (
+            self.last_seq is not None and self._polled_at is not None
+            and time.monotonic() - self._polled_at < self.interval * HEALTHY_POLLS
+        )
+
+    async def prime(self):
+        """Start from the current head of the journal."""
+        async with APIClient(self.base_url) as api:
+            page = await api.get_changes(0, limit=1)
+        if page is not None:
+            self.last_seq = page["head"]
+            self._polled_at = time.monotonic()
+            logger.info("Following the change feed from #%d.", self.last_seq)
+
+    async def poll_once(self) -> int:
+        """Apply every change available now; returns how many were applied."""
+        if self.last_seq is None:
+            await self.prime()
+            return 0
+        applied = 0
+        async with APIClient(self.base_url) as api:
+            while True:
+                page = await api.get_changes(self.last_seq, limit=self.batch)
+                if page is None:
+                    break
+                self._polled_at = time.monotonic()
+                if page["reset"]:
+                    logger.warning("Change feed position #%d expired, reloading everything.", self.last_seq)
+                    self.last_seq = page["head"]
+                    await self.on_reset()
+                    break
+                for change in page["changes"]:
+                    try:
+                        self.apply(change)
+                    except Exception:
+                        logger.exception("Couldn't apply change #%s", change.get("seq"))
+                    applied += 1
+                caught_up = page["last_seq"] == self.last_seq or page["last_seq"] >= page["head"]
+                self.last_seq = page["last_seq"]
+                if caught_up:
+                    break
+        if applied:
+            logger.debug("Applied %d change(s), now at #%d.", applied, self.last_seq)
+        return applied
+
+    async def run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except Exception:
+                logger.exception("Change feed poll failed")
+            await asyncio.sleep(self.interval)
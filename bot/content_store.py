@@ -0,0 +1,210 @@
+import math
+import random
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+
+def compact_id(value: str) -> bytes:
+    """A 24-char hex ObjectId packed into its 12 raw bytes (other ids are kept as UTF-8)."""
+    try:
+        return bytes.fromhex(value) if len(value) == 24 else value.encode()
+    except ValueError:
+        return value.encode()
+
+
+def expand_id(value: bytes) -> str:
+    """Inverse of compact_id."""
+    return value.hex() if len(value) == 12 else value.decode()
+
+
+def intern_text(value: Any) -> str:
+    """Intern short, frequently repeated strings (authors, options, locations)."""
+    return sys.intern(str(value)) if value is not None else ""
+
+
+# Distinct option orders prepared for each quiz the first time it is played (fewer when the options allow fewer)
+SHUFFLES_PER_QUIZ = 8
+
+
+def build_shuffles(option_count: int, count: int = SHUFFLES_PER_QUIZ) -> bytes:
+    """
+    `count` distinct permutations of range(option_count), packed one byte per index:
+    permutation k is shuffles[k * option_count:(k + 1) * option_count].
+    """
+    if not 0 < option_count <= 255:
+        return b""
+    count = min(count, math.factorial(option_count))
+    order = list(range(option_count))
+    permutations = set()
+    while len(permutations) < count:
+        random.shuffle(order)
+        permutations.add(bytes(order))
+    return b"".join(permutations)
+
+
+# === Records === #
+# Slotted dataclasses: no per-instance __dict__, fields only.
+
+@dataclass(slots=True)
+class FactRecord:
+    id: bytes
+    content: str
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "FactRecord":
+        return cls(compact_id(doc["id"]), doc.get("content", ""))
+
+
+@dataclass(slots=True)
+class JokeRecord:
+    id: bytes
+    content: str
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "JokeRecord":
+        return cls(compact_id(doc["id"]), doc.get("content", ""))
+
+
+@dataclass(slots=True)
+class QuoteRecord:
+    id: bytes
+    content: str
+    author: str
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "QuoteRecord":
+        return cls(compact_id(doc["id"]), doc.get("content", ""), intern_text(doc.get("author") or "Unknown"))
+
+
+@dataclass(slots=True)
+class QuizRecord:
+    id: bytes
+    question: str
+    options: Tuple[str, ...]
+    correct_option: int
+    category: str
+    difficulty: str
+    shuffles: bytes = b""  # option orders prepared on first use, see build_shuffles
+
+    @classmethod
+    def from_dict(cls, doc: Dict[str, Any]) -> "QuizRecord":
+        options = tuple(intern_text(option) for option in doc.get("options", []))
+        return cls(
+            compact_id(doc["id"]),
+            doc.get("question", "Unknown question"),
+            options,
+            int(doc.get("correct_option", 0)),
+            intern_text(doc.get("category") or "general"),
+            intern_text(doc.get("difficulty") or "medium")
+        )
+
+    def shuffled(self) -> Tuple[Tuple[str, ...], int]:
+        """
+        The options in one of the prepared random orders, and where the correct one ended up.
+        Orders are prepared here rather than on load, so a (re)load of the whole store stays cheap.
+        """
+        count = len(self.options)
+        if not 0 <= self.correct_option < count:
+            return self.options, self.correct_option
+        if not self.shuffles:
+            self.shuffles = build_shuffles(count)
+            if not self.shuffles:
+                return self.options, self.correct_option
+        start = random.randrange(len(self.shuffles) // count) * count
+        order = self.shuffles[start:start + count]
+        return tuple(self.options[i] for i in order), order.find(self.correct_option)
+
+
+R = TypeVar("R")
+
+
+class ContentStore(Generic[R]):
+    """
+    Compact local replica of one content collection.
+
+    Records sit in a dense list so a random pick is one randrange; an id -> position map
+    gives O(1) updates, and deletes swap the last record into the freed slot.
+    """
+
+    def __init__(self, from_dict: Callable[[Dict[str, Any]], R], docs: Iterable[Dict[str, Any]] = ()):
+        self.from_dict = from_dict
+        self._records: List[R] = []
+        self._positions: Dict[bytes, int] = {}
+        for doc in docs:
+            self.upsert(doc)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[R]:
+        return iter(self._records)
+
+    def sample(self) -> Optional[R]:
+        """A uniformly random record, or None when the store is empty."""
+        if not self._records:
+            return None
+        return self._records[random.randrange(len(self._records))]
+
+    def get(self, item_id: str) -> Optional[R]:
+        position = self._positions.get(compact_id(item_id))
+        return self._records[position] if position is not None else None
+
+    def upsert(self, doc: Dict[str, Any]):
+        if not doc.get("id"):
+            return
+        record = self.from_dict(doc)
+        position = self._positions.get(record.id)
+        if position is None:
+            self._positions[record.id] = len(self._records)
+            self._records.append(record)
+        else:
+            self._records[position] = record
+
+    def remove(self, item_id: str) -> bool:
+        key = compact_id(item_id)
+        position = self._positions.pop(key, None)
+        if position is None:
+            return False
+        last = self._records.pop()
+        if position < len(self._records):
+            # Swap-remove: move the last record into the hole instead of shifting the list
+            self._records[position] = last
+            self._positions[last.id] = position
+        return True
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the store (containers, records and distinct field values)."""
+        seen = set()
+        total = sys.getsizeof(self._records) + sys.getsizeof(self._positions)
+
+        def add(obj):
+            nonlocal total
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+
+        for record in self._records:
+            add(record)
+            for field in record.__slots__:
+                value = getattr(record, field)
+                add(value)
+                if isinstance(value, tuple):
+                    for item in value:
+                        add(item)
+        for position in self._positions.values():
+            add(position)
+        return total
+
+
+# Resource name -> record type, for the stores the bot keeps
+RECORD_TYPES = {
+    "facts": FactRecord,
+    "jokes": JokeRecord,
+    "quotes": QuoteRecord,
+    "quiz": QuizRecord
+}
+
+
+def build_store(name: str, docs: Iterable[Dict[str, Any]]) -> ContentStore:
+    return ContentStore(RECORD_TYPES[name].from_dict, docs)
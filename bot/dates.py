@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+# Formats tried after datetime.fromisoformat, for dates typed by hand
+FALLBACK_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d"
+]
+
+
+def parse_event_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an event date into an aware datetime (naive dates are taken as UTC).
+    Handles ISO strings, a trailing 'Z' and a few common formats; returns None otherwise.
+    """
+    if not date_str:
+        return None
+
+    ev_dt = None
+    for ds in (date_str, date_str.replace("Z", "+00:00")) if date_str.endswith("Z") else (date_str,):
+        try:
+            ev_dt = datetime.fromisoformat(ds)
+            break
+        except ValueError:
+            continue
+
+    if ev_dt is None:
+        for fmt in FALLBACK_FORMATS:
+            try:
+                ev_dt = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+
+    if ev_dt is None:
+        return None
+    if ev_dt.tzinfo is None:
+        ev_dt = ev_dt.replace(tzinfo=timezone.utc)
+    return ev_dt
@@ -0,0 +1,134 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import discord
+from apscheduler.triggers.cron import CronTrigger
+
+from api_client import APIClient
+
+logger = logging.getLogger("CyberBot.digest")
+
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+# Everything a digest shows, fetched in one batched request
+DIGEST_QUERY = {
+    "facts": {"sample": 1, "fields": ["content"]},
+    "quotes": {"sample": 1, "fields": ["content", "author"]},
+    "jokes": {"sample": 1, "fields": ["content"]},
+    "events": {"days": 7, "limit": 10, "fields": ["title", "date", "location"]}
+}
+
+
+class Digest(NamedTuple):
+    channel_id: int
+    frequency: str          # "daily" or "weekly"
+    day: Optional[str]      # weekly only: "mon" ... "sun"
+    hour: int
+    minute: int
+
+    @property
+    def key(self) -> str:
+        """Unique per schedule: a channel may have several digests (e.g. weekly on mon and thu)."""
+        when = f"{self.frequency}:{self.day}" if self.day else self.frequency
+        return f"{self.channel_id}:{when}@{self.hour:02d}:{self.minute:02d}"
+
+    def trigger(self, timezone: str, lead: timedelta = timedelta(0)) -> CronTrigger:
+        """Cron trigger firing `lead` before the digest is due (lead < 1 day)."""
+        minutes = self.hour * 60 + self.minute - int(lead.total_seconds() // 60)
+        day = self.day
+        if minutes < 0:
+            minutes += 24 * 60
+            if day:
+                day = DAYS[(DAYS.index(day) - 1) % len(DAYS)]
+        return CronTrigger(day_of_week=day, hour=minutes // 60, minute=minutes % 60, timezone=timezone)
+
+
+def parse_digests(raw: str) -> List[Digest]:
+    """
+    Parse "<channel_id>=daily@18:30;<channel_id>=weekly:mon@09:00" into digest schedules.
+    """
+    digests = []
+    for spec in filter(None, (s.strip() for s in raw.split(";"))):
+        channel, _, schedule = spec.partition("=")
+        when, _, time_of_day = schedule.partition("@")
+        frequency, _, day = when.partition(":")
+        hour, _, minute = time_of_day.partition(":")
+        if frequency not in ("daily", "weekly") or (frequency == "weekly") != bool(day):
+            raise ValueError(f"Invalid digest schedule '{spec}' (expected daily@HH:MM or weekly:<day>@HH:MM)")
+        if day and day not in DAYS:
+            raise ValueError(f"Unknown day '{day}' in digest schedule '{spec}'")
+        digests.append(Digest(int(channel), frequency, day or None, int(hour), int(minute or 0)))
+    return digests
+
+
+def build_embed(digest: Digest, data: Dict[str, Any]) -> discord.Embed:
+    title = "🗞️ Daily Cyber Digest" if digest.frequency == "daily" else "🗞️ Weekly Cyber Digest"
+    embed = discord.Embed(title=title, color=discord.Color.blue())
+
+    facts, quotes, jokes = data.get("facts") or [], data.get("quotes") or [], data.get("jokes") or []
+    if facts:
+        embed.add_field(name="💡 Fact", value=facts[0].get("content", "")[:1024], inline=False)
+    if quotes:
+        quote = quotes[0]
+        embed.add_field(
+            name="💬 Quote",
+            value=f"“{quote.get('content', '')}” — {quote.get('author') or 'Unknown'}"[:1024],
+            inline=False
+        )
+    if jokes:
+        embed.add_field(name="😄 Joke", value=jokes[0].get("content", "")[:1024], inline=False)
+
+    upcoming = data.get("events") or []
+    if upcoming:
+        lines = [
+            f"**{event.get('title', 'Untitled')}** — {event.get('date', 'TBD')} ({event.get('location') or 'TBA'})"
+            for event in upcoming
+        ]
+        embed.add_field(name="📅 This week", value="\n".join(lines)[:1024], inline=False)
+    else:
+        embed.add_field(name="📅 This week", value="No upcoming events.", inline=False)
+    return embed
+
+
+class DigestPublisher:
+    """
+    Composes digests ahead of time and posts them on schedule.
+
+    `prepare` runs shortly before the send time and renders the embed from a single batched
+    API call; `publish` then only has to send it. If nothing was prepared (e.g. the bot
+    restarted in between), `publish` renders it on the spot.
+    """
+
+    def __init__(self, base_url: str, digests: List[Digest]):
+        self.base_url = base_url
+        self.digests = {digest.key: digest for digest in digests}
+        self._prepared: Dict[str, discord.Embed] = {}
+
+    async def render(self, digest: Digest) -> Optional[discord.Embed]:
+        async with APIClient(self.base_url) as api:
+            data = await api.batch(DIGEST_QUERY)
+        if not data:
+            return None
+        return build_embed(digest, data)
+
+    async def prepare(self, key: str):
+        digest = self.digests.get(key)
+        if digest is None:
+            return
+        embed = await self.render(digest)
+        if embed is not None:
+            self._prepared[key] = embed
+
+    async def publish(self, key: str, channel: Optional[discord.abc.Messageable]):
+        digest = self.digests.get(key)
+        if digest is None:
+            return
+        if channel is None:
+            logger.warning("Digest channel %s not found, digest dropped.", digest.channel_id)
+            return
+        embed = self._prepared.pop(key, None) or await self.render(digest)
+        if embed is None:
+            logger.warning("Couldn't compose the %s digest for channel %s.", digest.frequency, digest.channel_id)
+            return
+        await channel.send(embed=embed)
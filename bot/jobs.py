@@ -0,0 +1,91 @@
+import functools
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict
+
+from api_client import APIClient
+from leader import LeaderLease
+from logging_setup import bind, unbind
+
+logger = logging.getLogger("CyberBot.jobs")
+
+
+def tracked_job(job_id: str, base_url: str, lease: LeaderLease):
+    """
+    Wrap a scheduled coroutine so it only runs on the current leader and every
+    execution (start, end, duration, outcome) is written to the backend job history.
+
+    The wrapper keeps the wrapped function's name, so persistent job stores that
+    reference jobs by "module:function" keep resolving it across restarts.
+    """
+    def decorator(func: Callable[[], Awaitable[None]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started_at = datetime.now(timezone.utc)
+            started = time.perf_counter()
+            outcome, error = "success", None
+            # Tags the job's logs and the backend writes it makes (X-Actor)
+            token = bind(job=job_id)
+            try:
+                if not lease.is_leader:
+                    # Fencing: the lease may have moved since the scheduler fired this job
+                    outcome = "skipped"
+                else:
+                    try:
+                        await func(*args, **kwargs)
+                    except Exception as exc:
+                        outcome, error = "error", repr(exc)
+                        logger.exception("Scheduled job '%s' failed.", job_id)
+
+                run = {
+                    "job_id": job_id,
+                    "owner": lease.owner,
+                    "started_at": started_at.isoformat(),
+                    "finished_at": datetime.now(timezone.utc).isoformat(),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    "outcome": outcome,
+                    "error": error
+                }
+                async with APIClient(base_url) as api:
+                    await api.record_job_run(run)
+            finally:
+                unbind(token)
+        return wrapper
+    return decorator
+
+
+class PersistentJobs:
+    """
+    Jobs declared at import time and registered once the persistent job store is attached.
+
+    `scheduler.add_job(..., replace_existing=True)` would recompute every next run time from
+    now and overwrite the stored one, so a run missed while the bot was down would never
+    fire. `sync` only adds the jobs the store doesn't know yet, updates the options of the
+    others in place and reschedules a job only when its trigger actually changed.
+    """
+
+    def __init__(self):
+        self.specs: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, func: Callable, trigger, id: str, **options):
+        self.specs[id] = {"func": func, "trigger": trigger, **options}
+
+    def sync(self, scheduler):
+        for job in scheduler.get_jobs():
+            if job.id not in self.specs:
+                logger.info("Removing scheduled job '%s': no longer declared.", job.id)
+                scheduler.remove_job(job.id)
+
+        for job_id, spec in self.specs.items():
+            options = dict(spec)
+            trigger = options.pop("trigger")
+            job = scheduler.get_job(job_id)
+            if job is None:
+                scheduler.add_job(trigger=trigger, id=job_id, **options)
+                continue
+            # Keeps the stored next run time, so a missed run still fires once on start
+            scheduler.modify_job(job_id, **options)
+            if str(job.trigger) != str(trigger) or getattr(job.trigger, "timezone", None) != getattr(trigger, "timezone", None):
+                logger.info("Rescheduling job '%s': %s -> %s", job_id, job.trigger, trigger)
+                scheduler.reschedule_job(job_id, trigger=trigger)
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Optional
+
+from api_client import APIClient
+
+logger = logging.getLogger("CyberBot.leader")
+
+
+def process_id() -> str:
+    """Identifies this bot process among all the others sharing the backend (host:pid)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderLease:
+    """
+    Lease-based leader election through the backend lock endpoint.
+    Every bot process runs one of these; exactly one of them holds the lease at a time
+    and is the only one allowed to run scheduled jobs.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        name: str,
+        ttl_seconds: int = 30,
+        on_elected: Optional[Callable[[], Awaitable[None]]] = None,
+        on_demoted: Optional[Callable[[], Awaitable[None]]] = None
+    ):
+        self.base_url = base_url
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = process_id()
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+        self._valid_until = 0.0
+
+    async def _try_acquire(self) -> Optional[bool]:
+        async with APIClient(self.base_url) as api:
+            return await api.acquire_lock(self.name, self.owner, self.ttl_seconds)
+
+    async def _set_leader(self, leader: bool):
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        if leader:
+            logger.info("👑 %s elected leader for '%s'.", self.owner, self.name)
+            if self.on_elected:
+                await self.on_elected()
+        else:
+            logger.warning("%s lost leadership for '%s'.", self.owner, self.name)
+            if self.on_demoted:
+                await self.on_demoted()
+
+    async def run(self):
+        """Keep trying to acquire (or renew) the lease, forever."""
+        renew_every = max(self.ttl_seconds / 3, 1)
+        while True:
+            started = time.monotonic()
+            try:
+                acquired = await self._try_acquire()
+            except Exception as exc:
+                logger.error("Lease renewal for '%s' failed: %s", self.name, exc)
+                acquired = None
+
+            if acquired:
+                self._valid_until = started + self.ttl_seconds
+                await self._set_leader(True)
+            elif acquired is False or time.monotonic() >= self._valid_until:
+                # An unreachable backend keeps leadership only until our last lease would expire
+                await self._set_leader(False)
+
+            await asyncio.sleep(renew_every)
+
+    async def release(self):
+        """Hand the lease back so another process can take over immediately."""
+        if not self.is_leader:
+            return
+        async with APIClient(self.base_url) as api:
+            await api.release_lock(self.name, self.owner)
+        await self._set_leader(False)
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from api_client import APIClient
+
+logger = logging.getLogger("CyberBot.outbox")
+
+# Returns what was done with the message (e.g. the posted message id, None if nothing was
+# needed); raising makes the backend retry it later
+Deliver = Callable[[Dict[str, Any]], Awaitable[Optional[str]]]
+
+
+class OutboxWorker:
+    """
+    Drains the backend outbox in batches: claim (leased to this process), deliver each
+    message, then acknowledge the whole batch in one call. Failed messages are reported
+    and retried by the backend with a backoff.
+
+    Delivery is at-least-once: a message whose ack was lost (crash, network error) is handed
+    out again once its lease expires, with `attempts` > 1, so `deliver` must recognize it by
+    its id before sending it again.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        consumer: str,
+        deliver: Deliver,
+        topics: Optional[List[str]] = None,
+        interval: float = 5,
+        batch: int = 20,
+        lease_seconds: int = 120
+    ):
+        self.base_url = base_url
+        self.consumer = consumer
+        self.deliver = deliver
+        self.topics = topics
+        self.interval = interval
+        self.batch = batch
+        self.lease_seconds = lease_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def drain_once(self) -> int:
+        """Deliver one batch; returns how many messages were claimed."""
+        async with APIClient(self.base_url) as api:
+            messages = await api.claim_outbox(self.consumer, self.batch, self.lease_seconds, self.topics)
+            results: Dict[str, Optional[str]] = {}
+            for message in messages:
+                try:
+                    results[message["id"]] = await self.deliver(message)
+                except Exception as exc:
+                    logger.warning("Outbox message %s failed (attempt %s): %s", message["id"], message.get("attempts"), exc)
+                    await api.nack_outbox(message["id"], repr(exc))
+            if results:
+                await api.ack_outbox(results)
+        return len(messages)
+
+    async def run(self):
+        while True:
+            try:
+                claimed = await self.drain_once()
+            except Exception:
+                logger.exception("Outbox drain failed")
+                claimed = 0
+            # A full batch means more are probably waiting: keep going without sleeping
+            if claimed < self.batch:
+                await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
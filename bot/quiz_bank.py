@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import random
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Optional, Tuple
+
+from api_client import APIClient
+from cache import ContentCache
+from content_store import QuizRecord
+
+logger = logging.getLogger("CyberBot.quiz_bank")
+
+Filter = Tuple[Optional[str], Optional[str]]  # (category, difficulty)
+
+
+class QuizBank:
+    """
+    Serves /cyberquiz from the local quiz store (the "quiz" resource of the content cache,
+    kept current by the change feed), with each question's option orders prepared on first use.
+
+    The backend still decides which questions come up (weighted towards those players miss):
+    picks are fetched `prefetch` at a time per filter and queued, and the queue is topped up
+    in the background before it runs out, so a quiz is normally rendered without any request.
+    When the backend can't answer, a question is picked locally at random.
+    Categories are free text, so only the `max_filters` most recently used queues are kept.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        content: ContentCache,
+        prefetch: int = 10,
+        low_water: int = 3,
+        max_filters: int = 64
+    ):
+        self.base_url = base_url
+        self.content = content
+        self.prefetch = prefetch
+        self.low_water = low_water
+        self.max_filters = max_filters
+        self._queues: "OrderedDict[Filter, Deque[str]]" = OrderedDict()
+        self._refills: Dict[Filter, asyncio.Task] = {}
+
+    def _queue(self, key: Filter) -> Deque[str]:
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            while len(self._queues) > self.max_filters:
+                evicted, _ = self._queues.popitem(last=False)
+                self._refills.pop(evicted, None)
+        else:
+            self._queues.move_to_end(key)
+        return queue
+
+    async def _refill(self, key: Filter, queue: Deque[str]):
+        category, difficulty = key
+        async with APIClient(self.base_url) as api:
+            picked = await api.select_quizzes(category, difficulty, count=self.prefetch)
+        store = await self.content.get("quiz")
+        for doc in picked:
+            if store is not None and store.get(doc["id"]) is None:
+                # The selection carries full documents: a quiz the feed hasn't delivered yet is added now
+                store.upsert(doc)
+            queue.append(doc["id"])
+
+    def _refill_soon(self, key: Filter, queue: Deque[str]):
+        task = self._refills.get(key)
+        if task is None or task.done():
+            self._refills[key] = asyncio.create_task(self._refill(key, queue))
+
+    def _local_pick(self, store, category: Optional[str], difficulty: Optional[str]) -> Optional[QuizRecord]:
+        if not (category or difficulty):
+            return store.sample()
+        matching = [
+            quiz for quiz in store
+            if (not category or quiz.category == category) and (not difficulty or quiz.difficulty == difficulty)
+        ]
+        return random.choice(matching) if matching else None
+
+    async def next(self, category: Optional[str] = None, difficulty: Optional[str] = None) -> Optional[QuizRecord]:
+        key = (category, difficulty)
+        queue = self._queue(key)
+        if not queue:
+            try:
+                await self._refill(key, queue)
+            except Exception as exc:
+                logger.warning("Couldn't fetch quiz picks: %s", exc)
+        elif len(queue) <= self.low_water:
+            self._refill_soon(key, queue)
+
+        store = await self.content.get("quiz")
+        if store is None:
+            return None
+        while queue:
+            quiz = store.get(queue.popleft())
+            if quiz is not None:
+                return quiz  # otherwise deleted since it was picked
+        return self._local_pick(store, category, difficulty)
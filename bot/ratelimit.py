@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from api_client import APIClient
+from token_bucket import TokenBucket
+
+logger = logging.getLogger("CyberBot.ratelimit")
+
+SCOPES = ("user", "channel", "guild")
+
+
+class Rule(NamedTuple):
+    scope: str      # "user", "channel" or "guild"
+    limit: int      # invocations allowed...
+    per: float      # ...per this many seconds
+
+
+def parse_rules(raw: str) -> Dict[str, List[Rule]]:
+    """
+    Parse "cyberfact:user=3/10,guild=30/60;*:user=10/30" into per-command rules.
+    "*" applies to every command that has no rules of its own.
+    """
+    rules: Dict[str, List[Rule]] = {}
+    for block in filter(None, (b.strip() for b in raw.split(";"))):
+        command, _, specs = block.partition(":")
+        for spec in filter(None, (s.strip() for s in specs.split(","))):
+            scope, _, limit = spec.partition("=")
+            count, _, per = limit.partition("/")
+            if scope not in SCOPES:
+                raise ValueError(f"Unknown rate limit scope '{scope}' in '{block}'")
+            rules.setdefault(command.strip(), []).append(Rule(scope, int(count), float(per)))
+    return rules
+
+
+class RateLimiter:
+    """
+    Per-command cooldowns scoped by user, channel or guild.
+
+    Buckets live in a bounded LRU map: the least recently used bucket is dropped when
+    `max_buckets` is reached, and buckets that refilled completely (i.e. idle callers)
+    are evicted periodically.
+
+    With `shared_base_url` set, the same limits are also enforced across shards and
+    processes by the backend. Allowed invocations are counted there in the background,
+    over one long-lived session, so a command never waits for that round trip before it
+    acknowledges its interaction. A key the backend reports over its limit is then refused
+    locally until its window ends (each process may let one extra call through meanwhile).
+    """
+
+    def __init__(self, rules: Dict[str, List[Rule]], max_buckets: int = 50000, shared_base_url: Optional[str] = None):
+        self.rules = rules
+        self.max_buckets = max_buckets
+        self.shared_base_url = shared_base_url
+        self._buckets: "OrderedDict[Tuple[str, str, int], TokenBucket]" = OrderedDict()
+        # Shared key -> monotonic time until which the backend reported it over its limit
+        self._blocked: Dict[str, float] = {}
+        self._api: Optional[APIClient] = None
+        self._reports: Set[asyncio.Task] = set()
+
+    def rules_for(self, command: str) -> List[Rule]:
+        return self.rules.get(command) or self.rules.get("*", [])
+
+    def _bucket(self, key: Tuple[str, str, int], rule: Rule) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rule.limit, rule.limit / rule.per)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def check(self, command: str, ids: Dict[str, Optional[int]]) -> float:
+        """Consume one invocation; returns 0 if allowed, else the seconds to wait."""
+        rules = [rule for rule in self.rules_for(command) if ids.get(rule.scope) is not None]
+        if not rules:
+            return 0.0
+
+        now = time.monotonic()
+        if self.shared_base_url:
+            shared_keys = [f"{command}:{rule.scope}:{ids[rule.scope]}" for rule in rules]
+            blocked = max(self._blocked.get(key, 0.0) for key in shared_keys) - now
+            if blocked > 0:
+                return blocked
+
+        retry_after = 0.0
+        for rule in rules:
+            key = (command, rule.scope, ids[rule.scope])
+            retry_after = max(retry_after, self._bucket(key, rule).consume(now))
+        if retry_after or not self.shared_base_url:
+            return retry_after
+
+        limits = [
+            {"key": key, "limit": rule.limit, "window": rule.per}
+            for key, rule in zip(shared_keys, rules)
+        ]
+        task = asyncio.create_task(self._consume_shared(limits))
+        self._reports.add(task)
+        task.add_done_callback(self._reports.discard)
+        return 0.0
+
+    async def _consume_shared(self, limits: List[Dict[str, Any]]):
+        if self._api is None:
+            self._api = APIClient(self.shared_base_url).open()
+        try:
+            result = await self._api.consume_rate_limit(limits)
+        except Exception as exc:
+            # Fail open: a backend hiccup must not lock everyone out of the bot
+            logger.warning("Couldn't count shared rate limits: %s", exc)
+            return
+        if result and not result.get("allowed", True):
+            now = time.monotonic()
+            exceeded = result.get("exceeded") or {limit["key"]: result.get("retry_after", 0) for limit in limits}
+            for key, wait in exceeded.items():
+                self._blocked[key] = max(self._blocked.get(key, 0.0), now + float(wait))
+
+    def evict_idle(self) -> int:
+        now = time.monotonic()
+        idle = [key for key, bucket in self._buckets.items() if bucket.is_full(now)]
+        for key in idle:
+            del self._buckets[key]
+        for key in [key for key, until in self._blocked.items() if until <= now]:
+            del self._blocked[key]
+        return len(idle)
+
+    async def run_eviction(self, interval: float = 60):
+        while True:
+            await asyncio.sleep(interval)
+            evicted = self.evict_idle()
+            if evicted:
+                logger.debug("Evicted %d idle rate limit buckets (%d left).", evicted, len(self._buckets))
+
+    async def close(self):
+        """Wait for the hits still being counted, then close the shared session."""
+        if self._reports:
+            await asyncio.gather(*self._reports, return_exceptions=True)
+        if self._api is not None:
+            await self._api.close()
+            self._api = None
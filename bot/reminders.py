@@ -0,0 +1,156 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dates import parse_event_date
+
+logger = logging.getLogger("CyberBot.reminders")
+
+# (fire_at, sequence, event_id, version, offset): the sequence keeps ordering total on ties
+HeapEntry = Tuple[datetime, int, str, int, timedelta]
+SendReminder = Callable[[Dict[str, Any], timedelta], Awaitable[None]]
+MAX_TIMER_DELAY = 3600
+
+
+def format_offset(offset: timedelta) -> str:
+    minutes = int(offset.total_seconds() // 60)
+    if minutes % 1440 == 0:
+        days = minutes // 1440
+        return f"{days} day{'s' if days > 1 else ''}"
+    if minutes % 60 == 0:
+        hours = minutes // 60
+        return f"{hours} hour{'s' if hours > 1 else ''}"
+    return f"{minutes} minute{'s' if minutes > 1 else ''}"
+
+
+class ReminderEngine:
+    """
+    Fires event reminders at precomputed times (e.g. T-24h and T-1h).
+
+    Upcoming reminders live in a min-heap keyed by fire time and a single timer is armed
+    for the head of the heap, so nothing polls while idle. Updating or deleting an event
+    bumps its version; heap entries carrying an old version are dropped when they surface,
+    and the heap is compacted once stale entries outnumber live ones.
+    """
+
+    def __init__(self, offsets: Iterable[timedelta], send: SendReminder):
+        self.offsets = sorted(offsets, reverse=True)
+        self.send = send
+        self._heap: List[HeapEntry] = []
+        self._events: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._versions = itertools.count(1)
+        self._sequence = itertools.count()
+        self._stale = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = False
+
+    # === Event changes === #
+    def upsert(self, event: Dict[str, Any]):
+        """Add or replace an event's reminders."""
+        self._add(event)
+        self._rearm()
+
+    def _add(self, event: Dict[str, Any]):
+        event_id = event.get("id")
+        if not event_id:
+            return
+        self._drop(event_id)
+
+        starts_at = parse_event_date(event.get("date", ""))
+        if starts_at is None:
+            return
+
+        version = next(self._versions)
+        self._events[event_id] = (version, event)
+        now = datetime.now(timezone.utc)
+        for offset in self.offsets:
+            fire_at = starts_at - offset
+            if fire_at > now:
+                heapq.heappush(self._heap, (fire_at, next(self._sequence), event_id, version, offset))
+
+    def remove(self, key: str):
+        """Forget an event by id or title."""
+        if key not in self._events:
+            key = next((eid for eid, (_, ev) in self._events.items() if ev.get("title") == key), None)
+        if key:
+            self._drop(key)
+            self._rearm()
+
+    def sync(self, events: Iterable[Dict[str, Any]]):
+        """Reconcile with the backend's list of upcoming events (only changed events are touched)."""
+        seen = set()
+        for event in events:
+            event_id = event.get("id")
+            if not event_id:
+                continue
+            seen.add(event_id)
+            current = self._events.get(event_id)
+            if current is None or current[1] != event:
+                self._add(event)
+        for event_id in [eid for eid in self._events if eid not in seen]:
+            self._drop(event_id)
+        self._rearm()
+
+    def _drop(self, event_id: str):
+        if self._events.pop(event_id, None) is not None:
+            self._stale += len(self.offsets)
+
+    # === Timer === #
+    def start(self):
+        self._running = True
+        self._rearm()
+
+    def stop(self):
+        self._running = False
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _is_live(self, entry: HeapEntry) -> bool:
+        current = self._events.get(entry[2])
+        return current is not None and current[0] == entry[3]
+
+    def _compact(self):
+        if self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _rearm(self):
+        """Arm one timer for the earliest live reminder."""
+        self._compact()
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not self._running or not self._heap:
+            return
+
+        loop = asyncio.get_running_loop()
+        delay = (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds()
+        # Capped so a wall-clock adjustment can't push a reminder back by hours
+        self._timer = loop.call_later(min(max(delay, 0), MAX_TIMER_DELAY), self._fire_due)
+
+    def _fire_due(self):
+        self._timer = None
+        now = datetime.now(timezone.utc)
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                event = self._events[entry[2]][1]
+                asyncio.create_task(self._deliver(event, entry[4]))
+        self._rearm()
+
+    async def _deliver(self, event: Dict[str, Any], offset: timedelta):
+        try:
+            await self.send(event, offset)
+        except Exception as exc:
+            logger.error("Failed to send reminder for %s: %s", event.get("title"), exc)
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,118 @@
+import functools
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from dotenv import load_dotenv
+from env import env_bool, env_int, env_str
+
+BOT_DIR = Path(__file__).parent
+
+
+def parse_shard_ids(raw: str) -> Optional[List[int]]:
+    """"0,1" or "0-3" -> shard ids run by this process (empty = all shards)."""
+    if not raw:
+        return None
+    shard_ids = []
+    for part in raw.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-", 1)
+            shard_ids.extend(range(int(start), int(end) + 1))
+        elif part:
+            shard_ids.append(int(part))
+    return shard_ids
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Bot configuration, read from the environment (and bot/.env) on first use."""
+
+    token: Optional[str]
+    daily_fact_channel_id: Optional[int]
+    events_channel_id: Optional[int]
+    api_base_url: str
+
+    # Sharding: total shards across every process (None = Discord's recommendation) and this process' shards
+    shard_count: Optional[int]
+    shard_ids: Optional[List[int]]
+    scheduler_lock_ttl: int
+
+    # Persistent scheduler job store (in memory when mongo_uri is empty)
+    mongo_uri: Optional[str]
+    db_name: str
+    misfire_grace_seconds: int
+
+    command_hash_file: Path
+    content_cache_ttl: int
+    # Seconds between polls of the backend change feed (0 disables it)
+    change_feed_interval: int
+    # Seconds between outbox polls when it is empty (event announcements)
+    outbox_interval: int
+
+    reminder_offsets: Tuple[timedelta, ...]
+    reminder_resync_minutes: int
+
+    rate_limits: str
+    rate_limit_shared: bool
+
+    # "<channel_id>=daily@HH:MM;<channel_id>=weekly:<day>@HH:MM", composed this many minutes ahead
+    digests: str
+    digest_prepare_minutes: int
+
+    loop_watchdog: bool
+    loop_lag_threshold_ms: int
+    loop_debug: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            token=env_str("DISCORD_TOKEN"),
+            daily_fact_channel_id=env_int("DAILY_FACT_CHANNEL_ID"),
+            events_channel_id=env_int("EVENTS_CHANNEL_ID"),
+            api_base_url=env_str("API_BASE_URL", "http://localhost:8000").rstrip("/"),
+            shard_count=env_int("SHARD_COUNT", minimum=1),
+            shard_ids=parse_shard_ids(env_str("SHARD_IDS", "")),
+            scheduler_lock_ttl=env_int("SCHEDULER_LOCK_TTL", 30, minimum=1),
+            mongo_uri=env_str("MONGO_URI"),
+            db_name=env_str("DB_NAME", "cyberbot_db"),
+            misfire_grace_seconds=env_int("MISFIRE_GRACE_SECONDS", 3600, minimum=0),
+            command_hash_file=Path(env_str("COMMAND_HASH_FILE", str(BOT_DIR / ".command_tree_hash"))),
+            content_cache_ttl=env_int("CONTENT_CACHE_TTL", 300, minimum=0),
+            change_feed_interval=env_int("CHANGE_FEED_INTERVAL", 5, minimum=0),
+            outbox_interval=env_int("OUTBOX_INTERVAL", 5, minimum=1),
+            # Minutes before an event starts at which a reminder is posted (e.g. "1440,60" = T-24h and T-1h)
+            reminder_offsets=tuple(
+                timedelta(minutes=int(m)) for m in env_str("EVENT_REMINDER_OFFSETS", "1440,60").split(",") if m.strip()
+            ),
+            reminder_resync_minutes=env_int("REMINDER_RESYNC_MINUTES", 10, minimum=1),
+            # "<command>:<scope>=<count>/<seconds>,...;..." with scopes user, channel and guild; "*" = any other command
+            # (empty disables cooldowns)
+            rate_limits=os.getenv(
+                "RATE_LIMITS", "*:user=5/30,guild=60/60;cyberquiz:user=3/30,guild=30/60;events:user=3/20,guild=30/60"
+            ),
+            rate_limit_shared=env_bool("RATE_LIMIT_SHARED"),
+            digests=env_str("DIGESTS", ""),
+            digest_prepare_minutes=env_int("DIGEST_PREPARE_MINUTES", 5, minimum=0),
+            loop_watchdog=env_bool("LOOP_WATCHDOG"),
+            loop_lag_threshold_ms=env_int("LOOP_LAG_THRESHOLD_MS", 250, minimum=1),
+            loop_debug=env_bool("LOOP_DEBUG")
+        )
+
+    def endpoint(self, resource: str) -> str:
+        return f"{self.api_base_url}/{resource}"
+
+    def require(self, *names: str):
+        """Fail with a readable message when settings needed right now are missing."""
+        missing = [name for name in names if getattr(self, name) is None]
+        if missing:
+            raise RuntimeError(f"Missing bot configuration: {', '.join(missing)} (see bot/.env.example)")
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load bot/.env and parse the configuration once; importing this module has no side effects."""
+    load_dotenv(dotenv_path=BOT_DIR / ".env")
+    return Settings.from_env()
@@ -0,0 +1,94 @@
+import discord
+from typing import Any, Dict, List, Optional
+
+from api_client import APIClient
+
+# Discord embed limits (https://discord.com/developers/docs/resources/message#embed-object-embed-limits)
+FIELD_NAME_LIMIT = 256
+FIELD_VALUE_LIMIT = 1024
+
+
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+class EventsView(discord.ui.View):
+    """
+    Paginated view over upcoming events.
+    Pages are fetched lazily from the backend and cached once seen, so navigating
+    back and forth never refetches and the embed always stays within Discord limits.
+    """
+
+    def __init__(self, base_url: str, page_size: int = 5, timeout: float = 180):
+        super().__init__(timeout=timeout)
+        self.base_url = base_url
+        self.page_size = page_size
+        self.page = 0
+        self.pages: Dict[int, List[Dict[str, Any]]] = {}
+        self.last_page: Optional[int] = None
+        self.message: Optional[discord.Message] = None
+
+    def store_page(self, page: int, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Cache a page fetched with one lookahead item (page_size + 1 events),
+        which tells us whether a next page exists.
+        """
+        if len(events) <= self.page_size:
+            self.last_page = page
+        events = events[:self.page_size]
+        self.pages[page] = events
+        return events
+
+    async def fetch_page(self, page: int) -> List[Dict[str, Any]]:
+        """Return the events on `page`, hitting the API only for unseen pages."""
+        if page in self.pages:
+            return self.pages[page]
+
+        async with APIClient(self.base_url) as api:
+            events = await api.get_events_page(skip=page * self.page_size, limit=self.page_size + 1)
+        return self.store_page(page, events)
+
+    def build_embed(self, events: List[Dict[str, Any]]) -> discord.Embed:
+        embed = discord.Embed(title="Upcoming Club Events", color=discord.Color.blue())
+        for e in events:
+            embed.add_field(
+                name=_truncate(f"{e.get('title', 'Untitled')} — {e.get('date', 'TBD')}", FIELD_NAME_LIMIT),
+                value=_truncate(f"{e.get('description', '')}\n📍 {e.get('location', '')}", FIELD_VALUE_LIMIT),
+                inline=False
+            )
+        embed.set_footer(text=f"Page {self.page + 1}")
+        return embed
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.last_page is not None and self.page >= self.last_page
+
+    async def render(self, interaction: discord.Interaction, page: int):
+        events = await self.fetch_page(page)
+        if not events and page > 0:
+            # The list shrank since the last page was counted; stay where we are
+            self.last_page = page - 1
+            self.update_buttons()
+            await interaction.response.edit_message(view=self)
+            return
+
+        self.page = page
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(events), view=self)
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.render(interaction, max(self.page - 1, 0))
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.render(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        for child in self.children:
+            child.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
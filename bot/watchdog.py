@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional, Set
+
+import discord
+
+logger = logging.getLogger("CyberBot.watchdog")
+
+# Discord drops an interaction that isn't acknowledged within 3 seconds
+ACK_DEADLINE = 3.0
+# How often a pending interaction is checked for its first response
+ACK_POLL_INTERVAL = 0.02
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+class LoopWatchdog:
+    """
+    Finds what blocks the bot's event loop.
+
+    - A heartbeat coroutine measures loop lag (how late its sleeps wake up).
+    - A sampling thread notices when the heartbeat stalls past `threshold` and logs the
+      loop thread's current stack, i.e. the code that is blocking it right now.
+    - Interactions are timed from creation to first acknowledgement and compared with
+      Discord's 3-second deadline, per command. discord.py's InteractionResponse is slotted,
+      so the response is observed (`is_done()`) rather than wrapped.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.5, report_every: float = 300):
+        self.threshold = threshold
+        self.interval = interval
+        self.report_every = report_every
+        self.lags: Deque[float] = deque(maxlen=1000)
+        self.acks: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=500))
+        self.missed: Dict[str, int] = defaultdict(int)
+        self._pending: Set[asyncio.Task] = set()
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+
+    # === Loop lag === #
+    async def run(self, debug_slow_callbacks: bool = False):
+        loop = asyncio.get_running_loop()
+        if debug_slow_callbacks:
+            # asyncio logs every callback slower than this ("Executing <Handle ...> took 0.3 seconds")
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.threshold
+
+        self._loop_thread_id = threading.get_ident()
+        threading.Thread(target=self._sample, name="loop-watchdog", daemon=True).start()
+
+        last_report = time.monotonic()
+        try:
+            while True:
+                before = time.monotonic()
+                self._beat = before
+                await asyncio.sleep(self.interval)
+                now = time.monotonic()
+                self.lags.append(max(now - before - self.interval, 0.0))
+                if now - last_report >= self.report_every:
+                    self.report()
+                    last_report = now
+        finally:
+            self._stop.set()
+
+    def _sample(self):
+        reported_beat = None
+        while not self._stop.wait(self.threshold / 2):
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold or beat == reported_beat:
+                continue
+            # One stack per stall: the loop hasn't ticked since `beat`
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>"
+            logger.warning(
+                "Event loop blocked for %.0f ms so far; loop thread stack:\n%s", stalled * 1000, stack,
+                extra={"lag_ms": round(stalled * 1000, 1)}
+            )
+
+    # === Interaction acknowledgement latency === #
+    def track_interaction(self, interaction: discord.Interaction, command: str):
+        """Time the first response to `interaction` from a task that watches it until then."""
+        task = asyncio.create_task(self._wait_for_ack(interaction, command))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _wait_for_ack(self, interaction: discord.Interaction, command: str):
+        # Resolution is one poll interval; a blocked loop delays the response and this check alike
+        while not interaction.response.is_done():
+            if (datetime.now(timezone.utc) - interaction.created_at).total_seconds() > ACK_DEADLINE:
+                # Discord has dropped it by now; stop watching
+                self.record_ack(command, interaction.created_at, acknowledged=False)
+                return
+            await asyncio.sleep(ACK_POLL_INTERVAL)
+        self.record_ack(command, interaction.created_at)
+
+    async def drain(self):
+        """Wait for the interactions still being watched (e.g. before reporting)."""
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    def record_ack(self, command: str, created_at: datetime, acknowledged: bool = True):
+        latency = (datetime.now(timezone.utc) - created_at).total_seconds()
+        self.acks[command].append(latency)
+        if not acknowledged:
+            self.missed[command] += 1
+            logger.warning("/%s not acknowledged within the %.0fs deadline", command, ACK_DEADLINE)
+        elif latency > ACK_DEADLINE:
+            self.missed[command] += 1
+            logger.warning("/%s acknowledged after %.2fs (deadline %.0fs)", command, latency, ACK_DEADLINE)
+
+    # === Reporting === #
+    def stats(self) -> dict:
+        return {
+            "loop_lag_ms": {
+                "p50": round(percentile(self.lags, 0.5) * 1000, 1),
+                "p99": round(percentile(self.lags, 0.99) * 1000, 1),
+                "max": round(max(self.lags, default=0.0) * 1000, 1)
+            },
+            "ack_latency_ms": {
+                command: {
+                    "count": len(samples),
+                    "p50": round(percentile(samples, 0.5) * 1000, 1),
+                    "p95": round(percentile(samples, 0.95) * 1000, 1),
+                    "missed_deadline": self.missed[command]
+                }
+                for command, samples in self.acks.items()
+            }
+        }
+
+    def report(self):
+        logger.info("Loop watchdog report", extra={"watchdog": self.stats()})
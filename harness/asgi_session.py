@@ -0,0 +1,57 @@
+"""
+aiohttp-compatible session that sends requests straight into an ASGI app (the FastAPI backend)
+through httpx, so the bot's APIClient can talk to the backend without opening a socket.
+"""
+
+import json as jsonlib
+from typing import Any
+
+import aiohttp
+import httpx
+
+
+class ASGIResponse:
+    """The subset of aiohttp.ClientResponse that APIClient reads."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+
+    async def text(self) -> str:
+        return self._response.text
+
+    async def json(self) -> Any:
+        try:
+            return jsonlib.loads(self._response.content)
+        except ValueError as exc:
+            raise aiohttp.ContentTypeError(None, (), message=str(exc))
+
+
+class _RequestContext:
+    def __init__(self, session: "ASGISession", method: str, url: str, kwargs: dict):
+        self._session = session
+        self._args = (method, url, kwargs)
+
+    async def __aenter__(self) -> ASGIResponse:
+        method, url, kwargs = self._args
+        response = await self._session.client.request(method, url, **kwargs)
+        return ASGIResponse(response)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class ASGISession:
+    def __init__(self, app, base_url: str = "http://testserver"):
+        transport = httpx.ASGITransport(app=app)
+        self.client = httpx.AsyncClient(transport=transport, base_url=base_url, follow_redirects=True)
+        self.closed = False
+
+    def request(self, method: str, url: str, **kwargs) -> _RequestContext:
+        return _RequestContext(self, method, url, kwargs)
+
+    async def close(self):
+        if not self.closed:
+            await self.client.aclose()
+            self.closed = True
@@ -0,0 +1,199 @@
+"""
+Offline end-to-end benchmark of every slash command.
+
+The FastAPI backend runs in-process on an in-memory Motor stand-in, the bot's APIClient is
+routed to it through an ASGI transport, and each command callback is invoked with a fake
+interaction that records when it was acknowledged and when it finished. No Discord token,
+MongoDB or network is needed.
+
+    pip install -r harness/requirements.txt
+    python harness/bench.py --size 10000 --iterations 200
+    python harness/bench.py --cold --commands cyberfact,events
+    python harness/bench.py --watchdog --iterations 5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+BASE_URL = "http://testserver"
+
+# Configuration for both services; some of it is read at import time, so it is set before importing them.
+# Empty values switch off the Mongo job store, the backend rate limit and the bot's cooldowns.
+HARNESS_ENV = {
+    "API_BASE_URL": BASE_URL,
+    "MONGO_URI": "",
+    "API_RATE_LIMIT": "",
+    "RATE_LIMITS": "",
+    "RATE_LIMIT_SHARED": "false",
+    "LOOP_WATCHDOG": "false",
+    "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+    "LOG_FORMAT": os.getenv("LOG_FORMAT", "text")
+}
+
+AUTHORS = ["Bruce Schneier", "Kevin Mitnick", "Gene Spafford", "Dan Geer", "Unknown"]
+LOCATIONS = ["ESI Amphi A", "Lab 3", "Online", "Club room"]
+
+
+def configure(watchdog: bool = False):
+    os.environ.update(HARNESS_ENV)
+    if watchdog:
+        os.environ["LOOP_WATCHDOG"] = "true"
+    sys.path[:0] = [str(ROOT / "bot"), str(ROOT / "backend"), str(ROOT / "shared")]
+
+
+# === Synthetic data === #
+def synthetic_collections(size: int) -> Dict[str, List[dict]]:
+    now = datetime.now(timezone.utc)
+    return {
+        "facts": [{"content": f"Synthetic fact #{i}: rotate your keys before they rotate you."} for i in range(size)],
+        "jokes": [{"content": f"Synthetic joke #{i}: there are 10 kinds of people."} for i in range(size)],
+        "quotes": [{"content": f"Synthetic quote #{i}.", "author": AUTHORS[i % len(AUTHORS)]} for i in range(size)],
+        "quizzes": [
+            {"question": f"Synthetic question #{i}?", "options": ["A", "B", "C", "D"], "correct_option": i % 4}
+            for i in range(size)
+        ],
+        "events": [
+            {
+                "title": f"Synthetic event #{i}",
+                "date": (now + timedelta(hours=i + 1)).strftime("%Y-%m-%dT%H:%M:%S"),
+                "description": "Generated by the benchmark harness.",
+                "location": LOCATIONS[i % len(LOCATIONS)]
+            }
+            for i in range(size)
+        ]
+    }
+
+
+async def seed(db, size: int):
+    for name, docs in synthetic_collections(size).items():
+        if docs:
+            await db[name].insert_many(docs)
+
+
+# === Commands === #
+def command_arguments(i: int) -> List[Tuple[str, dict]]:
+    """Every command with its arguments for iteration `i` (event writes chain add -> update -> remove)."""
+    title = f"Benchmark event {i}"
+    date = (datetime.now(timezone.utc) + timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%S")
+    return [
+        ("events", {}),
+        ("cyberfact", {}),
+        ("cyberjoke", {}),
+        ("cyberquote", {}),
+        ("cyberquiz", {}),
+        ("about-shellmates", {}),
+        ("help", {}),
+        ("add_event", {"title": title, "date": date, "description": "Benchmark", "location": "Online"}),
+        ("update_event", {"current_title": title, "location": "Lab 3"}),
+        ("remove_event", {"event_title": title}),
+        ("add_fact", {"fact": f"Benchmark fact {i}"}),
+        ("add_joke", {"joke": f"Benchmark joke {i}"}),
+        ("add_quote", {"quote": f"Benchmark quote {i}"}),
+        ("add_quiz", {"question": f"Benchmark quiz {i}?", "options": "A,B,C", "correct_index": 2})
+    ]
+
+
+async def invoke(cyberbot, name: str, kwargs: dict):
+    from fake_discord import FakeInteraction
+
+    command = cyberbot.bot.tree.get_command(name)
+    interaction = FakeInteraction(command)
+    if await cyberbot.bot.tree.interaction_check(interaction):
+        await command.callback(interaction, **kwargs)
+    return interaction
+
+
+async def bench(cyberbot, iterations: int, only: List[str], cold: bool) -> Dict[str, List[Tuple[float, float]]]:
+    results: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
+    for i in range(iterations):
+        for name, kwargs in command_arguments(i):
+            if only and name not in only:
+                continue
+            if cold:
+                # Measure the round trip to the backend instead of the warm content cache
+                for resource in ("facts", "jokes", "quotes", "quiz", "about", "events"):
+                    cyberbot.content.invalidate(resource)
+            interaction = await invoke(cyberbot, name, kwargs)
+            if interaction.ack_ms is None:
+                raise RuntimeError(f"/{name} never responded")
+            results[name].append((interaction.ack_ms, interaction.done_ms))
+    return results
+
+
+def report(results: Dict[str, List[Tuple[float, float]]], size: int, elapsed: float):
+    from watchdog import percentile
+
+    print(f"\n{size} documents per collection, {elapsed:.1f}s total (times in ms)\n")
+    print(f"{'command':<18}{'n':>6}{'ack p50':>10}{'ack p95':>10}{'done p50':>10}{'done p95':>10}")
+    for name, samples in results.items():
+        acks = [ack for ack, _ in samples]
+        dones = [done for _, done in samples]
+        print(
+            f"{name:<18}{len(samples):>6}"
+            f"{percentile(acks, 0.5):>10.2f}{percentile(acks, 0.95):>10.2f}"
+            f"{percentile(dones, 0.5):>10.2f}{percentile(dones, 0.95):>10.2f}"
+        )
+
+
+async def check_watchdog(cyberbot, results: Dict[str, List[Tuple[float, float]]]):
+    """The watchdog must have timed every interaction through the tree check, without patching it."""
+    watchdog = cyberbot.watchdog
+    await watchdog.drain()
+    for name, samples in results.items():
+        seen = len(watchdog.acks.get(name, ()))
+        if seen != len(samples):
+            raise RuntimeError(f"Watchdog timed {seen} of {len(samples)} /{name} interactions")
+        if watchdog.missed.get(name):
+            raise RuntimeError(f"Watchdog reported /{name} as missing its acknowledgement deadline")
+    stats = watchdog.stats()["ack_latency_ms"]
+    print("\nwatchdog ack latency (ms, measured from interaction.created_at)\n")
+    print(f"{'command':<18}{'n':>6}{'p50':>10}{'p95':>10}")
+    for name, entry in stats.items():
+        print(f"{name:<18}{entry['count']:>6}{entry['p50']:>10.1f}{entry['p95']:>10.1f}")
+
+
+async def main(args):
+    configure(args.watchdog)
+    from memory_mongo import MemoryClient
+    from asgi_session import ASGISession
+    from database.mongo_config import MongoDB
+
+    MongoDB.use_client(MemoryClient())
+    await seed(MongoDB.get_db(), args.size)
+
+    from app import app
+    from api_client import APIClient
+    APIClient.session_factory = lambda: ASGISession(app, BASE_URL)
+
+    import bot as cyberbot
+
+    random.seed(args.seed)
+    async with app.router.lifespan_context(app):
+        if not args.cold:
+            await cyberbot.content.preload()
+        started = time.perf_counter()
+        only = [name.strip() for name in args.commands.split(",") if name.strip()]
+        results = await bench(cyberbot, args.iterations, only, args.cold)
+        report(results, args.size, time.perf_counter() - started)
+        if args.watchdog:
+            await check_watchdog(cyberbot, results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="documents per synthetic collection")
+    parser.add_argument("--iterations", type=int, default=50, help="invocations of each command")
+    parser.add_argument("--commands", default="", help="comma-separated command names (default: all)")
+    parser.add_argument("--cold", action="store_true", help="drop the bot's content cache before every command")
+    parser.add_argument("--watchdog", action="store_true", help="run with LOOP_WATCHDOG on and check its ack timings")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
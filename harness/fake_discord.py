@@ -0,0 +1,102 @@
+"""
+Minimal stand-ins for discord.Interaction and friends.
+
+They record what a command sent and when: `ack_ms` is the time to the first response
+(Discord's 3-second deadline applies to it) and `done_ms` the time to the last message.
+FakeResponse is a real (slotted) discord.InteractionResponse that records instead of
+calling Discord, so code that tries to patch the response object fails here as it would live.
+"""
+
+import itertools
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+import discord
+
+_ids = itertools.count(1)
+
+
+@dataclass
+class Sent:
+    kind: str           # "defer", "response", "followup", "edit"
+    content: Optional[str]
+    kwargs: dict
+    at_ms: float
+
+
+@dataclass
+class FakeMessage:
+    interaction: "FakeInteraction"
+    content: Optional[str] = None
+    id: int = field(default_factory=lambda: next(_ids))
+
+    async def edit(self, **kwargs):
+        self.interaction.record("edit", kwargs.get("content"), kwargs)
+        return self
+
+
+class FakeResponse(discord.InteractionResponse):
+    __slots__ = ()
+
+    def _acknowledge(self, kind: discord.InteractionResponseType):
+        if self.is_done():
+            raise RuntimeError("This interaction has already been responded to before")
+        self._response_type = kind
+
+    async def defer(self, **kwargs):
+        self._acknowledge(discord.InteractionResponseType.deferred_channel_message)
+        self._parent.record("defer", None, kwargs)
+
+    async def send_message(self, content: Optional[str] = None, **kwargs):
+        self._acknowledge(discord.InteractionResponseType.channel_message)
+        self._parent.record("response", content, kwargs)
+
+    async def edit_message(self, content: Optional[str] = None, **kwargs):
+        self._acknowledge(discord.InteractionResponseType.message_update)
+        self._parent.record("edit", content, kwargs)
+
+    async def send_modal(self, modal):
+        self._acknowledge(discord.InteractionResponseType.modal)
+        self._parent.record("modal", None, {"modal": modal})
+
+
+class FakeFollowup:
+    def __init__(self, interaction: "FakeInteraction"):
+        self._interaction = interaction
+
+    async def send(self, content: Optional[str] = None, wait: bool = False, **kwargs):
+        if not self._interaction.response.is_done():
+            raise RuntimeError("Followup sent before the interaction was acknowledged")
+        self._interaction.record("followup", content, kwargs)
+        return FakeMessage(self._interaction, content)
+
+
+class FakeInteraction:
+    def __init__(self, command: Any = None, admin: bool = True, user_id: int = 1, guild_id: int = 1, channel_id: int = 1):
+        self.id = next(_ids)
+        self.command = command
+        self.created_at = datetime.now(timezone.utc)
+        self.user = SimpleNamespace(
+            id=user_id, mention=f"<@{user_id}>",
+            guild_permissions=SimpleNamespace(administrator=admin)
+        )
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.sent: List[Sent] = []
+        self._started = time.perf_counter()
+
+    def record(self, kind: str, content: Optional[str], kwargs: dict):
+        self.sent.append(Sent(kind, content, kwargs, (time.perf_counter() - self._started) * 1000))
+
+    @property
+    def ack_ms(self) -> Optional[float]:
+        return self.sent[0].at_ms if self.sent else None
+
+    @property
+    def done_ms(self) -> Optional[float]:
+        return self.sent[-1].at_ms if self.sent else None
@@ -0,0 +1,395 @@
+"""
+In-memory stand-in for the parts of Motor the backend uses.
+
+Documents are deep-copied on the way in and out, like a round trip through BSON, so the
+application can't accidentally share state with the "database". Only the query and
+update operators the backend relies on are implemented. Every method takes `session=` as
+Motor does; the store has no transactions, so it is ignored. Like MongoDB, updates only
+count as modified when they changed the document.
+"""
+
+import copy
+import random
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+_MISSING = object()
+
+
+# === Query matching === #
+def _get(doc: dict, path: str):
+    value = doc
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _compare(op):
+    def check(value, arg):
+        if value is _MISSING or value is None:
+            return False
+        try:
+            return op(value, arg)
+        except TypeError:
+            return False
+    return check
+
+
+def _equals(value, arg) -> bool:
+    if value is _MISSING:
+        return arg is None
+    if isinstance(value, list) and not isinstance(arg, list):
+        return arg in value
+    return value == arg
+
+
+OPERATORS = {
+    "$eq": _equals,
+    "$ne": lambda value, arg: not _equals(value, arg),
+    "$gt": _compare(lambda a, b: a > b),
+    "$gte": _compare(lambda a, b: a >= b),
+    "$lt": _compare(lambda a, b: a < b),
+    "$lte": _compare(lambda a, b: a <= b),
+    "$in": lambda value, arg: any(_equals(value, item) for item in arg),
+    "$nin": lambda value, arg: not any(_equals(value, item) for item in arg),
+    "$exists": lambda value, arg: (value is not _MISSING) == bool(arg),
+}
+
+
+def matches(doc: dict, query: Optional[dict]) -> bool:
+    for key, condition in (query or {}).items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+            value = _get(doc, key)
+            for op, arg in condition.items():
+                if not OPERATORS[op](value, arg):
+                    return False
+        elif not _equals(_get(doc, key), condition):
+            return False
+    return True
+
+
+# === Updates and projections === #
+def apply_update(doc: dict, update: dict, inserting: bool = False):
+    for op, fields in update.items():
+        if op == "$set":
+            doc.update(copy.deepcopy(fields))
+        elif op == "$setOnInsert":
+            if inserting:
+                doc.update(copy.deepcopy(fields))
+        elif op == "$inc":
+            for key, amount in fields.items():
+                doc[key] = doc.get(key, 0) + amount
+        elif op == "$unset":
+            for key in fields:
+                doc.pop(key, None)
+        elif op == "$push":
+            for key, value in fields.items():
+                doc.setdefault(key, []).append(copy.deepcopy(value))
+        elif op == "$max":
+            for key, value in fields.items():
+                doc[key] = max(doc.get(key, value), value)
+        else:
+            raise NotImplementedError(f"Update operator {op} is not supported by the in-memory store")
+
+
+def update_document(doc: dict, update: dict) -> bool:
+    """Apply `update` in place; returns whether the document actually changed."""
+    before = copy.deepcopy(doc)
+    apply_update(doc, update)
+    return doc != before
+
+
+def project(doc: dict, projection: Optional[dict]) -> dict:
+    doc = copy.deepcopy(doc)
+    if not projection:
+        return doc
+    include = {k for k, v in projection.items() if v and k != "_id"}
+    if include:
+        out = {k: doc[k] for k in include if k in doc}
+        if projection.get("_id", 1):
+            out["_id"] = doc["_id"]
+        return out
+    return {k: v for k, v in doc.items() if projection.get(k, 1)}
+
+
+def _upsert_seed(query: dict) -> dict:
+    """Equality parts of a filter become fields of an upserted document."""
+    return {
+        k: v for k, v in query.items()
+        if not k.startswith("$") and not (isinstance(v, dict) and any(key.startswith("$") for key in v))
+    }
+
+
+def evaluate(doc: dict, expression):
+    """Aggregation expressions: "$field" paths, {"$ifNull": [...]}, nested objects and literals."""
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = _get(doc, expression[1:])
+        return None if value is _MISSING else value
+    if isinstance(expression, dict):
+        if "$ifNull" in expression:
+            value, default = (evaluate(doc, e) for e in expression["$ifNull"])
+            return default if value is None else value
+        return {key: evaluate(doc, value) for key, value in expression.items()}
+    return expression
+
+
+def group(docs: List[dict], spec: dict) -> List[dict]:
+    """$group with $sum accumulators."""
+    groups: Dict[Any, dict] = {}
+    for doc in docs:
+        key = evaluate(doc, spec["_id"])
+        out = groups.setdefault(repr(key), {"_id": key, **{field: 0 for field in spec if field != "_id"}})
+        for field, accumulator in spec.items():
+            if field == "_id":
+                continue
+            (op, arg), = accumulator.items()
+            if op != "$sum":
+                raise NotImplementedError(f"Accumulator {op} is not supported by the in-memory store")
+            out[field] += evaluate(doc, arg) or 0
+    return list(groups.values())
+
+
+# === Cursor === #
+class MemoryCursor:
+    def __init__(self, docs: List[dict], projection: Optional[dict] = None):
+        self._docs = docs
+        self._projection = projection
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction: int = 1):
+        keys = key if isinstance(key, list) else [(key, direction)]
+        for field, order in reversed(keys):
+            present = [d for d in self._docs if _get(d, field) not in (_MISSING, None)]
+            absent = [d for d in self._docs if _get(d, field) in (_MISSING, None)]
+            present.sort(key=lambda d: _get(d, field), reverse=order < 0)
+            self._docs = absent + present if order > 0 else present + absent
+        return self
+
+    def skip(self, count: int):
+        self._skip = count
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def _window(self) -> List[dict]:
+        end = self._skip + self._limit if self._limit else None
+        return self._docs[self._skip:end]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._window():
+            yield project(doc, self._projection)
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        docs = self._window()
+        if length:
+            docs = docs[:length]
+        return [project(doc, self._projection) for doc in docs]
+
+
+# === Collection / database / client === #
+class MemoryCollection:
+    def __init__(self, name: str):
+        self.name = name
+        self._docs: Dict[Any, dict] = {}
+        self.indexes: List[Any] = []
+
+    def _matching(self, query: Optional[dict]) -> List[dict]:
+        if query and set(query) == {"_id"} and not isinstance(query["_id"], dict):
+            doc = self._docs.get(query["_id"])
+            return [doc] if doc else []
+        return [doc for doc in self._docs.values() if matches(doc, query)]
+
+    def _insert(self, doc: dict):
+        doc.setdefault("_id", ObjectId())
+        if doc["_id"] in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} dup key: {doc['_id']}")
+        self._docs[doc["_id"]] = copy.deepcopy(doc)
+
+    # Reads
+    def find(self, query: Optional[dict] = None, projection: Optional[dict] = None, session=None, batch_size: int = 0) -> MemoryCursor:
+        # `session` and `batch_size` only matter to a real server
+        return MemoryCursor(self._matching(query), projection)
+
+    async def find_one(self, query: Optional[dict] = None, projection: Optional[dict] = None, sort=None, session=None) -> Optional[dict]:
+        cursor = MemoryCursor(self._matching(query), projection)
+        if sort:
+            cursor.sort(sort)
+        found = await cursor.to_list(1)
+        return found[0] if found else None
+
+    async def count_documents(self, query: Optional[dict] = None, session=None) -> int:
+        return len(self._matching(query))
+
+    async def estimated_document_count(self) -> int:
+        return len(self._docs)
+
+    def aggregate(self, pipeline: List[dict], session=None) -> MemoryCursor:
+        docs = list(self._docs.values())
+        for stage in pipeline:
+            (op, arg), = stage.items()
+            if op == "$match":
+                docs = [d for d in docs if matches(d, arg)]
+            elif op == "$sample":
+                docs = random.sample(docs, min(arg["size"], len(docs)))
+            elif op == "$sort":
+                docs = MemoryCursor(docs).sort(list(arg.items()))._docs
+            elif op == "$skip":
+                docs = docs[arg:]
+            elif op == "$limit":
+                docs = docs[:arg]
+            elif op == "$group":
+                docs = group(docs, arg)
+            elif op == "$project":
+                docs = [project(d, arg) for d in docs]
+            else:
+                raise NotImplementedError(f"Aggregation stage {op} is not supported by the in-memory store")
+        return MemoryCursor(docs)
+
+    # Writes
+    async def insert_one(self, doc: dict, session=None):
+        self._insert(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs: Iterable[dict], ordered: bool = True, session=None):
+        ids = []
+        for doc in docs:
+            self._insert(doc)
+            ids.append(doc["_id"])
+        return SimpleNamespace(inserted_ids=ids)
+
+    async def find_one_and_update(
+        self, query: dict, update: dict, projection: Optional[dict] = None,
+        upsert: bool = False, return_document: bool = ReturnDocument.BEFORE, session=None
+    ) -> Optional[dict]:
+        found = self._matching(query)
+        if found:
+            doc = found[0]
+            before = copy.deepcopy(doc)
+            apply_update(doc, update)
+            return project(doc if return_document == ReturnDocument.AFTER else before, projection)
+        if not upsert:
+            return None
+        doc = _upsert_seed(query)
+        apply_update(doc, update, inserting=True)
+        self._insert(doc)
+        return project(doc, projection) if return_document == ReturnDocument.AFTER else None
+
+    def _update(self, query: dict, update: dict, upsert: bool, multi: bool) -> SimpleNamespace:
+        found = self._matching(query)
+        if not multi:
+            found = found[:1]
+        if found:
+            modified = sum(update_document(doc, update) for doc in found)
+            return SimpleNamespace(matched_count=len(found), modified_count=modified, upserted_id=None)
+        if upsert:
+            doc = _upsert_seed(query)
+            apply_update(doc, update, inserting=True)
+            self._insert(doc)
+            return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=doc["_id"])
+        return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=None)
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False, session=None):
+        return self._update(query, update, upsert, multi=False)
+
+    async def update_many(self, query: dict, update: dict, upsert: bool = False, session=None):
+        return self._update(query, update, upsert, multi=True)
+
+    def _delete(self, query: dict, multi: bool) -> int:
+        found = self._matching(query)
+        if not multi:
+            found = found[:1]
+        for doc in found:
+            del self._docs[doc["_id"]]
+        return len(found)
+
+    async def bulk_write(self, requests: Iterable[Any], ordered: bool = True, session=None):
+        """InsertOne, UpdateOne/UpdateMany (with upsert) and DeleteOne/DeleteMany, applied in order."""
+        result = SimpleNamespace(
+            inserted_count=0, matched_count=0, modified_count=0, deleted_count=0, upserted_count=0, upserted_ids={}
+        )
+        for index, request in enumerate(requests):
+            if isinstance(request, InsertOne):
+                self._insert(request._doc)
+                result.inserted_count += 1
+            elif isinstance(request, (UpdateOne, UpdateMany)):
+                outcome = self._update(request._filter, request._doc, request._upsert, multi=isinstance(request, UpdateMany))
+                result.matched_count += outcome.matched_count
+                result.modified_count += outcome.modified_count
+                if outcome.upserted_id is not None:
+                    result.upserted_ids[index] = outcome.upserted_id
+                    result.upserted_count += 1
+            elif isinstance(request, (DeleteOne, DeleteMany)):
+                result.deleted_count += self._delete(request._filter, multi=isinstance(request, DeleteMany))
+            else:
+                raise NotImplementedError(f"{type(request).__name__} is not supported by the in-memory store")
+        return result
+
+    async def find_one_and_delete(self, query: dict, projection: Optional[dict] = None, session=None) -> Optional[dict]:
+        found = self._matching(query)
+        if not found:
+            return None
+        doc = self._docs.pop(found[0]["_id"])
+        return project(doc, projection)
+
+    async def delete_one(self, query: dict, session=None):
+        return SimpleNamespace(deleted_count=self._delete(query, multi=False))
+
+    async def delete_many(self, query: dict, session=None):
+        return SimpleNamespace(deleted_count=self._delete(query, multi=True))
+
+    async def create_index(self, keys, **kwargs) -> str:
+        self.indexes.append((keys, kwargs))
+        return str(keys)
+
+
+class MemoryDatabase:
+    def __init__(self, name: str):
+        self.name = name
+        self._collections: Dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(name)
+        return self._collections[name]
+
+    __getattr__ = __getitem__
+
+    async def list_collection_names(self) -> List[str]:
+        return list(self._collections)
+
+    async def command(self, name, *args, **kwargs) -> dict:
+        return {"ok": 1.0}
+
+
+class MemoryClient:
+    """Drop-in for AsyncIOMotorClient: `client[db][collection]`, `client.admin.command("ping")`."""
+
+    def __init__(self):
+        self._databases: Dict[str, MemoryDatabase] = {}
+        self.admin = MemoryDatabase("admin")
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(name)
+        return self._databases[name]
+
+    def close(self):
+        pass
@@ -0,0 +1,146 @@
+"""
+Startup profile of both services, run in fresh interpreters.
+
+- Import time, from `python -X importtime`: the service's direct imports by cumulative
+  time and the modules with the highest self time.
+- Cold start: wall time from process launch to ready. For the backend that is the app
+  imported, its lifespan finished (against the in-memory Mongo) and /health/ready answering;
+  for the bot it is the module imported with every object built (the Discord login is excluded).
+
+    python harness/startup.py --runs 5 --budget-ms 1000 --output startup-report.md
+
+Exits with status 1 when a service's median cold start exceeds the budget.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from bench import HARNESS_ENV, ROOT
+
+HARNESS_DIR = Path(__file__).resolve().parent
+
+BACKEND_READY = """
+import asyncio
+import httpx
+from memory_mongo import MemoryClient
+from database.mongo_config import MongoDB
+MongoDB.use_client(MemoryClient())
+from app import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            response = await client.get("/health/ready")
+            assert response.status_code == 200, response.text
+
+asyncio.run(main())
+"""
+
+BOT_READY = "import bot"
+
+SERVICES = {
+    "backend": {"dir": ROOT / "backend", "module": "app", "ready": BACKEND_READY},
+    "bot": {"dir": ROOT / "bot", "module": "bot", "ready": BOT_READY}
+}
+
+
+def run_python(service: str, args: List[str]) -> subprocess.CompletedProcess:
+    config = SERVICES[service]
+    env = {**os.environ, **HARNESS_ENV, "PYTHONPATH": os.pathsep.join([str(config["dir"]), str(ROOT / "shared"), str(HARNESS_DIR)])}
+    result = subprocess.run([sys.executable, *args], cwd=config["dir"], env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(f"{service}: {' '.join(args[:2])} failed\n{result.stderr[-3000:]}")
+    return result
+
+
+# === Import time === #
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """Lines of `-X importtime` as (level, self_us, cumulative_us, module)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        head, cumulative, name = line.split("|", 2)
+        name = name[1:]
+        level = (len(name) - len(name.lstrip())) // 2
+        rows.append((level, int(head.split(":")[1]), int(cumulative), name.strip()))
+    return rows
+
+
+def import_profile(service: str, top: int) -> dict:
+    module = SERVICES[service]["module"]
+    rows = parse_importtime(run_python(service, ["-X", "importtime", "-c", f"import {module}"]).stderr)
+    # Children are printed before their parent: the service module is the last level-0 entry for it
+    index = max(i for i, row in enumerate(rows) if row[0] == 0 and row[3] == module)
+    total_us = rows[index][2]
+    direct = []
+    for level, _, cumulative, name in reversed(rows[:index]):
+        if level == 0:
+            break
+        if level == 1:
+            direct.append((cumulative, name))
+    return {
+        "total_ms": total_us / 1000,
+        "direct": sorted(direct, reverse=True)[:top],
+        "self": sorted(((row[1], row[3]) for row in rows), reverse=True)[:top]
+    }
+
+
+# === Cold start === #
+def cold_start(service: str, runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        run_python(service, ["-c", SERVICES[service]["ready"]])
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def render(profiles: Dict[str, dict], cold: Dict[str, List[float]], budget_ms: float) -> str:
+    lines = ["# Startup profile\n", f"Python {sys.version.split()[0]}, cold-start budget {budget_ms:.0f} ms\n"]
+    for service, profile in profiles.items():
+        samples = cold[service]
+        lines.append(f"## {service}\n")
+        lines.append(
+            f"- cold start to ready: median {statistics.median(samples):.0f} ms "
+            f"(min {min(samples):.0f}, max {max(samples):.0f}, {len(samples)} runs)"
+        )
+        lines.append(f"- `import {SERVICES[service]['module']}`: {profile['total_ms']:.0f} ms\n")
+        lines.append("| direct import | cumulative ms |\n| --- | ---: |")
+        lines.extend(f"| {name} | {us / 1000:.1f} |" for us, name in profile["direct"])
+        lines.append("\n| module | self ms |\n| --- | ---: |")
+        lines.extend(f"| {name} | {us / 1000:.1f} |" for us, name in profile["self"])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="cold starts per service")
+    parser.add_argument("--top", type=int, default=15, help="modules listed per table")
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument("--output", type=Path, help="also write the report to this file")
+    args = parser.parse_args()
+
+    profiles = {service: import_profile(service, args.top) for service in SERVICES}
+    cold = {service: cold_start(service, args.runs) for service in SERVICES}
+    report = render(profiles, cold, args.budget_ms)
+    print(report)
+    if args.output:
+        args.output.write_text(report)
+
+    over = [service for service, samples in cold.items() if statistics.median(samples) > args.budget_ms]
+    if over:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
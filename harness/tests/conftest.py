@@ -0,0 +1,44 @@
+"""
+Behaviour tests for the backend, run offline on the harness: the in-memory MongoDB
+stand-in (memory_mongo.py) behind the real FastAPI app, called through an ASGI transport.
+
+    cd harness && python -m pytest -q
+"""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import bench  # noqa: E402
+
+# Both services read part of their configuration at import time
+bench.configure()
+
+from memory_mongo import MemoryClient  # noqa: E402
+from database.mongo_config import MongoDB  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db():
+    """A fresh, empty in-memory database for each test."""
+    MongoDB.use_client(MemoryClient())
+    return MongoDB.get_db()
+
+
+@pytest.fixture
+async def api(db):
+    """HTTP client for the app, with its lifespan (warm-up, cache) run around the test."""
+    from app import app
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url=bench.BASE_URL, follow_redirects=True) as client:
+            yield client
@@ -0,0 +1,59 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_fact_lifecycle(api):
+    created = (await api.post("/facts/facts/", json={"content": "Passwords leak"})).json()
+    assert created["content"] == "Passwords leak"
+
+    assert (await api.get(f"/facts/facts/{created['id']}")).json() == created
+    assert [fact["id"] for fact in (await api.get("/facts/facts/")).json()] == [created["id"]]
+
+    updated = (await api.put(f"/facts/facts/{created['id']}", json={"content": "Passwords still leak"})).json()
+    assert updated == {"id": created["id"], "content": "Passwords still leak"}
+    # The read cache was invalidated by the write
+    assert (await api.get(f"/facts/facts/{created['id']}")).json()["content"] == "Passwords still leak"
+
+    assert (await api.delete(f"/facts/facts/{created['id']}")).json()["id"] == created["id"]
+    assert (await api.get(f"/facts/facts/{created['id']}")).status_code == 404
+    assert (await api.get("/facts/facts/")).json() == []
+
+
+async def test_update_needs_fields_and_an_existing_item(api):
+    created = (await api.post("/jokes/jokes/", json={"content": "There are 10 kinds of people"})).json()
+    assert (await api.put(f"/jokes/jokes/{created['id']}", json={})).status_code == 400
+    assert (await api.put("/jokes/jokes/000000000000000000000000", json={"content": "x"})).status_code == 404
+    assert (await api.delete("/jokes/jokes/not-an-id")).status_code == 404
+
+
+async def test_bulk_create(api):
+    response = (await api.post("/quotes/quotes/bulk", json=[{"content": "a"}, {"content": "b", "author": "B"}])).json()
+    assert response["inserted"] == 2
+    quotes = {quote["content"]: quote for quote in (await api.get("/quotes/quotes/")).json()}
+    assert quotes["a"]["author"] == "Unknown" and quotes["b"]["author"] == "B"
+
+
+async def test_events_are_updated_and_deleted_by_title(api):
+    event = {"title": "CTF night", "date": "2030-01-10 18:00", "description": "Bring a laptop", "location": "Lab 3"}
+    created = (await api.post("/events/events/", json=event)).json()
+    assert created["date"] == "2030-01-10T18:00:00"
+
+    updated = (await api.put("/events/events/CTF night", json={"date": "2030-01-10T20:00:00+01:00"})).json()
+    assert updated["id"] == created["id"] and updated["date"] == "2030-01-10T19:00:00"
+
+    assert (await api.post("/events/events/", json={**event, "date": "next friday"})).status_code == 422
+    assert (await api.delete("/events/events/CTF night")).status_code == 200
+    assert (await api.get("/events/events/")).json() == []
+
+
+async def test_writes_are_journaled(api):
+    head = (await api.get("/changes/", params={"since": 0})).json()["head"]
+    created = (await api.post("/facts/facts/", json={"content": "Patch early"})).json()
+    await api.delete(f"/facts/facts/{created['id']}")
+
+    page = (await api.get("/changes/", params={"since": head})).json()
+    assert [(change["op"], change["doc_id"]) for change in page["changes"]] == [
+        ("create", created["id"]), ("delete", created["id"])
+    ]
+    assert page["last_seq"] == page["head"] == head + 2
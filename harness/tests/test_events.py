@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def event(title: str, date: str) -> dict:
+    return {"title": title, "date": date, "description": "", "location": "Online"}
+
+
+async def test_upcoming_filter_handles_every_accepted_date_form(api):
+    now = datetime.now(timezone.utc)
+    in_two_hours = now + timedelta(hours=2)
+    plus_five = timezone(timedelta(hours=5))
+    events = [
+        # Typed by hand with a space: used to sort before "T" and vanish as past
+        event("later today", in_two_hours.strftime("%Y-%m-%d %H:%M")),
+        event("earlier today", (now - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M")),
+        # Offset applied: 10:00 at +05:00 three days from now is 05:00 UTC
+        event("with offset", (now + timedelta(days=3)).astimezone(plus_five).replace(hour=10, minute=0, second=0, microsecond=0).isoformat()),
+        event("tomorrow", (now + timedelta(days=1)).strftime("%Y-%m-%d")),
+        event("yesterday", (now - timedelta(days=1)).strftime("%Y-%m-%d")),
+        event("zulu", (now + timedelta(days=2)).strftime("%Y-%m-%dT%H:%M:%SZ")),
+    ]
+    for item in events:
+        assert (await api.post("/events/events/", json=item)).status_code == 200
+
+    upcoming = (await api.get("/events/events/", params={"upcoming": True})).json()
+    assert [item["title"] for item in upcoming] == ["later today", "tomorrow", "zulu", "with offset"]
+    assert upcoming[0]["date"] == in_two_hours.strftime("%Y-%m-%dT%H:%M:00")
+    assert upcoming[-1]["date"].endswith("T05:00:00")
+
+
+async def test_upcoming_events_page_through_in_date_order(api):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    for day in (3, 1, 2):
+        await api.post("/events/events/", json=event(f"day {day}", (start + timedelta(days=day)).strftime("%Y-%m-%d %H:%M")))
+
+    first = (await api.get("/events/events/", params={"upcoming": True, "limit": 2})).json()
+    second = (await api.get("/events/events/", params={"upcoming": True, "skip": 2, "limit": 2})).json()
+    assert [item["title"] for item in first + second] == ["day 1", "day 2", "day 3"]
+
+
+async def test_batch_reads_limit_upcoming_events_to_a_window(api):
+    now = datetime.now(timezone.utc)
+    await api.post("/events/events/", json=event("soon", (now + timedelta(days=2)).strftime("%Y-%m-%d %H:%M")))
+    await api.post("/events/events/", json=event("later", (now + timedelta(days=20)).strftime("%Y-%m-%d %H:%M")))
+
+    response = (await api.post("/batch", json={"resources": {"events": {"upcoming": True, "days": 7}}})).json()
+    assert [item["title"] for item in response["events"]] == ["soon"]
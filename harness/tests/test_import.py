@@ -0,0 +1,31 @@
+import pytest
+
+from database.journal import journal
+from database.mongo_config import QUOTES
+from import_content import write_chunk
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reimporting_unchanged_records_writes_and_journals_nothing(db):
+    library = [{"content": "Trust, but verify", "author": "A"}, {"content": "Least privilege", "author": "B"}]
+    assert await write_chunk(QUOTES, library) == (2, 0)
+    head = await journal.head()
+
+    assert await write_chunk(QUOTES, [dict(doc) for doc in library]) == (0, 0)
+    assert await journal.head() == head
+
+
+async def test_only_changed_records_are_updated_and_journaled(db):
+    assert await write_chunk(QUOTES, [{"content": "a", "author": "A"}, {"content": "b", "author": "B"}]) == (2, 0)
+    head = await journal.head()
+    stored = {doc["content"]: doc async for doc in db[QUOTES].find()}
+
+    assert await write_chunk(QUOTES, [{"content": "a", "author": "A"}, {"content": "b", "author": "Bee"}, {"content": "c", "author": "C"}]) == (1, 1)
+    page = await journal.feed(head, limit=10)
+    assert [(change["op"], change["doc"]["content"], change["doc"]["author"]) for change in page["changes"]] == [
+        ("create", "c", "C"), ("update", "b", "Bee")
+    ]
+    # The update entry carries the stored document's id, without a re-read after the write
+    assert page["changes"][1]["doc_id"] == str(stored["b"]["_id"])
+    assert await db[QUOTES].count_documents({}) == 3
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+EVENT = {"title": "Workshop", "date": "2030-03-01 17:00", "description": "Intro to pwn", "location": "Amphi A"}
+
+
+async def claim(api, consumer: str, **options) -> list:
+    response = await api.post("/outbox/claim", json={"consumer": consumer, "topics": ["events"], **options})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_event_changes_are_claimed_once_and_acked(api):
+    created = (await api.post("/events/events/", json=EVENT)).json()
+
+    messages = await claim(api, "host-a:1")
+    assert [(m["topic"], m["op"], m["doc"]["id"], m["attempts"], m["claimed_by"]) for m in messages] == [
+        ("events", "create", created["id"], 1, "host-a:1")
+    ]
+    # Leased to host-a:1: nobody else gets it meanwhile
+    assert await claim(api, "host-b:2") == []
+    assert (await api.get("/outbox/stats")).json() == {"due": 0, "leased": 1, "failed": 0}
+
+    assert (await api.post("/outbox/ack", json={"results": {messages[0]["id"]: "123"}})).json() == {"acked": 1}
+    # Acking again is harmless, and a delivered message is never handed out again
+    assert (await api.post("/outbox/ack", json={"results": {messages[0]["id"]: "123"}})).json() == {"acked": 0}
+    assert await claim(api, "host-b:2") == []
+    assert (await api.get("/outbox/stats")).json() == {"due": 0, "leased": 0, "failed": 0}
+
+
+async def test_expired_lease_is_handed_out_again(api, db):
+    await api.post("/events/events/", json=EVENT)
+    [first] = await claim(api, "host-a:1")
+
+    # host-a:1 died before acking: its lease runs out
+    await db["outbox"].update_many({}, {"$set": {"claimed_until": datetime.now(timezone.utc) - timedelta(seconds=1)}})
+    [again] = await claim(api, "host-b:2")
+    assert again["id"] == first["id"]
+    assert again["attempts"] == 2 and again["claimed_by"] == "host-b:2"
+
+
+async def test_failed_delivery_is_retried_after_a_backoff(api, db):
+    await api.post("/events/events/", json=EVENT)
+    await api.put("/events/events/Workshop", json={"location": "Online"})
+    messages = await claim(api, "host-a:1", limit=1)
+    assert [m["op"] for m in messages] == ["create"]
+
+    nacked = (await api.post(f"/outbox/{messages[0]['id']}/nack", json={"error": "channel not found"})).json()
+    assert nacked["attempts"] == 1 and nacked["retry"]
+    # The failed message waits for its backoff; the next one is claimable meanwhile
+    assert [m["op"] for m in await claim(api, "host-a:1")] == ["update"]
+
+    stored = await db["outbox"].find_one({"last_error": "channel not found"})
+    assert stored["available_at"] > datetime.now(timezone.utc)
+    assert (await api.post("/outbox/000000000000000000000000/nack", json={"error": "x"})).status_code == 404
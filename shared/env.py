@@ -0,0 +1,41 @@
+"""
+Environment parsing shared by the bot and the backend settings.
+
+Empty values (e.g. "PORT=" in .env) count as unset, and a malformed value fails with an
+error naming the variable instead of a bare ValueError from int().
+"""
+
+import os
+from typing import Optional
+
+
+def env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    return os.getenv(name, "").strip() or default
+
+
+def env_int(name: str, default: Optional[int] = None, minimum: Optional[int] = None) -> Optional[int]:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{value}'") from None
+    if minimum is not None and number < minimum:
+        raise ValueError(f"{name} must be at least {minimum}, got {number}")
+    return number
+
+
+def env_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got '{value}'") from None
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name, "").strip()
+    return value.lower() in ("1", "true", "yes") if value else default
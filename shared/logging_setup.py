@@ -0,0 +1,124 @@
+"""
+Logging setup shared by the bot and the backend.
+
+This is the only copy: both Docker images copy shared/ next to the service code, and local
+runs put it on the path (PYTHONPATH=../shared, see the README).
+
+Records are handed to a queue by the calling code and written to stdout by a background
+listener thread, so a slow terminal or log collector never blocks the event loop.
+Messages use lazy %-style arguments and are only formatted when the level is enabled.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from env import env_float, env_str
+
+# Fields bound to the current request / interaction, copied onto every record
+log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("log_context", default={})
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def bind(**fields) -> contextvars.Token:
+    """Attach fields (request_id, interaction_id, ...) to all records logged in this context."""
+    return log_context.set({**log_context.get(), **fields})
+
+
+def unbind(token: contextvars.Token):
+    log_context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the bound context onto the record (runs in the caller, where the context lives)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG records; higher levels always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including bound context and `extra=` fields."""
+
+    def __init__(self, service: str):
+        super().__init__()
+        self.service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "service": self.service,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        entry.update((k, v) for k, v in vars(record).items() if k not in _RESERVED)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def setup_logging(service: str, level: Optional[str] = None):
+    """
+    Route every logger through a QueueHandler. Call once per process (after forking);
+    LOG_LEVEL, LOG_FORMAT ("json" or "text") and LOG_DEBUG_SAMPLE_RATE tune it.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    level = (level or env_str("LOG_LEVEL", "INFO")).upper()
+    if env_str("LOG_FORMAT", "json").lower() == "json":
+        formatter = JsonFormatter(service)
+    else:
+        formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s", "%Y-%m-%d %H:%M:%S")
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(SamplingFilter(env_float("LOG_DEBUG_SAMPLE_RATE", 0.1)))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None